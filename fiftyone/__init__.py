@@ -23,13 +23,25 @@ import fiftyone.constants as _foc
 __version__ = _foc.VERSION
 
 from fiftyone.__public__ import *
+from fiftyone.__public__ import _LAZY_ATTRS, _get_lazy_attr
 
 import fiftyone.core.uid as _fou
 import fiftyone.core.logging as _fol
-import fiftyone.migrations as _fom
 
 _fol.init_logging()
 
+# Note that the database connection is not established here. It is established,
+# and the database is migrated if necessary, when the database is first used
+
 if _os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
-    _fom.migrate_database_if_necessary()
     _fou.log_import_if_allowed()
+
+
+def __getattr__(name):
+    value = _get_lazy_attr(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -5,15 +5,14 @@ FiftyOne's public interface.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import importlib as _importlib
+
 import fiftyone.core.config as _foc
-import fiftyone.core.odm as _foo
 
 config = _foc.load_config()
 annotation_config = _foc.load_annotation_config()
 app_config = _foc.load_app_config()
 
-_foo.establish_db_conn(config)
-
 from .core.aggregations import (
     Aggregation,
     Bounds,
@@ -129,22 +128,6 @@ from .core.odm import (
     KeypointSkeleton,
     SidebarGroupDocument,
 )
-from .core.plots import (
-    plot_confusion_matrix,
-    plot_pr_curve,
-    plot_pr_curves,
-    plot_roc_curve,
-    lines,
-    scatterplot,
-    location_scatterplot,
-    Plot,
-    ResponsivePlot,
-    InteractivePlot,
-    ViewPlot,
-    ViewGrid,
-    CategoricalHistogram,
-    NumericalHistogram,
-)
 from .core.sample import Sample
 from .core.stages import (
     Concat,
@@ -186,28 +169,48 @@ from .core.stages import (
     ToClips,
     ToFrames,
 )
-from .core.session import (
-    close_app,
-    launch_app,
-    Session,
-)
 from .core.utils import (
     pprint,
     pformat,
     ProgressBar,
 )
 from .core.view import DatasetView
-from .utils.eval.classification import (
-    evaluate_classifications,
-    ClassificationResults,
-    BinaryClassificationResults,
-)
-from .utils.eval.detection import (
-    evaluate_detections,
-    DetectionResults,
-)
-from .utils.eval.segmentation import (
-    evaluate_segmentations,
-    SegmentationResults,
-)
-from .utils.quickstart import quickstart
+
+# Public symbols of heavy subsystems, which are imported on first access so
+# that `import fiftyone` stays fast. See `fiftyone.__getattr__()`
+_LAZY_ATTRS = {
+    "plot_confusion_matrix": ".core.plots",
+    "plot_pr_curve": ".core.plots",
+    "plot_pr_curves": ".core.plots",
+    "plot_roc_curve": ".core.plots",
+    "lines": ".core.plots",
+    "scatterplot": ".core.plots",
+    "location_scatterplot": ".core.plots",
+    "Plot": ".core.plots",
+    "ResponsivePlot": ".core.plots",
+    "InteractivePlot": ".core.plots",
+    "ViewPlot": ".core.plots",
+    "ViewGrid": ".core.plots",
+    "CategoricalHistogram": ".core.plots",
+    "NumericalHistogram": ".core.plots",
+    "close_app": ".core.session",
+    "launch_app": ".core.session",
+    "Session": ".core.session",
+    "evaluate_classifications": ".utils.eval.classification",
+    "ClassificationResults": ".utils.eval.classification",
+    "BinaryClassificationResults": ".utils.eval.classification",
+    "evaluate_detections": ".utils.eval.detection",
+    "DetectionResults": ".utils.eval.detection",
+    "evaluate_segmentations": ".utils.eval.segmentation",
+    "SegmentationResults": ".utils.eval.segmentation",
+    "quickstart": ".utils.quickstart",
+}
+
+
+def _get_lazy_attr(name):
+    module_name = _LAZY_ATTRS.get(name, None)
+    if module_name is None:
+        raise AttributeError("module 'fiftyone' has no attribute '%s'" % name)
+
+    module = _importlib.import_module(module_name, package="fiftyone")
+    return getattr(module, name)
@@ -124,6 +124,14 @@ class Aggregation(object):
         """
         return False
 
+    @property
+    def _is_big_streamable(self):
+        """Whether the aggregation has big results that can be parsed directly
+        from a cursor, rather than requiring all result documents to be loaded
+        into memory first.
+        """
+        return False
+
     def to_mongo(self, sample_collection, context=None):
         """Returns the MongoDB aggregation pipeline for this aggregation.
 
@@ -2298,6 +2306,13 @@ class Values(Aggregation):
         unwind (False): whether to automatically unwind all recognized list
             fields (True) or unwind all list fields except the top-level sample
             field (-1)
+        as_arrays (False): whether to return the values as flat numpy arrays
+            rather than (nested) lists. If the values contain list fields, a
+            ``(values, offsets)`` tuple is returned, where ``offsets`` is a
+            list of int64 arrays, one per list level from outermost to
+            innermost, such that the elements of the ``i``th list at a given
+            level are ``offsets[level][i]:offsets[level][i + 1]`` of the next
+            level. ``None``-valued lists are treated as empty
     """
 
     def __init__(
@@ -2306,6 +2321,7 @@ class Values(Aggregation):
         expr=None,
         missing_value=None,
         unwind=False,
+        as_arrays=False,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -2313,13 +2329,16 @@ class Values(Aggregation):
         super().__init__(field_or_expr, expr=expr)
         self._missing_value = missing_value
         self._unwind = unwind
+        self._as_arrays = as_arrays
         self._allow_missing = _allow_missing
         self._big_result = _big_result
         self._raw = _raw
 
         self._field_type = None
+        self._field = None
         self._big_field = None
         self._num_list_fields = None
+        self._num_terminal_lists = None
 
     def _kwargs(self):
         return [
@@ -2327,6 +2346,7 @@ class Values(Aggregation):
             ["expr", self._expr],
             ["missing_value", self._missing_value],
             ["unwind", self._unwind],
+            ["as_arrays", self._as_arrays],
             ["_allow_missing", self._allow_missing],
             ["_big_result", self._big_result],
             ["_raw", self._raw],
@@ -2341,28 +2361,46 @@ class Values(Aggregation):
         return (
             self._big_result
             and not self._unwind
+            and not self._as_arrays
             and self._expr is None
             and self._field_name is not None
             and "[]" not in self._field_name
         )
 
+    @property
+    def _is_big_streamable(self):
+        return self._big_result and self._as_arrays
+
     def default_result(self):
         """Returns the default result for this aggregation.
 
         Returns:
-            ``[]``
+            ``[]``, or empty arrays when ``as_arrays`` is True
         """
+        if self._as_arrays:
+            return self._parse_arrays([])
+
         return []
 
     def parse_result(self, d):
         """Parses the output of :meth:`to_mongo`.
 
         Args:
-            d: the result dict
+            d: the result dict, or, when :meth:`_has_big_result` is True, the
+                iterable of result dicts
 
         Returns:
-            the list of field values
+            the list of field values, or the arrays described in
+            :class:`Values` when ``as_arrays`` is True
         """
+        if self._as_arrays:
+            if self._big_result:
+                values = (di[self._big_field] for di in d)
+            else:
+                values = d["values"]
+
+            return self._parse_arrays(values)
+
         if self._big_result:
             values = [di[self._big_field] for di in d]
         else:
@@ -2379,6 +2417,55 @@ class Values(Aggregation):
 
         return values
 
+    def _parse_arrays(self, values):
+        if self._field is not None and not self._raw:
+            fcn = self._field.to_python
+        else:
+            fcn = None
+
+        num_levels = (self._num_list_fields or 0) + (
+            self._num_terminal_lists or 0
+        )
+
+        offsets = [[0] for _ in range(num_levels)]
+        arrays = []
+        batch = []
+
+        for value in values:
+            chunk = [value]
+            for level_offsets in offsets:
+                _chunk = []
+                for v in chunk:
+                    if v:
+                        _chunk.extend(v)
+
+                    level_offsets.append(level_offsets[-1] + len(v or []))
+
+                chunk = _chunk
+
+            batch.extend(chunk)
+
+            # Convert to arrays in batches so that the values are never all
+            # stored as Python objects at the same time
+            if len(batch) >= _ARRAYS_BATCH_SIZE:
+                arrays.append(_to_array(batch, fcn))
+                batch = []
+
+        if batch or not arrays:
+            arrays.append(_to_array(batch, fcn))
+
+        if len(arrays) > 1:
+            array = np.concatenate(arrays)
+        else:
+            array = arrays[0]
+
+        if not offsets:
+            return array
+
+        offsets = [np.array(o, dtype=np.int64) for o in offsets]
+
+        return array, offsets
+
     def to_mongo(self, sample_collection, big_field="values", context=None):
         (
             path,
@@ -2399,6 +2486,30 @@ class Values(Aggregation):
         self._field = field
         self._num_list_fields = len(list_fields)
 
+        # Terminal list fields are not unwound when `unwind=False`, so we must
+        # count them separately in order to flatten them into arrays
+        num_terminal_lists = 0
+        if (
+            self._as_arrays
+            and self._unwind == False
+            and self._expr is None
+            and self._field_name is not None
+        ):
+            field_type = _get_field_type(
+                sample_collection, self._field_name, unwind=False
+            )
+            while isinstance(field_type, fof.ListField):
+                num_terminal_lists += 1
+                field_type = field_type.field
+
+            if num_terminal_lists > 0 and field is not None:
+                if type(field_type) in fof._PRIMITIVE_FIELDS:
+                    field_type = None
+
+                self._field = field_type
+
+        self._num_terminal_lists = num_terminal_lists
+
         pipeline.extend(
             _make_extract_values_pipeline(
                 path,
@@ -2442,6 +2553,16 @@ _MONGO_TO_FIFTYONE_TYPES = {
 }
 
 
+_ARRAYS_BATCH_SIZE = 100000
+
+
+def _to_array(values, fcn):
+    if fcn is not None:
+        values = [fcn(v) if v is not None else None for v in values]
+
+    return np.array(values)
+
+
 def _transform_values(values, fcn, level=1):
     if values is None:
         return None
@@ -2671,7 +2671,7 @@ class ComputeMetadataCommand(Command):
             default=None,
             type=int,
             help=(
-                "the number of worker processes to use. The default is "
+                "the number of worker threads to use. The default is "
                 "`multiprocessing.cpu_count()`"
             ),
         )
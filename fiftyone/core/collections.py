@@ -5,11 +5,14 @@ Interface for sample collections.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
+from collections import defaultdict, deque
+import contextlib
 from copy import copy
 import fnmatch
 import itertools
 import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import numbers
 import os
 import random
@@ -19,6 +22,7 @@ import warnings
 
 from bson import ObjectId
 from pymongo import InsertOne, UpdateOne, UpdateMany
+from pymongo.errors import CursorNotFound
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -35,6 +39,7 @@ import fiftyone.core.media as fom
 import fiftyone.core.metadata as fomt
 import fiftyone.core.models as fomo
 import fiftyone.core.odm as foo
+import fiftyone.core.odm.database as food
 import fiftyone.core.sample as fosa
 import fiftyone.core.utils as fou
 
@@ -790,6 +795,153 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement iter_samples()")
 
+    def iter_samples_sharded(
+        self,
+        num_workers=None,
+        shard_size=1000,
+        use_processes=False,
+        raw=False,
+        progress=False,
+    ):
+        """Returns an iterator over the samples in the collection that reads
+        contiguous ``_id`` ranges of the collection in parallel.
+
+        The collection is partitioned into shards of roughly ``shard_size``
+        samples by ``_id``, and up to ``num_workers`` shards are read
+        concurrently, each via its own database cursor. Samples are emitted
+        in ascending ``_id`` order, which may differ from the order of
+        :meth:`iter_samples`.
+
+        If a shard's cursor times out, it is resumed after the last ``_id``
+        that it read, so samples are never skipped or repeated, even if
+        samples are added to or deleted from the collection during iteration.
+
+        At most ``2 * num_workers`` shards are buffered in memory at any time.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            for sample in dataset.iter_samples_sharded(
+                num_workers=4, progress=True
+            ):
+                print(sample.filepath)
+
+            # Read raw sample dicts in worker processes
+            for d in dataset.iter_samples_sharded(
+                num_workers=4, use_processes=True, raw=True
+            ):
+                print(d["filepath"])
+
+        Args:
+            num_workers (None): the number of shards to read concurrently. By
+                default, ``multiprocessing.cpu_count()`` is used
+            shard_size (1000): the approximate number of samples in each shard
+            use_processes (False): whether to read shards in worker processes
+                rather than in threads of the current process. Only datasets
+                and views into them support this; other collections, such as
+                patches views, always use threads
+            raw (False): whether to emit the raw sample dicts read from the
+                database rather than sample instances
+            progress (False): whether to render a progress bar tracking the
+                iterator's progress
+
+        Returns:
+            an iterator over :class:`fiftyone.core.sample.Sample` or
+            :class:`fiftyone.core.sample.SampleView` instances, or sample
+            dicts if ``raw`` is True
+        """
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+
+        if use_processes and self._is_generated:
+            logger.warning(
+                "Reading shards in worker processes is not supported for "
+                "collections of type %s; using threads instead",
+                type(self),
+            )
+            use_processes = False
+
+        if use_processes:
+            samples = (
+                self._dataset.name,
+                self.view()._serialize(),
+                self.group_slice,
+            )
+        else:
+            samples = self
+
+        num_samples = len(self)
+        id_ranges = self._get_id_ranges(num_samples, shard_size)
+        args = [(samples,) + id_range for id_range in id_ranges]
+
+        if raw:
+            make_sample = None
+        else:
+            make_sample = self._make_sample_fcn()
+
+        with contextlib.ExitStack() as exit_context:
+            if progress:
+                pb = fou.ProgressBar(total=num_samples)
+                exit_context.enter_context(pb)
+
+            if use_processes:
+                pool = fou.get_multiprocessing_context().Pool(
+                    processes=num_workers, initializer=_init_shard_worker
+                )
+                exit_context.enter_context(pool)
+                shards = _iter_shards(pool, args, 2 * num_workers)
+            elif num_workers > 1:
+                pool = ThreadPool(processes=num_workers)
+                exit_context.enter_context(pool)
+                shards = _iter_shards(pool, args, 2 * num_workers)
+            else:
+                shards = map(_read_id_range, args)
+
+            for docs in shards:
+                if progress:
+                    pb.update(len(docs))
+
+                for d in docs:
+                    if raw:
+                        yield d
+                    else:
+                        yield make_sample(d)
+
+    def _get_id_ranges(self, num_samples, shard_size):
+        num_shards = -(-num_samples // shard_size)
+        if num_shards == 0:
+            return []
+
+        pipeline = [
+            {"$bucketAuto": {"groupBy": "$_id", "buckets": num_shards}}
+        ]
+        buckets = list(self._aggregate(pipeline=pipeline))
+
+        # Bucket upper bounds are exclusive, except for the last bucket
+        id_ranges = []
+        for idx, bucket in enumerate(buckets):
+            inclusive = idx == len(buckets) - 1
+            id_ranges.append(
+                (bucket["_id"]["min"], bucket["_id"]["max"], inclusive)
+            )
+
+        return id_ranges
+
+    def _make_sample_fcn(self):
+        """Returns a function that converts sample dicts read from this
+        collection into sample instances.
+
+        Returns:
+            a function that accepts a sample dict and returns a
+            :class:`fiftyone.core.sample.Sample` or
+            :class:`fiftyone.core.sample.SampleView`
+        """
+        raise NotImplementedError("Subclass must implement _make_sample_fcn()")
+
     def iter_groups(self, progress=False, autosave=False, batch_size=None):
         """Returns an iterator over the groups in the collection.
 
@@ -2191,8 +2343,8 @@ class SampleCollection(object):
 
         Args:
             overwrite (False): whether to overwrite existing metadata
-            num_workers (None): the number of processes to use. By default,
-                ``multiprocessing.cpu_count()`` is used
+            num_workers (None): the number of worker threads to use. By
+                default, ``multiprocessing.cpu_count()`` is used
             skip_failures (True): whether to gracefully continue without
                 raising an error if metadata cannot be computed for a sample
         """
@@ -2214,6 +2366,8 @@ class SampleCollection(object):
         skip_failures=True,
         output_dir=None,
         rel_dir=None,
+        prefetch_factor=None,
+        image_cache=None,
         **kwargs,
     ):
         """Applies the :class:`FiftyOne model <fiftyone.core.models.Model>` or
@@ -2262,6 +2416,12 @@ class SampleCollection(object):
                 subdirectories in ``output_dir`` that match the shape of the
                 input paths. The path is converted to an absolute path (if
                 necessary) via :func:`fiftyone.core.utils.normalize_path`
+            prefetch_factor (None): the number of batches that each
+                :class:`torch:torch.utils.data.DataLoader` worker loads in
+                advance. Only applicable for Torch-based models
+            image_cache (None): an optional
+                :class:`fiftyone.utils.image.ImageCache` from which to load
+                the images. Only applicable to image collections
             **kwargs: optional model-specific keyword arguments passed through
                 to the underlying inference implementation
         """
@@ -2276,6 +2436,8 @@ class SampleCollection(object):
             skip_failures=skip_failures,
             output_dir=output_dir,
             rel_dir=rel_dir,
+            prefetch_factor=prefetch_factor,
+            image_cache=image_cache,
             **kwargs,
         )
 
@@ -2283,9 +2445,13 @@ class SampleCollection(object):
         self,
         model,
         embeddings_field=None,
+        embeddings_path=None,
+        embeddings_dtype=None,
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        prefetch_factor=None,
+        image_cache=None,
         **kwargs,
     ):
         """Computes embeddings for the samples in the collection using the
@@ -2308,7 +2474,11 @@ class SampleCollection(object):
         :meth:`fiftyone.core.models.Model.has_embeddings` must return ``True``.
 
         If an ``embeddings_field`` is provided, the embeddings are saved to the
-        samples; otherwise, the embeddings are returned in-memory.
+        samples. If an ``embeddings_path`` is provided, the embeddings are
+        streamed to a ``.npy`` file on disk as they are computed and returned
+        as a read-only memory-mapped array, so the embeddings of arbitrarily
+        large collections can be computed with bounded memory. Otherwise, the
+        embeddings are returned in-memory.
 
         Args:
             model: a :class:`fiftyone.core.models.Model` or
@@ -2316,6 +2486,18 @@ class SampleCollection(object):
             embeddings_field (None): the name of a field in which to store the
                 embeddings. When computing video frame embeddings, the
                 "frames." prefix is optional
+            embeddings_path (None): the path to a ``.npy`` file in which to
+                store the embeddings. The IDs of the corresponding samples are
+                written to a sidecar file, and both can be loaded via
+                :func:`fiftyone.core.models.load_embeddings`. Rows of samples
+                for which embeddings could not be computed are filled with
+                ``nan``. Only applicable when computing one embedding per
+                sample with a :class:`fiftyone.core.models.Model`
+            embeddings_dtype (None): an optional floating point numpy dtype,
+                such as ``"float16"`` or ``"float32"``, in which to store the
+                embeddings in ``embeddings_path``. By default, the dtype of
+                the model's embeddings is used, promoted to a floating point
+                type if necessary
             batch_size (None): an optional batch size to use, if the model
                 supports batching
             num_workers (None): the number of workers for the
@@ -2325,6 +2507,12 @@ class SampleCollection(object):
                 raising an error if embeddings cannot be generated for a
                 sample. Only applicable to :class:`fiftyone.core.models.Model`
                 instances
+            prefetch_factor (None): the number of batches that each
+                :class:`torch:torch.utils.data.DataLoader` worker loads in
+                advance. Only applicable for Torch-based models
+            image_cache (None): an optional
+                :class:`fiftyone.utils.image.ImageCache` from which to load
+                the images. Only applicable to image collections
             **kwargs: optional model-specific keyword arguments passed through
                 to the underlying inference implementation
 
@@ -2332,6 +2520,8 @@ class SampleCollection(object):
             one of the following:
 
             -   ``None``, if an ``embeddings_field`` is provided
+            -   a ``num_samples x num_dim`` memory-mapped array of embeddings,
+                if an ``embeddings_path`` is provided
             -   a ``num_samples x num_dim`` array of embeddings, when computing
                 embeddings for image/video collections with image/video models,
                 respectively, and no ``embeddings_field`` is provided. If
@@ -2351,9 +2541,13 @@ class SampleCollection(object):
             self,
             model,
             embeddings_field=embeddings_field,
+            embeddings_path=embeddings_path,
+            embeddings_dtype=embeddings_dtype,
             batch_size=batch_size,
             num_workers=num_workers,
             skip_failures=skip_failures,
+            prefetch_factor=prefetch_factor,
+            image_cache=image_cache,
             **kwargs,
         )
 
@@ -2368,6 +2562,7 @@ class SampleCollection(object):
         batch_size=None,
         num_workers=None,
         skip_failures=True,
+        image_cache=None,
     ):
         """Computes embeddings for the image patches defined by
         ``patches_field`` of the samples in the collection using the given
@@ -2420,6 +2615,9 @@ class SampleCollection(object):
                 applicable for Torch-based models
             skip_failures (True): whether to gracefully continue without
                 raising an error if embeddings cannot be generated for a sample
+            image_cache (None): an optional
+                :class:`fiftyone.utils.image.ImageCache` from which to load
+                the images. Only applicable to image collections
 
         Returns:
             one of the following:
@@ -2450,6 +2648,7 @@ class SampleCollection(object):
             alpha=alpha,
             handle_missing=handle_missing,
             skip_failures=skip_failures,
+            image_cache=image_cache,
         )
 
     def evaluate_regressions(
@@ -2594,6 +2793,8 @@ class SampleCollection(object):
         use_boxes=False,
         classwise=True,
         dynamic=True,
+        num_workers=None,
+        incremental=False,
         **kwargs,
     ):
         """Evaluates the specified predicted detections in this collection with
@@ -2680,6 +2881,16 @@ class SampleCollection(object):
                 label (True) or allow matches between classes (False)
             dynamic (True): whether to declare the dynamic object-level
                 attributes that are populated on the dataset's schema
+            num_workers (None): an optional number of processes to use. If
+                provided, the samples are split into shards of contiguous
+                sample IDs that are evaluated in parallel. By default,
+                evaluation is performed in the main process
+            incremental (False): whether to only evaluate samples whose ground
+                truth or predicted objects have changed since the last
+                evaluation with the same ``eval_key`` and configuration,
+                reusing the stored results of the unchanged samples. The
+                content fingerprint of each sample is recorded in a
+                ``<eval_key>_fingerprint`` field
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.detection.DetectionEvaluationConfig`
                 being used
@@ -2700,6 +2911,8 @@ class SampleCollection(object):
             use_boxes=use_boxes,
             classwise=classwise,
             dynamic=dynamic,
+            num_workers=num_workers,
+            incremental=incremental,
             **kwargs,
         )
 
@@ -2710,6 +2923,7 @@ class SampleCollection(object):
         eval_key=None,
         mask_targets=None,
         method="simple",
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified semantic segmentation masks in this
@@ -2758,6 +2972,10 @@ class SampleCollection(object):
                 provided, the observed pixel values are used
             method ("simple"): a string specifying the evaluation method to
                 use. Supported values are ``("simple")``
+            num_workers (None): an optional number of processes to use. If
+                provided, the samples are split into shards of contiguous
+                sample IDs that are evaluated in parallel. By default,
+                evaluation is performed in the main process
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.segmentation.SegmentationEvaluationConfig`
                 being used
@@ -2772,6 +2990,7 @@ class SampleCollection(object):
             eval_key=eval_key,
             mask_targets=mask_targets,
             method=method,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -5534,7 +5753,7 @@ class SampleCollection(object):
         )
 
     @view_stage
-    def take(self, size, seed=None):
+    def take(self, size, seed=None, fast=False):
         """Randomly samples the given number of samples from the collection.
 
         Examples::
@@ -5575,16 +5794,32 @@ class SampleCollection(object):
 
             view = dataset.take(2, seed=51)
 
+            #
+            # Take two random samples using an index rather than sorting the
+            # entire dataset
+            #
+
+            view = dataset.take(2, fast=True)
+
         Args:
             size: the number of samples to return. If a non-positive number is
                 provided, an empty view is returned
             seed (None): an optional random seed to use when selecting the
                 samples
+            fast (False): whether to select the samples via an index on the
+                samples' random keys rather than sorting the entire
+                collection. In this mode, the cost of the stage is
+                proportional to ``size``, but the samples are a contiguous run
+                of the collection's fixed random order starting at a random
+                position, so samples that are adjacent in this order are
+                always selected together. The index is created the first time
+                this mode is used. Collections with frame fields or groups
+                always use the exact method
 
         Returns:
             a :class:`fiftyone.core.view.DatasetView`
         """
-        return self._add_view_stage(fos.Take(size, seed=seed))
+        return self._add_view_stage(fos.Take(size, seed=seed, fast=fast))
 
     @view_stage
     def to_patches(self, field, **kwargs):
@@ -5948,6 +6183,12 @@ class SampleCollection(object):
             force_sample (False): whether to resample videos whose sampled
                 frames already exist. Only applicable when
                 ``sample_frames=True``
+            num_workers (None): the number of worker processes to use when
+                sampling frames. By default, videos are sampled serially.
+                Only applicable when ``sample_frames=True``
+            timeout (None): an optional timeout, in seconds, after which
+                sampling a video is aborted and treated as a failure. Only
+                applicable when ``sample_frames=True``
             skip_failures (True): whether to gracefully continue without
                 raising an error if a video cannot be sampled
             verbose (False): whether to log information about the frames that
@@ -6884,6 +7125,7 @@ class SampleCollection(object):
         expr=None,
         missing_value=None,
         unwind=False,
+        as_arrays=False,
         _allow_missing=False,
         _big_result=True,
         _raw=False,
@@ -6973,6 +7215,16 @@ class SampleCollection(object):
             # list of lists of detection labels
             labels = dataset.values("ground_truth.detections.label")
 
+            #
+            # Get flat arrays of detection confidences
+            #
+
+            # `confs[offsets[0][i]:offsets[0][i + 1]]` are the confidences of
+            # the `i`th sample
+            confs, offsets = dataset.values(
+                "predictions.detections.confidence", as_arrays=True
+            )
+
         Args:
             field_or_expr: a field name, ``embedded.field.name``,
                 :class:`fiftyone.core.expressions.ViewExpression`, or
@@ -6990,15 +7242,25 @@ class SampleCollection(object):
             unwind (False): whether to automatically unwind all recognized list
                 fields (True) or unwind all list fields except the top-level
                 sample field (-1)
+            as_arrays (False): whether to return the values as flat numpy
+                arrays rather than (nested) lists. If the values contain list
+                fields, a ``(values, offsets)`` tuple is returned, where
+                ``offsets`` is a list of int64 arrays, one per list level from
+                outermost to innermost, such that the elements of the ``i``th
+                list at a given level are
+                ``offsets[level][i]:offsets[level][i + 1]`` of the next level.
+                ``None``-valued lists are treated as empty
 
         Returns:
-            the list of values
+            the list of values, or the arrays described above when
+            ``as_arrays`` is True
         """
         make = lambda field_or_expr: foa.Values(
             field_or_expr,
             expr=expr,
             missing_value=missing_value,
             unwind=unwind,
+            as_arrays=as_arrays,
             _allow_missing=_allow_missing,
             _big_result=_big_result,
             _raw=_raw,
@@ -7218,6 +7480,8 @@ class SampleCollection(object):
                 -   ``"move"``: move all media files into the output directory
                 -   ``"symlink"``: create symlinks to the media files in the
                     output directory
+                -   ``"hardlink"``: create hard links to the media files in the
+                    output directory
                 -   ``"manifest"``: create a ``data.json`` in the output
                     directory that maps UUIDs used in the labels files to the
                     filepaths of the source media, rather than exporting the
@@ -8097,8 +8361,12 @@ class SampleCollection(object):
 
         # Parse big results
         for idx, aggregation in big_aggs.items():
-            result = list(_results[idx_map[idx]])
-            results[idx] = self._parse_big_result(aggregation, result)
+            result = _results[idx_map[idx]]
+            if aggregation._is_big_streamable:
+                results[idx] = aggregation.parse_result(result)
+            else:
+                result = list(result)
+                results[idx] = self._parse_big_result(aggregation, result)
 
         # Parse facet-able results
         for idx, aggregation in compiled_facet_aggs.items():
@@ -9583,6 +9851,58 @@ def _get_random_characters(n):
     )
 
 
+def _iter_shards(pool, args, max_pending):
+    pending = deque()
+    for _args in args:
+        pending.append(pool.apply_async(_read_id_range, (_args,)))
+        if len(pending) >= max_pending:
+            yield pending.popleft().get()
+
+    while pending:
+        yield pending.popleft().get()
+
+
+def _init_shard_worker():
+    # Database clients cannot be shared with the parent process
+    food._disconnect()
+
+
+def _read_id_range(args):
+    samples, min_id, max_id, inclusive = args
+
+    if isinstance(samples, tuple):
+        dataset_name, stages, group_slice = samples
+        samples = fov.DatasetView._build(
+            fod.load_dataset(dataset_name), stages
+        )
+        if group_slice is not None:
+            samples.group_slice = group_slice
+
+    id_range = {"$gte": min_id}
+    if inclusive:
+        id_range["$lte"] = max_id
+    else:
+        id_range["$lt"] = max_id
+
+    docs = []
+    while True:
+        pipeline = [{"$match": {"_id": id_range}}, {"$sort": {"_id": 1}}]
+
+        try:
+            for d in samples._aggregate(
+                pipeline=pipeline, detach_frames=True, detach_groups=True
+            ):
+                docs.append(d)
+
+            return docs
+        except CursorNotFound:
+            # The cursor has timed out so we read from a new one that starts
+            # after the last ID that we read
+            if docs:
+                id_range.pop("$gte", None)
+                id_range["$gt"] = docs[-1]["_id"]
+
+
 def _get_non_none_value(values, level=1):
     for value in values:
         if value is None:
@@ -5,17 +5,19 @@ FiftyOne datasets.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
+from collections import defaultdict, deque
 import contextlib
 from copy import deepcopy
 from datetime import datetime
 import fnmatch
 import itertools
 import logging
+from multiprocessing.pool import ThreadPool
 import numbers
 import os
 import random
 import string
+import timeit
 
 from bson import ObjectId
 from deprecated import deprecated
@@ -55,6 +57,11 @@ foud = fou.lazy_import("fiftyone.utils.data")
 logger = logging.getLogger(__name__)
 
 
+# Number of samples whose existing counterparts are fetched via a single query
+# when merging samples with a `key_fcn`
+_MERGE_BATCH_SIZE = 1000
+
+
 def list_datasets(info=False):
     """Lists the available FiftyOne datasets.
 
@@ -2167,6 +2174,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         dynamic=False,
         validate=True,
         num_samples=None,
+        num_workers=None,
     ):
         """Adds the given samples to the dataset.
 
@@ -2174,6 +2182,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         in-place to reflect membership in this dataset. Any sample instances
         that belong to other datasets are not modified.
 
+        When ``num_workers`` is provided, ingestion is pipelined: each batch of
+        samples is serialized in the calling thread while previous batches are
+        being inserted into the database by a pool of writer threads. In this
+        mode, the returned IDs are in the same order as ``samples``, but the
+        natural order of the samples in the dataset is not guaranteed to match
+        the input order.
+
         Args:
             samples: an iterable of :class:`fiftyone.core.sample.Sample`
                 instances or a
@@ -2188,6 +2203,10 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             num_samples (None): the number of samples in ``samples``. If not
                 provided, this is computed via ``len(samples)``, if possible.
                 This value is optional and is used only for progress tracking
+            num_workers (None): an optional number of threads to use to insert
+                batches into the database concurrently with the serialization
+                of subsequent batches. By default, each batch is serialized and
+                inserted serially
 
         Returns:
             a list of IDs of the samples in the dataset
@@ -2209,6 +2228,11 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             total=num_samples,
         )
 
+        if num_workers is not None and num_workers > 0:
+            return self._add_samples_pipelined(
+                batcher, expand_schema, dynamic, validate, num_workers
+            )
+
         sample_ids = []
         with batcher:
             for batch in batcher:
@@ -2219,6 +2243,42 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         return sample_ids
 
+    def _add_samples_pipelined(
+        self, batcher, expand_schema, dynamic, validate, num_workers
+    ):
+        # Bound the number of batches that may be in-flight at any time so
+        # that memory usage does not grow if the database falls behind
+        max_pending = 2 * num_workers
+
+        sample_ids = []
+        pending = deque()
+
+        def _finalize_next():
+            samples, dicts, result = pending.popleft()
+            result.get()  # raises any insertion errors
+            _ids = self._finalize_samples_batch(samples, dicts)
+            sample_ids.extend(_ids)
+
+        with ThreadPool(processes=num_workers) as pool:
+            with batcher:
+                for batch in batcher:
+                    samples, dicts = self._prepare_samples_batch(
+                        batch, expand_schema, dynamic, validate
+                    )
+
+                    result = pool.apply_async(
+                        self._insert_sample_dicts, (dicts,)
+                    )
+                    pending.append((samples, dicts, result))
+
+                    while len(pending) >= max_pending:
+                        _finalize_next()
+
+                while pending:
+                    _finalize_next()
+
+        return sample_ids
+
     def add_collection(
         self,
         sample_collection,
@@ -2267,6 +2327,15 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         return self.skip(num_samples).values("id")
 
     def _add_samples_batch(self, samples, expand_schema, dynamic, validate):
+        samples, dicts = self._prepare_samples_batch(
+            samples, expand_schema, dynamic, validate
+        )
+        self._insert_sample_dicts(dicts)
+        return self._finalize_samples_batch(samples, dicts)
+
+    def _prepare_samples_batch(
+        self, samples, expand_schema, dynamic, validate
+    ):
         samples = [s.copy() if s._in_db else s for s in samples]
 
         if self.media_type is None and samples:
@@ -2280,6 +2349,12 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         dicts = [self._make_dict(sample) for sample in samples]
 
+        return samples, dicts
+
+    def _insert_sample_dicts(self, dicts):
+        if not dicts:
+            return
+
         try:
             # adds `_id` to each dict
             self._sample_collection.insert_many(dicts)
@@ -2287,14 +2362,70 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             msg = bwe.details["writeErrors"][0]["errmsg"]
             raise ValueError(msg) from bwe
 
+    def _finalize_samples_batch(self, samples, dicts):
+        video_samples = []
         for sample, d in zip(samples, dicts):
             doc = self._sample_dict_to_doc(d)
             sample._set_backing_doc(doc, dataset=self)
             if sample.media_type == fom.VIDEO:
-                sample.frames.save()
+                video_samples.append(sample)
+
+        if video_samples:
+            self._insert_frames_batch(video_samples)
 
         return [str(d["_id"]) for d in dicts]
 
+    def _insert_frames_batch(self, samples):
+        # The samples have just been inserted, so all of their frames are new
+        # and can be written via a few large unordered inserts rather than
+        # one bulk write per video
+        start_time = timeit.default_timer()
+
+        frames = []
+        dicts = []
+        for sample in samples:
+            replacements = sample.frames._replacements
+            if not replacements:
+                continue
+
+            sample.frames._validate_frames(replacements)
+
+            for frame in replacements.values():
+                frames.append(frame)
+                dicts.append(sample.frames._make_dict(frame))
+
+        if not dicts:
+            return
+
+        try:
+            # 100000 is the mongodb limit
+            for dicts_batch in fou.iter_batches(dicts, 100000):
+                # adds `_id` to each dict
+                self._frame_collection.insert_many(
+                    list(dicts_batch), ordered=False
+                )
+        except BulkWriteError as bwe:
+            msg = bwe.details["writeErrors"][0]["errmsg"]
+            raise ValueError(msg) from bwe
+
+        for frame, d in zip(frames, dicts):
+            if isinstance(frame._doc, foo.NoDatasetFrameDocument):
+                doc = self._frame_dict_to_doc(d)
+                frame._set_backing_doc(doc, dataset=self)
+            else:
+                frame._doc.id = d["_id"]
+
+        for sample in samples:
+            sample.frames._replacements.clear()
+
+        elapsed = timeit.default_timer() - start_time
+        logger.debug(
+            "Inserted %d frames for %d videos (%.1f frames/sec)",
+            len(dicts),
+            len(samples),
+            len(dicts) / max(elapsed, 1e-6),
+        )
+
     def _upsert_samples(
         self,
         samples,
@@ -6827,30 +6958,55 @@ def _make_merge_samples_generator(
                 f for f in insert_omit_fields if f != "filepath"
             ]
 
-    for sample in samples:
-        key = key_fcn(sample)
-        if key in id_map:
-            if not skip_existing:
-                existing_sample = dataset[id_map[key]]
-                existing_sample.merge(
-                    sample,
-                    fields=fields,
-                    omit_fields=omit_fields,
-                    merge_lists=merge_lists,
-                    overwrite=overwrite,
-                    expand_schema=expand_schema,
-                )
+    for batch in fou.iter_batches(samples, _MERGE_BATCH_SIZE):
+        keys = [key_fcn(sample) for sample in batch]
 
-                yield existing_sample
-        elif insert_new:
-            if insert_fields is not None or insert_omit_fields is not None:
-                sample = sample.copy(
-                    fields=insert_fields, omit_fields=insert_omit_fields
-                )
-            elif sample._in_db:
-                sample = sample.copy()
+        # Fetch the existing samples for the entire batch in a single query
+        if not skip_existing:
+            existing_samples = _get_samples_by_id(
+                dataset, {id_map[key] for key in keys if key in id_map}
+            )
+
+        for sample, key in zip(batch, keys):
+            if key in id_map:
+                if not skip_existing:
+                    existing_sample = existing_samples[id_map[key]]
+                    existing_sample.merge(
+                        sample,
+                        fields=fields,
+                        omit_fields=omit_fields,
+                        merge_lists=merge_lists,
+                        overwrite=overwrite,
+                        expand_schema=expand_schema,
+                    )
+
+                    yield existing_sample
+            elif insert_new:
+                if insert_fields is not None or insert_omit_fields is not None:
+                    sample = sample.copy(
+                        fields=insert_fields, omit_fields=insert_omit_fields
+                    )
+                elif sample._in_db:
+                    sample = sample.copy()
+
+                yield sample
+
+
+def _get_samples_by_id(dataset, sample_ids):
+    samples = {}
+    if not sample_ids:
+        return samples
+
+    query = {"_id": {"$in": list(sample_ids)}}
+    for d in dataset._sample_collection.find(query):
+        doc = dataset._sample_dict_to_doc(d)
+        samples[d["_id"]] = fos.Sample.from_doc(doc, dataset=dataset)
+
+    missing_ids = set(sample_ids) - set(samples.keys())
+    if missing_ids:
+        raise KeyError("No sample found with ID '%s'" % missing_ids.pop())
 
-            yield sample
+    return samples
 
 
 def _merge_samples_pipeline(
@@ -980,9 +980,10 @@ class VectorField(mongoengine.fields.BinaryField, Field):
     """A one-dimensional array field.
 
     :class:`VectorField` instances accept numeric lists, tuples, and 1D numpy
-    array values. The underlying data is serialized and stored in the database
-    as zlib-compressed bytes generated by ``numpy.save`` and always retrieved
-    as a numpy array.
+    array values. The underlying data is stored in the database as raw bytes
+    with a compact header generated by
+    :func:`fiftyone.core.utils.encode_numpy_array` and always retrieved as a
+    numpy array.
 
     Args:
         description (None): an optional description
@@ -998,7 +999,7 @@ class VectorField(mongoengine.fields.BinaryField, Field):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.encode_numpy_array(value, compression=None)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -1025,8 +1026,9 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
     """An n-dimensional array field.
 
     :class:`ArrayField` instances accept numpy array values. The underlying
-    data is serialized and stored in the database as zlib-compressed bytes
-    generated by ``numpy.save`` and always retrieved as a numpy array.
+    data is stored in the database as zlib-compressed bytes with a compact
+    header generated by :func:`fiftyone.core.utils.encode_numpy_array` and
+    always retrieved as a numpy array.
 
     Args:
         description (None): an optional description
@@ -1042,7 +1044,7 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
         if value is None:
             return None
 
-        bytes = fou.serialize_numpy_array(value)
+        bytes = fou.encode_numpy_array(value)
         return super().to_mongo(bytes)
 
     def to_python(self, value):
@@ -8,6 +8,7 @@ Metadata stored in dataset samples.
 import itertools
 import logging
 import multiprocessing
+from multiprocessing.pool import ThreadPool
 import os
 import requests
 
@@ -24,6 +25,11 @@ import fiftyone.core.utils as fou
 
 logger = logging.getLogger(__name__)
 
+_SAVE_BATCH_SIZE = 1000
+
+# Number of samples whose metadata is computed per worker thread in each batch
+_BATCH_SIZE_PER_WORKER = 16
+
 
 class Metadata(DynamicEmbeddedDocument):
     """Base class for storing metadata about generic samples.
@@ -236,11 +242,16 @@ def compute_metadata(
     Any samples with existing metadata are skipped, unless
     ``overwrite == True``.
 
+    Metadata is computed by a pool of worker threads that only read the
+    headers of the media files, and the results are written to the database
+    in batches as they are computed. If the computation is interrupted, calling
+    this method again will resume where it left off.
+
     Args:
         sample_collection: a
             :class:`fiftyone.core.collections.SampleCollection`
         overwrite (False): whether to overwrite existing metadata
-        num_workers (None): the number of processes to use. By default,
+        num_workers (None): the number of worker threads to use. By default,
             ``multiprocessing.cpu_count()`` is used
         skip_failures (True): whether to gracefully continue without raising an
             error if metadata cannot be computed for a sample
@@ -253,14 +264,7 @@ def compute_metadata(
             _allow_mixed=True
         )
 
-    if num_workers <= 1:
-        _compute_metadata(sample_collection, overwrite=overwrite)
-    else:
-        _compute_metadata_multi(
-            sample_collection,
-            num_workers,
-            overwrite=overwrite,
-        )
+    _compute_metadata(sample_collection, num_workers, overwrite=overwrite)
 
     num_missing = len(sample_collection.exists("metadata", False))
     if num_missing > 0:
@@ -289,7 +293,9 @@ def get_image_info(f):
     return (img.width, img.height, len(img.getbands()))
 
 
-def _compute_metadata(sample_collection, overwrite=False):
+def _compute_metadata(sample_collection, num_workers, overwrite=False):
+    # Samples that already have metadata are excluded up front, which also
+    # allows interrupted computations to be resumed
     if not overwrite:
         sample_collection = sample_collection.exists("metadata", False)
 
@@ -298,47 +304,31 @@ def _compute_metadata(sample_collection, overwrite=False):
         return
 
     logger.info("Computing metadata...")
-    with fou.ProgressBar(total=num_samples) as pb:
-        for sample in pb(sample_collection.select_fields()):
-            compute_sample_metadata(sample, skip_failures=True)
-
-
-def _compute_metadata_multi(sample_collection, num_workers, overwrite=False):
-    if not overwrite:
-        sample_collection = sample_collection.exists("metadata", False)
 
-    ids, filepaths, media_types = sample_collection.values(
-        ["id", "filepath", "_media_type"],
-        _allow_missing=True,
-    )
-
-    inputs = list(zip(ids, filepaths, media_types))
-    num_samples = len(inputs)
+    # Samples are saved via a save context so that edits to generated views
+    # (patches, frames, clips) are synced to their source collections
+    view = sample_collection.select_fields()
+    batch_size = _BATCH_SIZE_PER_WORKER * max(1, num_workers)
 
-    if num_samples == 0:
-        return
+    with fou.ProgressBar(total=num_samples) as pb:
+        with ThreadPool(processes=max(1, num_workers)) as pool:
+            with view.save_context(batch_size=_SAVE_BATCH_SIZE) as context:
+                for samples in fou.iter_batches(
+                    view.iter_samples(), batch_size
+                ):
+                    inputs = [(s.filepath, s.media_type) for s in samples]
+                    results = pool.map(_do_compute_metadata, inputs)
 
-    logger.info("Computing metadata...")
+                    for sample, metadata in zip(samples, results):
+                        sample.metadata = metadata
+                        context.save(sample)
 
-    view = sample_collection.select_fields()
-    with fou.ProgressBar(total=num_samples) as pb:
-        with fou.get_multiprocessing_context().Pool(
-            processes=num_workers
-        ) as pool:
-            for sample_id, metadata in pb(
-                pool.imap_unordered(_do_compute_metadata, inputs)
-            ):
-                sample = view[sample_id]
-                sample.metadata = metadata
-                sample.save()
+                    pb.update(len(samples))
 
 
 def _do_compute_metadata(args):
-    sample_id, filepath, media_type = args
-    metadata = _compute_sample_metadata(
-        filepath, media_type, skip_failures=True
-    )
-    return sample_id, metadata
+    filepath, media_type = args
+    return _compute_sample_metadata(filepath, media_type, skip_failures=True)
 
 
 def _compute_sample_metadata(filepath, media_type, skip_failures=False):
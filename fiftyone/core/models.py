@@ -5,9 +5,12 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import collections
 import contextlib
 import inspect
 import logging
+from multiprocessing.pool import ThreadPool
+import os
 
 import numpy as np
 
@@ -25,6 +28,7 @@ import fiftyone.core.media as fom
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
+torch = fou.lazy_import("torch")
 tud = fou.lazy_import("torch.utils.data")
 
 foue = fou.lazy_import("fiftyone.utils.eta")
@@ -55,6 +59,8 @@ def apply_model(
     skip_failures=True,
     output_dir=None,
     rel_dir=None,
+    prefetch_factor=None,
+    image_cache=None,
     **kwargs,
 ):
     """Applies the :class:`FiftyOne model <Model>` or
@@ -98,6 +104,11 @@ def apply_model(
             ``output_dir`` that match the shape of the input paths. The path is
             converted to an absolute path (if necessary) via
             :func:`fiftyone.core.utils.normalize_path`
+        prefetch_factor (None): the number of batches that each worker loads
+            in advance. Only applicable for Torch-based models
+        image_cache (None): an optional
+            :class:`fiftyone.utils.image.ImageCache` from which to load the
+            images. Only applicable to image collections
         **kwargs: optional model-specific keyword arguments passed through
             to the underlying inference implementation
     """
@@ -156,6 +167,12 @@ def apply_model(
             "Ignoring `num_workers` parameter; only supported for Torch models"
         )
 
+    if prefetch_factor is not None and not use_data_loader:
+        logger.warning(
+            "Ignoring `prefetch_factor` parameter; only supported for Torch "
+            "models"
+        )
+
     if output_dir is not None:
         filename_maker = fou.UniqueFilenameMaker(
             output_dir=output_dir, rel_dir=rel_dir, idempotent=False
@@ -231,8 +248,10 @@ def apply_model(
                 confidence_thresh,
                 batch_size,
                 num_workers,
+                prefetch_factor,
                 skip_failures,
                 filename_maker,
+                image_cache,
             )
 
         if batch_size is not None:
@@ -244,6 +263,7 @@ def apply_model(
                 batch_size,
                 skip_failures,
                 filename_maker,
+                image_cache,
             )
 
         return _apply_image_model_single(
@@ -253,6 +273,7 @@ def apply_model(
             confidence_thresh,
             skip_failures,
             filename_maker,
+            image_cache,
         )
 
 
@@ -274,13 +295,14 @@ def _apply_image_model_single(
     confidence_thresh,
     skip_failures,
     filename_maker,
+    image_cache,
 ):
     samples = samples.select_fields()
 
     with fou.ProgressBar() as pb:
         for sample in pb(samples):
             try:
-                img = etai.read(sample.filepath)
+                img = _read_image(sample.filepath, image_cache)
                 labels = model.predict(img)
 
                 if filename_maker is not None:
@@ -307,6 +329,7 @@ def _apply_image_model_batch(
     batch_size,
     skip_failures,
     filename_maker,
+    image_cache,
 ):
     samples = samples.select_fields()
     samples_loader = fou.iter_batches(samples, batch_size)
@@ -314,7 +337,10 @@ def _apply_image_model_batch(
     with fou.ProgressBar(samples) as pb:
         for sample_batch in samples_loader:
             try:
-                imgs = [etai.read(sample.filepath) for sample in sample_batch]
+                imgs = [
+                    _read_image(sample.filepath, image_cache)
+                    for sample in sample_batch
+                ]
                 labels_batch = model.predict_all(imgs)
 
                 for sample, labels in zip(sample_batch, labels_batch):
@@ -349,16 +375,26 @@ def _apply_image_model_data_loader(
     confidence_thresh,
     batch_size,
     num_workers,
+    prefetch_factor,
     skip_failures,
     filename_maker,
+    image_cache,
 ):
     samples = samples.select_fields()
     samples_loader = fou.iter_batches(samples, batch_size)
     data_loader = _make_data_loader(
-        samples, model, batch_size, num_workers, skip_failures
+        samples,
+        model,
+        batch_size,
+        num_workers,
+        skip_failures,
+        prefetch_factor=prefetch_factor,
+        image_cache=image_cache,
     )
 
-    with fou.ProgressBar(samples) as pb:
+    with _AsyncSampleWriter(
+        samples, skip_failures=skip_failures
+    ) as writer, fou.ProgressBar(samples) as pb:
         for sample_batch, imgs in zip(samples_loader, data_loader):
             try:
                 if isinstance(imgs, Exception):
@@ -375,7 +411,8 @@ def _apply_image_model_data_loader(
                         label_field=label_field,
                         confidence_thresh=confidence_thresh,
                     )
-                    sample.save()
+
+                writer.save(sample_batch)
 
             except Exception as e:
                 if not skip_failures:
@@ -536,6 +573,13 @@ def _apply_video_model(
                 logger.warning("Sample: %s\nError: %s\n", sample.id, e)
 
 
+def _read_image(image_path, image_cache):
+    if image_cache is not None:
+        return image_cache.read(image_path)
+
+    return etai.read(image_path)
+
+
 def _export_arrays(label, input_path, filename_maker):
     if isinstance(label, dict):
         for _label in label.values():
@@ -586,7 +630,15 @@ def _iter_batches(video_reader, batch_size):
         yield frame_numbers, imgs
 
 
-def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
+def _make_data_loader(
+    samples,
+    model,
+    batch_size,
+    num_workers,
+    skip_failures,
+    prefetch_factor=None,
+    image_cache=None,
+):
     # This function supports DataLoaders that emit numpy arrays that can
     # therefore be used for non-Torch models; but we do not currenly use this
     # functionality
@@ -595,12 +647,21 @@ def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
     if num_workers is None:
         num_workers = fout.recommend_num_workers()
 
+    # Pinned host memory allows batches to be copied to the GPU
+    # asynchronously
+    pin_memory = not use_numpy and getattr(model, "using_gpu", False)
+
+    kwargs = {}
+    if prefetch_factor is not None and num_workers > 0:
+        kwargs["prefetch_factor"] = prefetch_factor
+
     dataset = fout.TorchImageDataset(
         samples=samples,
         transform=model.transforms,
         use_numpy=use_numpy,
         force_rgb=True,
         skip_failures=skip_failures,
+        image_cache=image_cache,
     )
 
     def handle_errors(batch):
@@ -661,16 +722,92 @@ def _make_data_loader(samples, model, batch_size, num_workers, skip_failures):
         batch_size=batch_size,
         num_workers=num_workers,
         collate_fn=collate_fn,
+        pin_memory=pin_memory,
+        **kwargs,
     )
 
 
+class _AsyncSampleWriter(object):
+    """Context that saves batches of samples in a background thread, so that
+    database writes for one batch overlap with inference on the next.
+
+    Each batch is saved via a single bulk write. At most ``max_pending``
+    batches may be queued; :meth:`save` blocks when this limit is reached.
+
+    Args:
+        samples: the :class:`fiftyone.core.collections.SampleCollection`
+            whose samples are being saved
+        skip_failures (True): whether to log, rather than raise, errors that
+            occur when saving a batch
+        max_pending (2): the maximum number of batches awaiting saving
+    """
+
+    def __init__(self, samples, skip_failures=True, max_pending=2):
+        self.samples = samples
+        self.skip_failures = skip_failures
+        self.max_pending = max_pending
+
+        self._pool = None
+        self._pending = collections.deque()
+
+    def __enter__(self):
+        self._pool = ThreadPool(processes=1)
+        return self
+
+    def __exit__(self, *args):
+        try:
+            while self._pending:
+                self._pending.popleft().get()
+        finally:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def save(self, sample_batch):
+        """Queues the batch of samples for saving.
+
+        The samples must not be modified after they are queued.
+
+        Args:
+            sample_batch: a list of :class:`fiftyone.core.sample.Sample` or
+                :class:`fiftyone.core.sample.SampleView` instances
+        """
+        while len(self._pending) >= self.max_pending:
+            self._pending.popleft().get()
+
+        self._pending.append(
+            self._pool.apply_async(self._save_batch, (list(sample_batch),))
+        )
+
+    def _save_batch(self, sample_batch):
+        try:
+            batch_size = len(sample_batch)
+            with self.samples.save_context(batch_size=batch_size) as ctx:
+                for sample in sample_batch:
+                    ctx.save(sample)
+        except Exception as e:
+            if not self.skip_failures:
+                raise e
+
+            logger.warning(
+                "Batch: %s - %s\nError: %s\n",
+                sample_batch[0].id,
+                sample_batch[-1].id,
+                e,
+            )
+
+
 def compute_embeddings(
     samples,
     model,
     embeddings_field=None,
+    embeddings_path=None,
+    embeddings_dtype=None,
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    prefetch_factor=None,
+    image_cache=None,
     **kwargs,
 ):
     """Computes embeddings for the samples in the collection using the given
@@ -692,7 +829,11 @@ def compute_embeddings(
     embeddings, i.e., :meth:`Model.has_embeddings` must return ``True``.
 
     If an ``embeddings_field`` is provided, the embeddings are saved to the
-    samples; otherwise, the embeddings are returned in-memory.
+    samples. If an ``embeddings_path`` is provided, the embeddings are
+    streamed to a ``.npy`` file on disk as they are computed and returned as a
+    read-only memory-mapped array, so the embeddings of arbitrarily large
+    collections can be computed with bounded memory. Otherwise, the embeddings
+    are returned in-memory.
 
     Args:
         samples: a :class:`fiftyone.core.collections.SampleCollection`
@@ -700,6 +841,17 @@ def compute_embeddings(
         embeddings_field (None): the name of a field in which to store the
             embeddings. When computing video frame embeddings, the "frames."
             prefix is optional
+        embeddings_path (None): the path to a ``.npy`` file in which to store
+            the embeddings. The IDs of the corresponding samples are written
+            to a sidecar file, and both can be loaded via
+            :func:`load_embeddings`. Rows of samples for which embeddings
+            could not be computed are filled with ``nan``. Only applicable
+            when computing one embedding per sample with a :class:`Model`
+        embeddings_dtype (None): an optional floating point numpy dtype, such
+            as ``"float16"`` or ``"float32"``, in which to store the
+            embeddings in ``embeddings_path``. By default, the dtype of the
+            model's embeddings is used, promoted to a floating point type if
+            necessary
         batch_size (None): an optional batch size to use, if the model supports
             batching
         num_workers (None): the number of workers to use when loading images.
@@ -707,6 +859,11 @@ def compute_embeddings(
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample. Only
             applicable to :class:`Model` instances
+        prefetch_factor (None): the number of batches that each worker loads
+            in advance. Only applicable for Torch-based models
+        image_cache (None): an optional
+            :class:`fiftyone.utils.image.ImageCache` from which to load the
+            images. Only applicable to image collections
         **kwargs: optional model-specific keyword arguments passed through
             to the underlying inference implementation
 
@@ -714,6 +871,8 @@ def compute_embeddings(
         one of the following:
 
         -   ``None``, if an ``embeddings_field`` is provided
+        -   a ``num_samples x num_dim`` memory-mapped array of embeddings, if
+            an ``embeddings_path`` is provided
         -   a ``num_samples x num_dim`` array of embeddings, when computing
             embeddings for image/video collections with image/video models,
             respectively, and no ``embeddings_field`` is provided. If
@@ -728,6 +887,27 @@ def compute_embeddings(
             contain arrays of embeddings for all frames 1, 2, ... until the
             error occurred, or ``None`` if no embeddings were computed at all
     """
+    if embeddings_path is not None:
+        if embeddings_field is not None:
+            raise ValueError(
+                "Only one of `embeddings_field` and `embeddings_path` may be "
+                "provided"
+            )
+
+        if _is_flash_model(model):
+            raise ValueError(
+                "`embeddings_path` is not supported for Lightning Flash models"
+            )
+
+    if embeddings_dtype is not None:
+        if embeddings_path is None:
+            logger.warning(
+                "Ignoring `embeddings_dtype` parameter; only supported when "
+                "an `embeddings_path` is provided"
+            )
+        else:
+            _validate_embeddings_dtype(embeddings_dtype)
+
     if _is_flash_model(model):
         return fouf.compute_flash_embeddings(
             samples,
@@ -779,6 +959,12 @@ def compute_embeddings(
             "Ignoring `num_workers` parameter; only supported for Torch models"
         )
 
+    if prefetch_factor is not None and not use_data_loader:
+        logger.warning(
+            "Ignoring `prefetch_factor` parameter; only supported for Torch "
+            "models"
+        )
+
     with contextlib.ExitStack() as context:
         if use_data_loader:
             # pylint: disable=no-member
@@ -789,12 +975,23 @@ def compute_embeddings(
 
         if samples.media_type == fom.VIDEO and model.media_type == "video":
             return _compute_video_embeddings(
-                samples, model, embeddings_field, skip_failures
+                samples,
+                model,
+                embeddings_field,
+                embeddings_path,
+                embeddings_dtype,
+                skip_failures,
             )
 
         batch_size = _parse_batch_size(batch_size, model, use_data_loader)
 
         if samples.media_type == fom.VIDEO and model.media_type == "image":
+            if embeddings_path is not None:
+                raise ValueError(
+                    "`embeddings_path` is not supported when computing frame "
+                    "embeddings"
+                )
+
             if embeddings_field is not None:
                 embeddings_field, _ = samples._handle_frame_field(
                     embeddings_field
@@ -814,26 +1011,51 @@ def compute_embeddings(
                 samples,
                 model,
                 embeddings_field,
+                embeddings_path,
+                embeddings_dtype,
                 batch_size,
                 num_workers,
+                prefetch_factor,
                 skip_failures,
+                image_cache,
             )
 
         if batch_size is not None:
             return _compute_image_embeddings_batch(
-                samples, model, embeddings_field, batch_size, skip_failures
+                samples,
+                model,
+                embeddings_field,
+                embeddings_path,
+                embeddings_dtype,
+                batch_size,
+                skip_failures,
+                image_cache,
             )
 
         return _compute_image_embeddings_single(
-            samples, model, embeddings_field, skip_failures
+            samples,
+            model,
+            embeddings_field,
+            embeddings_path,
+            embeddings_dtype,
+            skip_failures,
+            image_cache,
         )
 
 
 def _compute_image_embeddings_single(
-    samples, model, embeddings_field, skip_failures
+    samples,
+    model,
+    embeddings_field,
+    embeddings_path,
+    embeddings_dtype,
+    skip_failures,
+    image_cache,
 ):
     samples = samples.select_fields()
-    embeddings = []
+    embeddings = _EmbeddingsStore(
+        samples, embeddings_path=embeddings_path, dtype=embeddings_dtype
+    )
 
     errors = False
 
@@ -842,7 +1064,7 @@ def _compute_image_embeddings_single(
             embedding = None
 
             try:
-                img = etai.read(sample.filepath)
+                img = _read_image(sample.filepath, image_cache)
                 embedding = model.embed(img)[0]
             except Exception as e:
                 if not skip_failures:
@@ -855,24 +1077,30 @@ def _compute_image_embeddings_single(
                 sample[embeddings_field] = embedding
                 sample.save()
             else:
-                embeddings.append(embedding)
+                embeddings.add([sample.id], [embedding])
 
     if embeddings_field:
         return None
 
-    if errors:
-        return embeddings  # may contain None, must return as list
-
-    return np.stack(embeddings)
+    return embeddings.get_embeddings(errors)
 
 
 def _compute_image_embeddings_batch(
-    samples, model, embeddings_field, batch_size, skip_failures
+    samples,
+    model,
+    embeddings_field,
+    embeddings_path,
+    embeddings_dtype,
+    batch_size,
+    skip_failures,
+    image_cache,
 ):
     samples = samples.select_fields()
     samples_loader = fou.iter_batches(samples, batch_size)
 
-    embeddings = []
+    embeddings = _EmbeddingsStore(
+        samples, embeddings_path=embeddings_path, dtype=embeddings_dtype
+    )
     errors = False
 
     with fou.ProgressBar(samples) as pb:
@@ -880,7 +1108,10 @@ def _compute_image_embeddings_batch(
             embeddings_batch = [None] * len(sample_batch)
 
             try:
-                imgs = [etai.read(sample.filepath) for sample in sample_batch]
+                imgs = [
+                    _read_image(sample.filepath, image_cache)
+                    for sample in sample_batch
+                ]
                 embeddings_batch = list(model.embed_all(imgs))  # list of 1D
             except Exception as e:
                 if not skip_failures:
@@ -899,32 +1130,48 @@ def _compute_image_embeddings_batch(
                     sample[embeddings_field] = embedding
                     sample.save()
             else:
-                embeddings.extend(embeddings_batch)
+                embeddings.add([s.id for s in sample_batch], embeddings_batch)
 
             pb.update(len(sample_batch))
 
     if embeddings_field:
         return None
 
-    if errors:
-        return embeddings  # may contain None, must return as list
-
-    return np.stack(embeddings)
+    return embeddings.get_embeddings(errors)
 
 
 def _compute_image_embeddings_data_loader(
-    samples, model, embeddings_field, batch_size, num_workers, skip_failures
+    samples,
+    model,
+    embeddings_field,
+    embeddings_path,
+    embeddings_dtype,
+    batch_size,
+    num_workers,
+    prefetch_factor,
+    skip_failures,
+    image_cache,
 ):
     samples = samples.select_fields()
     samples_loader = fou.iter_batches(samples, batch_size)
     data_loader = _make_data_loader(
-        samples, model, batch_size, num_workers, skip_failures
+        samples,
+        model,
+        batch_size,
+        num_workers,
+        skip_failures,
+        prefetch_factor=prefetch_factor,
+        image_cache=image_cache,
     )
 
-    embeddings = []
+    embeddings = _EmbeddingsStore(
+        samples, embeddings_path=embeddings_path, dtype=embeddings_dtype
+    )
     errors = False
 
-    with fou.ProgressBar(samples) as pb:
+    with _AsyncSampleWriter(
+        samples, skip_failures=skip_failures
+    ) as writer, fou.ProgressBar(samples) as pb:
         for sample_batch, imgs in zip(samples_loader, data_loader):
             embeddings_batch = [None] * len(sample_batch)
 
@@ -948,19 +1195,17 @@ def _compute_image_embeddings_data_loader(
             if embeddings_field:
                 for sample, embedding in zip(sample_batch, embeddings_batch):
                     sample[embeddings_field] = embedding
-                    sample.save()
+
+                writer.save(sample_batch)
             else:
-                embeddings.extend(embeddings_batch)
+                embeddings.add([s.id for s in sample_batch], embeddings_batch)
 
             pb.update(len(sample_batch))
 
     if embeddings_field:
         return None
 
-    if errors:
-        return embeddings  # may contain None, must return as list
-
-    return np.stack(embeddings)
+    return embeddings.get_embeddings(errors)
 
 
 def _compute_frame_embeddings_single(
@@ -1086,15 +1331,26 @@ def _compute_frame_embeddings_batch(
     return embeddings_dict
 
 
-def _compute_video_embeddings(samples, model, embeddings_field, skip_failures):
+def _compute_video_embeddings(
+    samples,
+    model,
+    embeddings_field,
+    embeddings_path,
+    embeddings_dtype,
+    skip_failures,
+):
     samples = samples.select_fields()
     is_clips = samples._dataset._is_clips
 
-    embeddings = []
+    embeddings = _EmbeddingsStore(
+        samples, embeddings_path=embeddings_path, dtype=embeddings_dtype
+    )
     errors = False
 
     with fou.ProgressBar() as pb:
         for sample in pb(samples):
+            embedding = None
+
             if is_clips:
                 frames = etaf.FrameRange(*sample.support)
             else:
@@ -1117,15 +1373,166 @@ def _compute_video_embeddings(samples, model, embeddings_field, skip_failures):
                 sample[embeddings_field] = embedding
                 sample.save()
             else:
-                embeddings.append(embedding)
+                embeddings.add([sample.id], [embedding])
 
     if embeddings_field:
         return None
 
-    if errors:
-        return embeddings  # may contain None, must return as list
+    return embeddings.get_embeddings(errors)
+
 
-    return np.stack(embeddings)
+def load_embeddings(embeddings_path):
+    """Loads embeddings that were written to disk by
+    :func:`compute_embeddings`.
+
+    The embeddings are memory-mapped, so they are not read into memory until
+    they are accessed.
+
+    Args:
+        embeddings_path: the path to the ``.npy`` embeddings file
+
+    Returns:
+        a tuple of
+
+        -   a read-only ``num_samples x num_dim`` memory-mapped array of
+            embeddings
+        -   an array of the corresponding sample IDs
+    """
+    embeddings = np.load(embeddings_path, mmap_mode="r")
+    sample_ids = np.load(_get_embeddings_ids_path(embeddings_path))
+    return embeddings, sample_ids
+
+
+class _EmbeddingsStore(object):
+    """Accumulates per-sample embeddings either in-memory or, if an
+    ``embeddings_path`` is provided, by writing them directly into a
+    memory-mapped ``.npy`` file.
+
+    Embeddings written to disk are always stored in a floating point dtype so
+    that the rows of samples whose embeddings could not be computed can be
+    filled with ``nan``.
+
+    Args:
+        samples: the :class:`fiftyone.core.collections.SampleCollection` whose
+            embeddings are being computed
+        embeddings_path (None): an optional ``.npy`` path
+        dtype (None): an optional floating point dtype in which to store the
+            embeddings in ``embeddings_path``. By default, the dtype of the
+            first embedding is used, promoted to a floating point type if
+            necessary
+    """
+
+    def __init__(self, samples, embeddings_path=None, dtype=None):
+        self.embeddings_path = embeddings_path
+
+        if dtype is not None:
+            dtype = _validate_embeddings_dtype(dtype)
+
+        self.dtype = dtype
+
+        if embeddings_path is not None:
+            self._num_samples = len(samples)
+        else:
+            self._num_samples = None
+
+        self._embeddings = []
+        self._array = None
+        self._sample_ids = []
+        self._missing = []
+
+    def add(self, sample_ids, embeddings):
+        """Adds the given embeddings.
+
+        Args:
+            sample_ids: a list of sample IDs
+            embeddings: a list of embedding vectors, which may contain ``None``
+                entries
+        """
+        if self.embeddings_path is None:
+            self._embeddings.extend(embeddings)
+            return
+
+        for sample_id, embedding in zip(sample_ids, embeddings):
+            idx = len(self._sample_ids)
+            self._sample_ids.append(sample_id)
+
+            if embedding is None:
+                self._missing.append(idx)
+                continue
+
+            if self._array is None:
+                dtype = self.dtype
+                if dtype is None:
+                    dtype = np.result_type(embedding.dtype, np.float16)
+
+                etau.ensure_basedir(self.embeddings_path)
+                self._array = np.lib.format.open_memmap(
+                    self.embeddings_path,
+                    mode="w+",
+                    dtype=dtype,
+                    shape=(self._num_samples,) + embedding.shape,
+                )
+
+            self._array[idx] = embedding
+
+    def get_embeddings(self, errors):
+        """Returns the embeddings.
+
+        Args:
+            errors: whether any embeddings could not be computed
+
+        Returns:
+            an array, memory-mapped array, or list of embeddings
+
+        Raises:
+            ValueError: if an ``embeddings_path`` was provided and no
+                embeddings could be computed
+        """
+        if self.embeddings_path is None:
+            if errors:
+                return self._embeddings  # may contain None, must return list
+
+            return np.stack(self._embeddings)
+
+        if self._array is None:
+            if self._sample_ids:
+                raise ValueError(
+                    "Failed to compute embeddings for all %d samples; nothing "
+                    "was written to '%s'"
+                    % (len(self._sample_ids), self.embeddings_path)
+                )
+
+            # Empty collection
+            etau.ensure_basedir(self.embeddings_path)
+            np.save(self.embeddings_path, np.zeros(0, dtype=self.dtype))
+        else:
+            for idx in self._missing:
+                self._array[idx] = np.nan
+
+            self._array.flush()
+            self._array = None
+
+        np.save(
+            _get_embeddings_ids_path(self.embeddings_path),
+            np.array(self._sample_ids, dtype=str),
+        )
+
+        return np.load(self.embeddings_path, mmap_mode="r")
+
+
+def _validate_embeddings_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise ValueError(
+            "Embeddings must be stored in a floating point dtype; found %s"
+            % dtype
+        )
+
+    return dtype
+
+
+def _get_embeddings_ids_path(embeddings_path):
+    return os.path.splitext(embeddings_path)[0] + "_ids.npy"
 
 
 def compute_patch_embeddings(
@@ -1139,6 +1546,7 @@ def compute_patch_embeddings(
     batch_size=None,
     num_workers=None,
     skip_failures=True,
+    image_cache=None,
 ):
     """Computes embeddings for the image patches defined by ``patches_field``
     of the samples in the collection using the given :class:`Model`.
@@ -1190,6 +1598,9 @@ def compute_patch_embeddings(
             Only applicable for Torch models
         skip_failures (True): whether to gracefully continue without raising an
             error if embeddings cannot be generated for a sample
+        image_cache (None): an optional
+            :class:`fiftyone.utils.image.ImageCache` from which to load the
+            images. Only applicable to image collections
 
     Returns:
         one of the following:
@@ -1298,6 +1709,7 @@ def compute_patch_embeddings(
                 batch_size,
                 num_workers,
                 skip_failures,
+                image_cache,
             )
 
         return _embed_patches(
@@ -1310,6 +1722,7 @@ def compute_patch_embeddings(
             handle_missing,
             batch_size,
             skip_failures,
+            image_cache,
         )
 
 
@@ -1323,48 +1736,62 @@ def _embed_patches(
     handle_missing,
     batch_size,
     skip_failures,
+    image_cache,
 ):
     samples = samples.select_fields(patches_field)
 
+    if batch_size is not None:
+        batcher = _PatchBatcher(model, batch_size, skip_failures)
+    else:
+        batcher = None
+
     embeddings_dict = {}
 
-    with fou.ProgressBar() as pb:
+    with samples.save_context() as ctx, fou.ProgressBar() as pb:
         for sample in pb(samples):
-            embeddings = None
+            results = []
 
             try:
                 patches = foup.parse_patches(
                     sample, patches_field, handle_missing=handle_missing
                 )
 
-                if patches is not None:
-                    img = etai.read(sample.filepath)
-
-                    if batch_size is None:
-                        embeddings = _embed_patches_single(
-                            model, img, patches, force_square, alpha
-                        )
-                    else:
-                        embeddings = _embed_patches_batch(
-                            model,
+                if patches is None:
+                    results.append((sample, None))
+                elif batcher is not None:
+                    img = _read_image(sample.filepath, image_cache)
+                    img_patches = [
+                        foup.extract_patch(
                             img,
-                            patches,
-                            force_square,
-                            alpha,
-                            batch_size,
+                            detection,
+                            force_square=force_square,
+                            alpha=alpha,
                         )
+                        for detection in patches.detections
+                    ]
+                    results.extend(batcher.add(sample, img_patches))
+                else:
+                    img = _read_image(sample.filepath, image_cache)
+                    embeddings = _embed_patches_single(
+                        model, img, patches, force_square, alpha
+                    )
+                    results.append((sample, embeddings))
 
             except Exception as e:
                 if not skip_failures:
                     raise e
 
                 logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                results.append((sample, None))
 
-            if embeddings_field:
-                sample[embeddings_field] = embeddings
-                sample.save()
-            else:
-                embeddings_dict[sample.id] = embeddings
+            _store_patch_embeddings(
+                results, embeddings_field, ctx, embeddings_dict
+            )
+
+        if batcher is not None:
+            _store_patch_embeddings(
+                batcher.flush(), embeddings_field, ctx, embeddings_dict
+            )
 
     if embeddings_field:
         return None
@@ -1412,6 +1839,7 @@ def _embed_patches_data_loader(
     batch_size,
     num_workers,
     skip_failures,
+    image_cache,
 ):
     samples = samples.select_fields(patches_field)
     data_loader = _make_patch_data_loader(
@@ -1423,37 +1851,39 @@ def _embed_patches_data_loader(
         handle_missing,
         num_workers,
         skip_failures,
+        image_cache=image_cache,
     )
 
+    batcher = _PatchBatcher(model, batch_size, skip_failures)
     embeddings_dict = {}
 
-    with fou.ProgressBar(samples) as pb:
+    with samples.save_context() as ctx, fou.ProgressBar(samples) as pb:
         for sample, patches in pb(zip(samples, data_loader)):
-            embeddings = None
+            results = []
 
             try:
                 if isinstance(patches, Exception):
                     raise patches
 
-                if patches is not None:
-                    embeddings = []
-                    for patches_batch in fou.iter_slices(patches, batch_size):
-                        embeddings_batch = model.embed_all(patches_batch)
-                        embeddings.append(embeddings_batch)
-
-                    embeddings = np.concatenate(embeddings)
+                if patches is None:
+                    results.append((sample, None))
+                else:
+                    results.extend(batcher.add(sample, patches))
 
             except Exception as e:
                 if not skip_failures:
                     raise e
 
                 logger.warning("Sample: %s\nError: %s\n", sample.id, e)
+                results.append((sample, None))
 
-            if embeddings_field:
-                sample[embeddings_field] = embeddings
-                sample.save()
-            else:
-                embeddings_dict[sample.id] = embeddings
+            _store_patch_embeddings(
+                results, embeddings_field, ctx, embeddings_dict
+            )
+
+        _store_patch_embeddings(
+            batcher.flush(), embeddings_field, ctx, embeddings_dict
+        )
 
     if embeddings_field:
         return None
@@ -1461,6 +1891,151 @@ def _embed_patches_data_loader(
     return embeddings_dict
 
 
+def _store_patch_embeddings(results, embeddings_field, ctx, embeddings_dict):
+    for sample, embeddings in results:
+        if embeddings_field:
+            sample[embeddings_field] = embeddings
+            ctx.save(sample)
+        else:
+            embeddings_dict[sample.id] = embeddings
+
+
+class _PatchBatcher(object):
+    """Packs the patches of consecutive samples into batches of a fixed size
+    for embedding, and scatters the resulting embeddings back to their
+    samples.
+
+    Args:
+        model: the :class:`Model`
+        batch_size: the number of patches to embed per batch
+        skip_failures: whether to gracefully continue without raising an
+            error if a batch cannot be embedded
+    """
+
+    def __init__(self, model, batch_size, skip_failures):
+        self.model = model
+        self.batch_size = batch_size
+        self.skip_failures = skip_failures
+
+        self._patches = collections.deque()
+        self._num_patches = 0
+        self._entries = collections.deque()
+
+    def add(self, sample, patches):
+        """Adds the patches for the given sample, embedding any complete
+        batches.
+
+        Args:
+            sample: a :class:`fiftyone.core.sample.Sample`
+            patches: a list, array, or tensor of patches
+
+        Returns:
+            a list of ``(sample, embeddings)`` tuples for the samples whose
+            embeddings are now complete
+        """
+        self._entries.append(_PatchEntry(sample, len(patches)))
+        self._patches.append(patches)
+        self._num_patches += len(patches)
+
+        while self._num_patches >= self.batch_size:
+            self._embed_batch(self.batch_size)
+
+        return self._pop_completed()
+
+    def flush(self):
+        """Embeds any remaining patches.
+
+        Returns:
+            a list of ``(sample, embeddings)`` tuples for the remaining samples
+        """
+        if self._num_patches > 0:
+            self._embed_batch(self._num_patches)
+
+        return self._pop_completed()
+
+    def _embed_batch(self, num_patches):
+        chunks = []
+        count = 0
+        while count < num_patches:
+            patches = self._patches.popleft()
+            num = min(len(patches), num_patches - count)
+            if num < len(patches):
+                self._patches.appendleft(patches[num:])
+                patches = patches[:num]
+
+            chunks.append(patches)
+            count += num
+
+        self._num_patches -= num_patches
+
+        embeddings = None
+        error = None
+        try:
+            embeddings = self.model.embed_all(_concat_patches(chunks))
+        except Exception as e:
+            if not self.skip_failures:
+                raise e
+
+            error = e
+
+        offset = 0
+        for entry in self._entries:
+            if offset >= num_patches:
+                break
+
+            num = min(entry.num_remaining, num_patches - offset)
+            if num <= 0:
+                continue
+
+            if error is not None:
+                entry.error = error
+            else:
+                entry.embeddings.append(embeddings[offset : (offset + num)])
+
+            entry.num_remaining -= num
+            offset += num
+
+    def _pop_completed(self):
+        results = []
+        while self._entries and self._entries[0].num_remaining <= 0:
+            entry = self._entries.popleft()
+
+            if entry.error is not None:
+                logger.warning(
+                    "Sample: %s\nError: %s\n", entry.sample.id, entry.error
+                )
+                embeddings = None
+            elif entry.embeddings:
+                embeddings = np.concatenate(entry.embeddings)
+            else:
+                embeddings = None
+
+            results.append((entry.sample, embeddings))
+
+        return results
+
+
+class _PatchEntry(object):
+    def __init__(self, sample, num_patches):
+        self.sample = sample
+        self.num_remaining = num_patches
+        self.embeddings = []
+        self.error = None
+
+
+def _concat_patches(chunks):
+    if len(chunks) == 1:
+        return chunks[0]
+
+    if isinstance(chunks[0], (list, tuple)):
+        return [patch for patches in chunks for patch in patches]
+
+    if isinstance(chunks[0], np.ndarray):
+        return np.concatenate(chunks)
+
+    return torch.cat(chunks)
+
+
 def _embed_frame_patches(
     samples,
     model,
@@ -1552,6 +2127,7 @@ def _make_patch_data_loader(
     handle_missing,
     num_workers,
     skip_failures,
+    image_cache=None,
 ):
     # This function supports DataLoaders that emit numpy arrays that can
     # therefore be used for non-Torch models; but we do not currenly use this
@@ -1572,6 +2148,7 @@ def _make_patch_data_loader(
         force_square=force_square,
         alpha=alpha,
         skip_failures=skip_failures,
+        image_cache=image_cache,
     )
 
     return tud.DataLoader(
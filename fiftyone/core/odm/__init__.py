@@ -32,8 +32,11 @@ from .database import (
     count_documents,
     export_document,
     export_collection,
+    export_bson_collection,
     import_document,
     import_collection,
+    import_bson_collection,
+    is_bson_collection,
     insert_documents,
     bulk_write,
 )
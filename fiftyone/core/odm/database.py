@@ -6,15 +6,22 @@ Database utilities.
 |
 """
 import atexit
+from collections import deque
 from datetime import datetime
+import gzip
+import json
 import logging
+import multiprocessing
 from multiprocessing.pool import ThreadPool
 import os
+import re
+import threading
 
 import asyncio
+import bson
 from bson import json_util
 from bson.codec_options import CodecOptions
-from mongoengine import connect
+from mongoengine import connect, disconnect
 import mongoengine.errors as moe
 import motor.motor_asyncio as mtr
 
@@ -35,6 +42,7 @@ import fiftyone.core.utils as fou
 from .document import Document
 
 fod = fou.lazy_import("fiftyone.core.dataset")
+fomi = fou.lazy_import("fiftyone.migrations")
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +50,13 @@ _client = None
 _async_client = None
 _connection_kwargs = {}
 _db_service = None
+_db_conn_established = False
+_connect_lock = threading.RLock()
+
+_JSON_CHUNK_SIZE = 1024 * 1024  # characters
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_BSON_SHARD_SIZE = 10000  # documents
+_BSON_MANIFEST = "manifest.json"
 
 
 #
@@ -228,18 +243,55 @@ def establish_db_conn(config):
 
 def _connect():
     global _client
-    if _client is None:
-        global _connection_kwargs
+    if _client is not None and _db_conn_established:
+        return
+
+    # Other threads must wait until the connection has been established and
+    # the database has been migrated. The lock is reentrant because migrations
+    # access the database
+    with _connect_lock:
+        if _client is None and not _db_conn_established:
+            _establish_db_conn()
+
+        if _client is None:
+            global _connection_kwargs
+
+            _client = pymongo.MongoClient(
+                **_connection_kwargs, appname=foc.DATABASE_APPNAME
+            )
+            connect(fo.config.database_name, **_connection_kwargs)
+
+
+def _establish_db_conn():
+    # `import fiftyone` does not connect to the database, so the connection is
+    # established, and the database is migrated if necessary, on first use
+    global _db_conn_established
+
+    establish_db_conn(fo.config)
+
+    if os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
+        fomi.migrate_database_if_necessary()
+
+    _db_conn_established = True
 
-        _client = pymongo.MongoClient(
-            **_connection_kwargs, appname=foc.DATABASE_APPNAME
-        )
-        connect(fo.config.database_name, **_connection_kwargs)
+
+def _disconnect():
+    # Discards the current clients, eg in child processes that must not reuse
+    # the clients of their parent process, so that new clients are created on
+    # the next database access
+    global _client
+    global _async_client
+
+    _client = None
+    _async_client = None
+    disconnect()
 
 
 def _async_connect():
     global _async_client
     if _async_client is None:
+        _connect()
+
         global _connection_kwargs
         _async_client = mtr.AsyncIOMotorClient(
             **_connection_kwargs, appname=foc.DATABASE_APPNAME
@@ -602,7 +654,9 @@ def _export_collection_single(docs, json_path, key, num_docs):
     etau.ensure_basedir(json_path)
 
     with open(json_path, "w") as f:
-        f.write('{"%s": [' % key)
+        # The document count is written first so that streaming imports can
+        # report progress without reading the entire file
+        f.write('{"num_documents": %d, "%s": [' % (num_docs, key))
         with fou.ProgressBar(total=num_docs, iters_str="docs") as pb:
             for idx, doc in pb(enumerate(docs, 1)):
                 f.write(json_util.dumps(doc))
@@ -648,7 +702,7 @@ def import_collection(json_dir_or_path, key="documents"):
         a tuple of
 
         -   an iterable of BSON documents
-        -   the number of documents
+        -   the number of documents, or None if it is unknown
     """
     if json_dir_or_path.endswith(".json"):
         return _import_collection_single(json_dir_or_path, key)
@@ -657,14 +711,154 @@ def import_collection(json_dir_or_path, key="documents"):
 
 
 def _import_collection_single(json_path, key):
+    # Only the fields preceding the documents are read here; the documents
+    # themselves are parsed lazily, one at a time
     with open(json_path, "r") as f:
-        docs = json_util.loads(f.read()).get(key, [])
+        header, _ = _parse_json_header(_JSONStream(f), key)
 
-    num_docs = len(docs)
+    num_docs = header.get("num_documents", None)
+    docs = _iter_json_collection(json_path, key)
 
     return docs, num_docs
 
 
+def _iter_json_collection(json_path, key):
+    with open(json_path, "r") as f:
+        stream = _JSONStream(f)
+        _, found = _parse_json_header(stream, key)
+        if found:
+            yield from _iter_json_array(stream)
+
+
+def _parse_json_header(stream, key):
+    # Consumes the top-level fields of a JSON object that precede `key`,
+    # leaving `stream` positioned at the value of `key`, if it exists
+    header = {}
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return header, False
+
+    while True:
+        k = stream.decode()
+        stream.expect(":")
+        if k == key:
+            return header, True
+
+        header[k] = stream.decode()
+        if stream.expect(",}") == "}":
+            return header, False
+
+
+def _iter_json_array(stream):
+    stream.expect("[")
+    if stream.peek() == "]":
+        return
+
+    while True:
+        yield stream.decode()
+        if stream.expect(",]") == "]":
+            return
+
+
+class _JSONStream(object):
+    """Incrementally decodes Extended JSON values from a file so that
+    arbitrarily large files can be read with bounded memory.
+
+    Args:
+        f: a file object opened in text mode
+        chunk_size (None): the number of characters to read at a time. By
+            default, ``_JSON_CHUNK_SIZE`` is used
+    """
+
+    def __init__(self, f, chunk_size=None):
+        if chunk_size is None:
+            chunk_size = _JSON_CHUNK_SIZE
+
+        self._f = f
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder(
+            object_pairs_hook=lambda pairs: json_util.object_pairs_hook(
+                pairs, json_util.DEFAULT_JSON_OPTIONS
+            )
+        )
+
+    def peek(self):
+        """Returns the next non-whitespace character without consuming it.
+
+        Returns:
+            the character, or None if the end of the file has been reached
+        """
+        while True:
+            self._pos = _JSON_WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+
+            if not self._read(self._chunk_size):
+                return None
+
+    def expect(self, chars):
+        """Consumes the next non-whitespace character, which must be one of
+        the given characters.
+
+        Args:
+            chars: a string of allowed characters
+
+        Returns:
+            the character
+        """
+        c = self.peek()
+        if c is None or c not in chars:
+            raise ValueError(
+                "Expected one of '%s' but found %s" % (chars, repr(c))
+            )
+
+        self._pos += 1
+        return c
+
+    def decode(self):
+        """Decodes the next JSON value.
+
+        Returns:
+            the value
+        """
+        self.peek()
+
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # The value may be incomplete, so read more and try again
+                if not self._read(size):
+                    raise
+
+                size *= 2
+                continue
+
+            # Values that end at the end of the buffer may be truncated
+            # numbers, so we must check that they are terminated
+            if end < len(self._buf) or not self._read(size):
+                self._pos = end
+                return value
+
+    def _read(self, size):
+        if self._eof:
+            return False
+
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+
 def _import_collection_multi(json_dir):
     json_paths = [
         p
@@ -676,6 +870,141 @@ def _import_collection_multi(json_dir):
     return docs, len(json_paths)
 
 
+def export_bson_collection(
+    docs, shards_dir, num_docs=None, shard_size=None, num_workers=None
+):
+    """Exports the collection to disk as a directory of gzip-compressed BSON
+    shards along with a manifest describing them.
+
+    Encoding, compression, and writing of shards are performed in parallel.
+
+    Args:
+        docs: an iterable containing the documents to export
+        shards_dir: the directory in which to write the shards
+        num_docs (None): the total number of documents. If omitted, this must
+            be computable via ``len(docs)``
+        shard_size (None): the maximum number of documents per shard. By
+            default, ``_BSON_SHARD_SIZE`` is used
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used
+    """
+    if num_docs is None:
+        num_docs = len(docs)
+
+    if shard_size is None:
+        shard_size = _BSON_SHARD_SIZE
+
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    etau.ensure_dir(shards_dir)
+
+    # Bound the number of shards that may be in-flight at any time so that
+    # memory usage does not grow if writing falls behind
+    max_pending = 2 * num_workers
+
+    shards = []
+    pending = deque()
+
+    def _finalize_next():
+        pending.popleft().get()  # raises any errors
+
+    with ThreadPool(processes=num_workers) as pool:
+        with fou.ProgressBar(total=num_docs, iters_str="docs") as pb:
+            for idx, batch in enumerate(
+                fou.iter_batches(pb(docs), shard_size), 1
+            ):
+                filename = "%06d.bson.gz" % idx
+                shard_path = os.path.join(shards_dir, filename)
+                shards.append(
+                    {"filename": filename, "num_documents": len(batch)}
+                )
+
+                result = pool.apply_async(
+                    _write_bson_shard, (list(batch), shard_path)
+                )
+                pending.append(result)
+
+                while len(pending) >= max_pending:
+                    _finalize_next()
+
+            while pending:
+                _finalize_next()
+
+    manifest = {
+        "format": "bson",
+        "compression": "gzip",
+        "num_documents": sum(s["num_documents"] for s in shards),
+        "shards": shards,
+    }
+    export_document(manifest, os.path.join(shards_dir, _BSON_MANIFEST))
+
+
+def import_bson_collection(shards_dir, num_workers=None):
+    """Imports a collection that was exported via
+    :func:`export_bson_collection`.
+
+    Shards are decompressed and decoded in parallel, but only a bounded number
+    of shards are held in memory at any time.
+
+    Args:
+        shards_dir: the directory containing the shards
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used
+
+    Returns:
+        a tuple of
+
+        -   an iterable of BSON documents
+        -   the number of documents
+    """
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+
+    manifest = import_document(os.path.join(shards_dir, _BSON_MANIFEST))
+    shard_paths = [
+        os.path.join(shards_dir, s["filename"]) for s in manifest["shards"]
+    ]
+
+    docs = _iter_bson_shards(shard_paths, num_workers)
+    num_docs = manifest["num_documents"]
+
+    return docs, num_docs
+
+
+def is_bson_collection(dir_path):
+    """Determines whether the given directory contains a collection exported
+    via :func:`export_bson_collection`.
+
+    Args:
+        dir_path: a directory
+
+    Returns:
+        True/False
+    """
+    return os.path.isfile(os.path.join(dir_path, _BSON_MANIFEST))
+
+
+def _write_bson_shard(docs, shard_path):
+    data = b"".join(bson.encode(doc) for doc in docs)
+    with open(shard_path, "wb") as f:
+        f.write(gzip.compress(data, compresslevel=1))
+
+
+def _read_bson_shard(shard_path):
+    with open(shard_path, "rb") as f:
+        data = gzip.decompress(f.read())
+
+    return bson.decode_all(data)
+
+
+def _iter_bson_shards(shard_paths, num_workers):
+    with ThreadPool(processes=num_workers) as pool:
+        for batch in fou.iter_batches(shard_paths, num_workers):
+            for docs in pool.map(_read_bson_shard, batch):
+                yield from docs
+
+
 def insert_documents(docs, coll, ordered=False, progress=False, num_docs=None):
     """Inserts documents into a collection.
 
@@ -20,6 +20,8 @@ import fiftyone.core.utils as fou
 
 from .utils import serialize_value, deserialize_value
 
+food = fou.lazy_import("fiftyone.core.odm.database")
+
 
 class SerializableDocument(object):
     """Mixin for documents that can be serialized in BSON or JSON format."""
@@ -500,6 +502,15 @@ class BaseDocument(MongoEngineBaseDocument):
         # pylint: disable=no-member
         return self._fields_ordered
 
+    @classmethod
+    def _get_db(cls):
+        # The database connection is established lazily, so we must ensure
+        # that it exists before mongoengine accesses the database
+        food._connect()
+
+        # pylint: disable=no-member
+        return super()._get_db()
+
     @property
     def in_db(self):
         """Whether the document has been inserted into the database."""
@@ -66,7 +66,7 @@ def serialize_value(value, extended=False):
 
     if isinstance(value, np.ndarray):
         # VectorField/ArrayField
-        binary = Binary(fou.serialize_numpy_array(value))
+        binary = Binary(fou.encode_numpy_array(value))
         if not extended:
             return binary
 
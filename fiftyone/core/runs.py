@@ -186,7 +186,7 @@ class Run(Configurable):
         """
         raise NotImplementedError("subclass must implement cleanup()")
 
-    def register_run(self, samples, key, overwrite=True):
+    def register_run(self, samples, key, overwrite=True, cleanup=True):
         """Registers a run of this method under the given key on the given
         collection.
 
@@ -195,6 +195,8 @@ class Run(Configurable):
             key: a run key
             overwrite (True): whether to allow overwriting an existing run of
                 the same type
+            cleanup (True): whether to call :meth:`cleanup` when overwriting
+                an existing run
         """
         if key is None:
             return
@@ -206,7 +208,7 @@ class Run(Configurable):
         run_info = run_info_cls(
             key, version=version, timestamp=timestamp, config=self.config
         )
-        self.save_run_info(samples, run_info)
+        self.save_run_info(samples, run_info, cleanup=cleanup)
 
     def validate_run(self, samples, key, overwrite=True):
         """Validates that the collection can accept this run.
@@ -341,7 +343,7 @@ class Run(Configurable):
             ) from e
 
     @classmethod
-    def save_run_info(cls, samples, run_info, overwrite=True):
+    def save_run_info(cls, samples, run_info, overwrite=True, cleanup=True):
         """Saves the run information on the collection.
 
         Args:
@@ -349,12 +351,14 @@ class Run(Configurable):
             run_info: a :class:`RunInfo`
             overwrite (True): whether to overwrite an existing run with the
                 same key
+            cleanup (True): whether to call :meth:`Run.cleanup` when
+                overwriting an existing run
         """
         key = run_info.key
 
         if key in cls.list_runs(samples):
             if overwrite:
-                cls.delete_run(samples, key)
+                cls.delete_run(samples, key, cleanup=cleanup)
             else:
                 raise ValueError(
                     "%s with key '%s' already exists"
@@ -556,27 +560,30 @@ class Run(Configurable):
         return view
 
     @classmethod
-    def delete_run(cls, samples, key):
+    def delete_run(cls, samples, key, cleanup=True):
         """Deletes the results associated with the given run key from the
         collection.
 
         Args:
             samples: a :class:`fiftyone.core.collections.SampleCollection`
             key: a run key
+            cleanup (True): whether to call :meth:`Run.cleanup` to delete
+                any fields populated by the run
         """
         run_doc = cls._get_run_doc(samples, key)
 
-        try:
-            # Cleanup after run, if possible
-            run_info = cls.get_run_info(samples, key)
-            run = run_info.config.build()
-            run.cleanup(samples, key)
-        except:
-            logger.warning(
-                "Unable to run cleanup() for the %s with key '%s'",
-                cls._run_str(),
-                key,
-            )
+        if cleanup:
+            try:
+                # Cleanup after run, if possible
+                run_info = cls.get_run_info(samples, key)
+                run = run_info.config.build()
+                run.cleanup(samples, key)
+            except:
+                logger.warning(
+                    "Unable to run cleanup() for the %s with key '%s'",
+                    cls._run_str(),
+                    key,
+                )
 
         dataset = samples._root_dataset
 
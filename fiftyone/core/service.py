@@ -19,8 +19,11 @@ import eta.core.utils as etau
 import fiftyone.constants as foc
 import fiftyone.core.config as focn
 import fiftyone.core.context as focx
+import fiftyone.core.utils as fou
 import fiftyone.service.util as fosu
 
+foo = fou.lazy_import("fiftyone.core.odm")
+
 
 logger = logging.getLogger(__name__)
 
@@ -321,6 +324,11 @@ class ServerService(Service):
             # so start a local server. If there actually is a fiftyone server
             # running that didn't respond to /fiftyone, the local server will
             # fail to start but the app will still connect successfully.
+
+            # The server connects to this process's database, which is only
+            # started on first use
+            foo.get_db_conn()
+
             super().start()
             self._wait_for_child_port(port=port)
         else:
@@ -6429,15 +6429,32 @@ class Take(ViewStage):
         stage = fo.Take(2, seed=51)
         view = dataset.add_stage(stage)
 
+        #
+        # Take two random samples using an index rather than sorting the
+        # entire dataset
+        #
+
+        stage = fo.Take(2, fast=True)
+        view = dataset.add_stage(stage)
+
     Args:
         size: the number of samples to return. If a non-positive number is
             provided, an empty view is returned
         seed (None): an optional random seed to use when selecting the samples
+        fast (False): whether to select the samples via an index on the
+            samples' random keys rather than sorting the entire collection.
+            In this mode, the cost of the stage is proportional to ``size``,
+            but the samples are a contiguous run of the collection's fixed
+            random order starting at a random position, so samples that are
+            adjacent in this order are always selected together. The index is
+            created the first time this mode is used. Collections with frame
+            fields or groups always use the exact method
     """
 
-    def __init__(self, size, seed=None, _randint=None):
+    def __init__(self, size, seed=None, fast=False, _randint=None):
         self._seed = seed
         self._size = size
+        self._fast = fast
         self._randint = _randint or _get_rng(seed).randint(1e7, 1e10)
 
     @property
@@ -6450,10 +6467,18 @@ class Take(ViewStage):
         """The random seed to use, or ``None``."""
         return self._seed
 
-    def to_mongo(self, _):
+    @property
+    def fast(self):
+        """Whether to select the samples via an index."""
+        return self._fast
+
+    def to_mongo(self, sample_collection):
         if self._size <= 0:
             return [{"$match": {"_id": None}}]
 
+        if self._fast and _can_use_rand_index(sample_collection):
+            return self._to_mongo_fast(sample_collection)
+
         # @todo can we avoid creating a new field here?
         return [
             {"$set": {"_rand_take": {"$mod": [self._randint, "$_rand"]}}},
@@ -6462,10 +6487,47 @@ class Take(ViewStage):
             {"$unset": "_rand_take"},
         ]
 
+    def _to_mongo_fast(self, sample_collection):
+        # We select the first `size` samples whose `_rand` value is at least a
+        # random pivot, wrapping around to the smallest values if necessary.
+        # Both branches are index range scans. The range of `_rand` values
+        # depends on how the collection was generated (e.g., patches datasets
+        # use [0, 1)), so the pivot is drawn from its actual range
+        rand_min, rand_max = _get_rand_range(sample_collection)
+        pivot = (
+            rand_min
+            + (rand_max - rand_min) * random.Random(self._randint).random()
+        )
+
+        return [
+            {"$match": {"_rand": {"$gte": pivot}}},
+            {"$sort": {"_rand": 1}},
+            {"$limit": self._size},
+            {
+                "$unionWith": {
+                    "coll": sample_collection._dataset._sample_collection_name,
+                    "pipeline": sample_collection._pipeline(
+                        detach_frames=True, detach_groups=True
+                    )
+                    + [
+                        {"$match": {"_rand": {"$lt": pivot}}},
+                        {"$sort": {"_rand": 1}},
+                        {"$limit": self._size},
+                    ],
+                }
+            },
+            {"$limit": self._size},
+        ]
+
+    def validate(self, sample_collection):
+        if self._fast and _can_use_rand_index(sample_collection):
+            sample_collection.create_index("_rand")
+
     def _kwargs(self):
         return [
             ["size", self._size],
             ["seed", self._seed],
+            ["fast", self._fast],
             ["_randint", self._randint],
         ]
 
@@ -6479,6 +6541,12 @@ class Take(ViewStage):
                 "default": "None",
                 "placeholder": "seed (default=None)",
             },
+            {
+                "name": "fast",
+                "type": "bool",
+                "default": "False",
+                "placeholder": "fast (default=False)",
+            },
             {"name": "_randint", "type": "NoneType|int", "default": "None"},
         ]
 
@@ -7176,6 +7244,29 @@ def _get_group_id(sample_or_group):
     raise ValueError("Sample '%s' has no group" % sample.id)
 
 
+def _can_use_rand_index(sample_collection):
+    # Frames and groups may be attached at the start of a collection's
+    # pipeline, so the union branch of the fast path would be inconsistent
+    return (
+        sample_collection.media_type != fom.GROUP
+        and not sample_collection._has_frame_fields()
+    )
+
+
+def _get_rand_range(sample_collection):
+    # Returns the minimum and maximum `_rand` values of the collection's
+    # dataset, which are index lookups
+    coll = sample_collection._dataset._sample_collection
+    query = {"_rand": {"$type": "number"}}
+
+    bounds = []
+    for order in (1, -1):
+        doc = coll.find_one(query, {"_rand": True}, sort=[("_rand", order)])
+        bounds.append(doc["_rand"] if doc is not None else 0)
+
+    return tuple(bounds)
+
+
 def _get_rng(seed):
     if seed is None:
         return random
@@ -1298,7 +1298,7 @@ def serialize_numpy_array(array, ascii=False):
 
 def deserialize_numpy_array(numpy_bytes, ascii=False):
     """Loads a serialized numpy array generated by
-    :func:`serialize_numpy_array`.
+    :func:`serialize_numpy_array` or :func:`encode_numpy_array`.
 
     Args:
         numpy_bytes: the serialized numpy array bytes
@@ -1311,10 +1311,133 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     if ascii:
         numpy_bytes = b64decode(numpy_bytes.encode("ascii"))
 
+    if is_encoded_numpy_array(numpy_bytes):
+        return decode_numpy_array(numpy_bytes)
+
     with io.BytesIO(zlib.decompress(numpy_bytes)) as f:
         return np.load(f)
 
 
+# Header of arrays encoded via `encode_numpy_array()`. The first byte cannot
+# begin a zlib stream, so these arrays are distinguishable from those
+# generated by `serialize_numpy_array()`
+_ARRAY_MAGIC = b"\x93FOA"
+_ARRAY_VERSION = 1
+_ARRAY_HEADER = struct.Struct("<4sBBBB")  # magic, version, codec, dtype, ndim
+_ARRAY_CODECS = {None: 0, "zlib": 1, "lz4": 2}
+
+
+def encode_numpy_array(array, compression="zlib", compression_level=1):
+    """Encodes a numpy array in a compact binary format consisting of a fixed
+    header followed by the raw (optionally compressed) array bytes.
+
+    This format is much faster to encode and decode than the format generated
+    by :func:`serialize_numpy_array`. Encoded arrays can be decoded via
+    :func:`decode_numpy_array` or :func:`deserialize_numpy_array`.
+
+    Args:
+        array: a numpy array-like
+        compression ("zlib"): the compression to apply to the array bytes.
+            Supported values are ``("zlib", "lz4", None)``. The ``lz4``
+            package must be installed to use ``"lz4"``
+        compression_level (1): the compression level to use. Only applicable
+            when ``compression`` is ``"zlib"``
+
+    Returns:
+        the encoded bytes
+    """
+    if compression not in _ARRAY_CODECS:
+        raise ValueError(
+            "Unsupported compression '%s'; supported values are %s"
+            % (compression, tuple(_ARRAY_CODECS.keys()))
+        )
+
+    array = np.ascontiguousarray(array)
+    if array.dtype.hasobject:
+        raise ValueError("Cannot encode arrays of type %s" % array.dtype)
+
+    dtype = array.dtype.str.encode("ascii")
+    header = _ARRAY_HEADER.pack(
+        _ARRAY_MAGIC,
+        _ARRAY_VERSION,
+        _ARRAY_CODECS[compression],
+        len(dtype),
+        array.ndim,
+    )
+    shape = struct.pack("<%dQ" % array.ndim, *array.shape)
+
+    data = array.data
+    if compression == "zlib":
+        data = zlib.compress(data, compression_level)
+    elif compression == "lz4":
+        data = _get_lz4().compress(data)
+
+    return b"".join((header, dtype, shape, data))
+
+
+def decode_numpy_array(array_bytes, writable=True):
+    """Decodes a numpy array that was encoded via :func:`encode_numpy_array`.
+
+    Args:
+        array_bytes: the encoded bytes
+        writable (True): whether the returned array must be writable. If
+            False, uncompressed arrays are returned as zero-copy, read-only
+            views into ``array_bytes``
+
+    Returns:
+        the numpy array
+    """
+    view = memoryview(array_bytes)
+
+    magic, version, codec, dtype_len, ndim = _ARRAY_HEADER.unpack_from(view)
+    if magic != _ARRAY_MAGIC:
+        raise ValueError("Bytes do not contain an encoded array")
+
+    if version > _ARRAY_VERSION:
+        raise ValueError(
+            "Cannot decode array encoded with version %d; this version of "
+            "FiftyOne supports versions <= %d" % (version, _ARRAY_VERSION)
+        )
+
+    offset = _ARRAY_HEADER.size
+    dtype = np.dtype(bytes(view[offset : offset + dtype_len]).decode("ascii"))
+    offset += dtype_len
+    shape = struct.unpack_from("<%dQ" % ndim, view, offset)
+    offset += 8 * ndim
+
+    if codec == _ARRAY_CODECS["zlib"]:
+        data = bytearray(zlib.decompress(view[offset:]))
+    elif codec == _ARRAY_CODECS["lz4"]:
+        data = bytearray(_get_lz4().decompress(view[offset:]))
+    elif writable:
+        data = bytearray(view[offset:])
+    else:
+        data = view[offset:]
+
+    return np.frombuffer(data, dtype=dtype).reshape(shape)
+
+
+def is_encoded_numpy_array(array_bytes):
+    """Determines whether the given bytes were generated by
+    :func:`encode_numpy_array`.
+
+    Args:
+        array_bytes: the bytes
+
+    Returns:
+        True/False
+    """
+    return bytes(array_bytes[: len(_ARRAY_MAGIC)]) == _ARRAY_MAGIC
+
+
+def _get_lz4():
+    ensure_import("lz4")
+
+    import lz4.frame
+
+    return lz4.frame
+
+
 def iter_batches(iterable, batch_size):
     """Iterates over the given iterable in batches.
 
@@ -7,11 +7,19 @@ Video frame views.
 """
 from collections import defaultdict
 from copy import deepcopy
+import hashlib
+import json
 import logging
 import os
+import socket
+import threading
+import time
+import uuid
 
 from bson import ObjectId
+import psutil
 from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
 import eta.core.utils as etau
 
@@ -31,6 +39,24 @@ fouv = fou.lazy_import("fiftyone.utils.video")
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of frames that are buffered in memory while generating frames
+# datasets before they are committed to the database
+_FRAMES_BATCH_SIZE = 10000
+
+# Key in the `info` of a frames dataset that records the progress of its
+# generation, if it has not yet completed
+_CHECKPOINT_KEY = "_frames_checkpoint"
+
+# Number of seconds after which the checkpoint of a frames dataset whose
+# generation is owned by a process on another machine is considered abandoned
+_CHECKPOINT_LEASE_TIMEOUT = 3600
+
+# Tokens of the frames dataset generations that are running in this process
+_active_checkpoints = set()
+_active_checkpoints_lock = threading.Lock()
+
+_DUPLICATE_KEY_ERROR = 11000
+
 
 class FrameView(fos.SampleView):
     """A frame in a :class:`FramesView`.
@@ -437,6 +463,8 @@ def make_frames_dataset(
     rel_dir=None,
     frames_patt=None,
     force_sample=False,
+    num_workers=None,
+    timeout=None,
     skip_failures=True,
     verbose=False,
     name=None,
@@ -511,6 +539,23 @@ def make_frames_dataset(
         True, existing frames will not be resampled unless you set
         ``force_sample`` to True.
 
+    .. note::
+
+        Videos are processed in chunks and progress is checkpointed after
+        each chunk. If generation is interrupted, calling this method again
+        with the same collection and parameters resumes from the last
+        completed chunk rather than starting over.
+
+        To make this possible, the frames dataset is persistent until its
+        generation completes, so a partially generated dataset remains in the
+        database after an interruption, even if the process exits, until it
+        is resumed or deleted. Videos are processed in order of their IDs.
+
+        A partially generated dataset is only resumed once the process that
+        was generating it has exited, or, if that process ran on another
+        machine, once it has not recorded progress for an hour. Concurrent
+        calls with the same parameters generate separate datasets.
+
     .. note::
 
         The returned dataset is independent from the source collection;
@@ -559,6 +604,12 @@ def make_frames_dataset(
             ``fiftyone.config.default_sequence_idx + fiftyone.config.default_image_ext``
         force_sample (False): whether to resample videos whose sampled frames
             already exist. Only applicable when ``sample_frames=True``
+        num_workers (None): the number of worker processes to use when
+            sampling frames. By default, videos are sampled serially. Only
+            applicable when ``sample_frames=True``
+        timeout (None): an optional timeout, in seconds, after which sampling
+            a video is aborted and treated as a failure. Only applicable when
+            ``sample_frames=True``
         skip_failures (True): whether to gracefully continue without raising
             an error if a video cannot be sampled
         verbose (False): whether to log information about the frames that will
@@ -584,12 +635,104 @@ def make_frames_dataset(
         )
 
     #
-    # Create dataset with proper schema
+    # Create dataset with proper schema, or resume generating a dataset whose
+    # generation was previously interrupted
     #
 
-    dataset = fod.Dataset(name=name, _frames=True)
-    dataset.media_type = fom.IMAGE
-    dataset.add_sample_field("sample_id", fof.ObjectIdField)
+    checkpoint_key = _make_checkpoint_key(
+        sample_collection,
+        dict(
+            sample_frames=sample_frames,
+            fps=fps,
+            max_fps=max_fps,
+            size=size,
+            min_size=min_size,
+            max_size=max_size,
+            sparse=sparse,
+            output_dir=output_dir,
+            rel_dir=rel_dir,
+            frames_patt=frames_patt,
+            force_sample=force_sample,
+        ),
+    )
+
+    token = uuid.uuid4().hex
+    with _active_checkpoints_lock:
+        _active_checkpoints.add(token)
+
+    try:
+        dataset = _make_frames_dataset(
+            sample_collection,
+            checkpoint_key,
+            token,
+            sample_frames,
+            output_dir,
+            rel_dir,
+            frames_patt,
+            fps,
+            max_fps,
+            size,
+            min_size,
+            max_size,
+            sparse,
+            force_sample,
+            num_workers,
+            timeout,
+            skip_failures,
+            verbose,
+            name,
+        )
+    finally:
+        with _active_checkpoints_lock:
+            _active_checkpoints.discard(token)
+
+    if sample_frames == False and not dataset:
+        logger.warning(
+            "Your frames view is empty. Note that you must either "
+            "pre-populate the `filepath` field on the frames of your video "
+            "collection or pass `sample_frames=True` to this method to "
+            "perform the sampling. See "
+            "https://voxel51.com/docs/fiftyone/user_guide/using_views.html#frame-views "
+            "for more information."
+        )
+
+    return dataset
+
+
+def _make_frames_dataset(
+    sample_collection,
+    checkpoint_key,
+    token,
+    sample_frames,
+    output_dir,
+    rel_dir,
+    frames_patt,
+    fps,
+    max_fps,
+    size,
+    min_size,
+    max_size,
+    sparse,
+    force_sample,
+    num_workers,
+    timeout,
+    skip_failures,
+    verbose,
+    name,
+):
+    dataset, last_id = _load_checkpoint(checkpoint_key, token)
+
+    if dataset is None:
+        dataset = fod.Dataset(name=name, _frames=True)
+        dataset.media_type = fom.IMAGE
+        dataset.add_sample_field("sample_id", fof.ObjectIdField)
+
+        # Non-persistent datasets are deleted when the process exits, so the
+        # dataset is persistent until generation completes
+        dataset.persistent = True
+        _save_checkpoint(dataset, checkpoint_key, token, last_id)
+    else:
+        logger.info("Resuming generation of frames dataset '%s'", dataset.name)
 
     frame_schema = sample_collection.get_frame_field_schema()
     dataset._sample_doc_cls.merge_field_schema(frame_schema)
@@ -602,8 +745,8 @@ def make_frames_dataset(
 
     _make_pretty_summary(dataset)
 
-    # Initialize frames dataset
-    sample_view, frames_to_sample = _init_frames(
+    # Initialize frames dataset, sampling frames if necessary
+    _init_frames(
         dataset,
         sample_collection,
         sample_frames,
@@ -612,29 +755,20 @@ def make_frames_dataset(
         frames_patt,
         fps,
         max_fps,
+        size,
+        min_size,
+        max_size,
         sparse,
         force_sample,
+        num_workers,
+        timeout,
+        skip_failures,
         verbose,
+        checkpoint_key,
+        token,
+        last_id,
     )
 
-    # Sample frames, if necessary
-    if sample_view is not None:
-        logger.info("Sampling video frames...")
-        fouv.sample_videos(
-            sample_view,
-            output_dir=output_dir,
-            rel_dir=rel_dir,
-            frames_patt=frames_patt,
-            frames=frames_to_sample,
-            size=size,
-            min_size=min_size,
-            max_size=max_size,
-            original_frame_numbers=True,
-            force_sample=True,
-            save_filepaths=True,
-            skip_failures=skip_failures,
-        )
-
     # Merge frame data
     pipeline = []
 
@@ -658,15 +792,11 @@ def make_frames_dataset(
     if sample_frames == True:
         dataset._sample_collection.delete_many({"filepath": None})
 
-    if sample_frames == False and not dataset:
-        logger.warning(
-            "Your frames view is empty. Note that you must either "
-            "pre-populate the `filepath` field on the frames of your video "
-            "collection or pass `sample_frames=True` to this method to "
-            "perform the sampling. See "
-            "https://voxel51.com/docs/fiftyone/user_guide/using_views.html#frame-views "
-            "for more information."
-        )
+    _clear_checkpoint(dataset)
+    dataset.persistent = False
+
+    if name is not None and dataset.name != name:
+        dataset.name = name
 
     return dataset
 
@@ -678,6 +808,87 @@ def _make_pretty_summary(dataset):
     dataset._sample_doc_cls._fields_ordered = tuple(pretty_fields)
 
 
+def _make_checkpoint_key(sample_collection, config):
+    state = {
+        "dataset": sample_collection.dataset_name,
+        "stages": sample_collection.view()._serialize(include_uuids=False),
+        "config": config,
+    }
+    state_str = json.dumps(state, sort_keys=True, default=str)
+    return hashlib.sha1(state_str.encode()).hexdigest()
+
+
+def _load_checkpoint(checkpoint_key, token):
+    # Returns a partially generated frames dataset with the given checkpoint
+    # key that is no longer being generated, after claiming it on behalf of
+    # `token`, and the ID of the last video whose frames were committed
+    conn = foo.get_db_conn()
+    path = "info." + _CHECKPOINT_KEY
+    dataset_docs = conn.datasets.find(
+        {path + ".key": checkpoint_key}, {"name": True, path: True}
+    )
+
+    for dataset_doc in dataset_docs:
+        checkpoint = dataset_doc["info"][_CHECKPOINT_KEY]
+        owner = checkpoint.get("owner", None)
+        if not _is_abandoned(owner):
+            continue
+
+        # Claim the checkpoint, unless another process claimed it first
+        result = conn.datasets.update_one(
+            {"_id": dataset_doc["_id"], path + ".owner": owner},
+            {"$set": {path + ".owner": _make_owner(token)}},
+        )
+        if result.modified_count != 1:
+            continue
+
+        dataset = fod.load_dataset(dataset_doc["name"])
+        last_id = checkpoint.get("last_id", None)
+        if last_id is not None:
+            last_id = ObjectId(last_id)
+
+        return dataset, last_id
+
+    return None, None
+
+
+def _save_checkpoint(dataset, checkpoint_key, token, last_id):
+    dataset.info[_CHECKPOINT_KEY] = {
+        "key": checkpoint_key,
+        "owner": _make_owner(token),
+        "last_id": str(last_id) if last_id is not None else None,
+    }
+    dataset.save()
+
+
+def _make_owner(token):
+    return {
+        "hostname": socket.gethostname(),
+        "pid": os.getpid(),
+        "token": token,
+        "heartbeat": time.time(),
+    }
+
+
+def _is_abandoned(owner):
+    if not owner:
+        return True
+
+    if owner["hostname"] != socket.gethostname():
+        return time.time() - owner["heartbeat"] > _CHECKPOINT_LEASE_TIMEOUT
+
+    if owner["pid"] == os.getpid():
+        with _active_checkpoints_lock:
+            return owner["token"] not in _active_checkpoints
+
+    return not psutil.pid_exists(owner["pid"])
+
+
+def _clear_checkpoint(dataset):
+    if dataset.info.pop(_CHECKPOINT_KEY, None) is not None:
+        dataset.save()
+
+
 def _init_frames(
     dataset,
     src_collection,
@@ -687,9 +898,18 @@ def _init_frames(
     frames_patt,
     fps,
     max_fps,
+    size,
+    min_size,
+    max_size,
     sparse,
     force_sample,
+    num_workers,
+    timeout,
+    skip_failures,
     verbose,
+    checkpoint_key,
+    token,
+    last_id,
 ):
     if (
         (sample_frames != False and not sparse)
@@ -705,6 +925,11 @@ def _init_frames(
     #
     # Initialize frames dataset with proper frames
     #
+    # Videos are processed in chunks of roughly `_FRAMES_BATCH_SIZE` frames.
+    # After each chunk, its frame documents are inserted, its frame images are
+    # sampled (if necessary), and a checkpoint is recorded so that an
+    # interrupted generation can resume from the last completed chunk
+    #
 
     docs = []
     src_docs = []
@@ -715,6 +940,20 @@ def _init_frames(
     sample_map = defaultdict(set)
     frame_map = defaultdict(set)
 
+    num_pending_frames = 0
+
+    sample_kwargs = dict(
+        output_dir=output_dir,
+        rel_dir=rel_dir,
+        frames_patt=frames_patt,
+        size=size,
+        min_size=min_size,
+        max_size=max_size,
+        num_workers=num_workers,
+        timeout=timeout,
+        skip_failures=skip_failures,
+    )
+
     src_dataset = src_collection._root_dataset
     is_clips = src_collection._dataset._is_clips
     if src_collection.has_frame_field("filepath"):
@@ -722,6 +961,13 @@ def _init_frames(
     else:
         view = src_collection.select_fields()
 
+    # Videos are processed in order of their IDs so that an interrupted
+    # generation can resume after the last committed video
+    if last_id is not None:
+        view = view.mongo([{"$match": {"_id": {"$gt": last_id}}}])
+
+    view = view.mongo([{"$sort": {"_id": 1}}])
+
     for sample in view._aggregate(attach_frames=True):
         video_path = sample["filepath"]
         tags = sample.get("tags", [])
@@ -835,9 +1081,59 @@ def _init_frames(
             docs.append(doc)
 
             # Commit batch of docs to frames dataset
-            if len(docs) >= 10000:
+            if len(docs) >= _FRAMES_BATCH_SIZE:
                 _insert_docs(docs, src_docs, src_inds, dataset, src_dataset)
 
+        pending_id = sample["_id"]
+        num_pending_frames += len(doc_frame_numbers)
+
+        # Commit chunk of videos
+        if num_pending_frames >= _FRAMES_BATCH_SIZE:
+            _commit_frames(
+                docs,
+                src_docs,
+                src_inds,
+                missing_filepaths,
+                id_map,
+                sample_map,
+                dataset,
+                src_dataset,
+                sample_kwargs,
+            )
+
+            last_id = pending_id
+            _save_checkpoint(dataset, checkpoint_key, token, last_id)
+
+            # Overlapping clips in later chunks are deduplicated by the unique
+            # frames index rather than in memory
+            frame_map.clear()
+            num_pending_frames = 0
+
+    # Commit remaining videos
+    _commit_frames(
+        docs,
+        src_docs,
+        src_inds,
+        missing_filepaths,
+        id_map,
+        sample_map,
+        dataset,
+        src_dataset,
+        sample_kwargs,
+    )
+
+
+def _commit_frames(
+    docs,
+    src_docs,
+    src_inds,
+    missing_filepaths,
+    id_map,
+    sample_map,
+    dataset,
+    src_dataset,
+    sample_kwargs,
+):
     # Add remaining docs to frames dataset
     _insert_docs(docs, src_docs, src_inds, dataset, src_dataset)
 
@@ -857,6 +1153,7 @@ def _init_frames(
             for _sample_id, fn, filepath in missing_filepaths
         ]
         src_dataset._bulk_write(ops, frames=True)
+        missing_filepaths.clear()
 
     #
     # Finalize which frame images need to be sampled, if any
@@ -875,22 +1172,33 @@ def _init_frames(
 
         frames_to_sample.append(sample_frame_numbers)
 
-    if ids_to_sample:
-        if src_dataset.media_type == fom.GROUP:
-            sample_view = src_dataset.select_group_slices(media_type=fom.VIDEO)
-        else:
-            sample_view = src_dataset
+    id_map.clear()
+    sample_map.clear()
 
-        sample_view = sample_view.select(ids_to_sample, ordered=True)
-    else:
-        sample_view = None
+    if not ids_to_sample:
+        return
 
-    return sample_view, frames_to_sample
+    if src_dataset.media_type == fom.GROUP:
+        sample_view = src_dataset.select_group_slices(media_type=fom.VIDEO)
+    else:
+        sample_view = src_dataset
+
+    sample_view = sample_view.select(ids_to_sample, ordered=True)
+
+    logger.info("Sampling video frames...")
+    fouv.sample_videos(
+        sample_view,
+        frames=frames_to_sample,
+        original_frame_numbers=True,
+        force_sample=True,
+        save_filepaths=True,
+        **sample_kwargs,
+    )
 
 
 def _insert_docs(docs, src_docs, src_inds, dataset, src_dataset):
     if src_docs:
-        foo.insert_documents(src_docs, src_dataset._frame_collection)
+        _insert_new_docs(src_docs, src_dataset._frame_collection)
 
         for idx, src_doc in enumerate(src_docs):
             docs[src_inds[idx]]["_id"] = src_doc["_id"]
@@ -899,10 +1207,21 @@ def _insert_docs(docs, src_docs, src_inds, dataset, src_dataset):
         src_inds.clear()
 
     if docs:
-        foo.insert_documents(docs, dataset._sample_collection)
+        _insert_new_docs(docs, dataset._sample_collection)
         docs.clear()
 
 
+def _insert_new_docs(docs, coll):
+    # Frames that already exist, e.g. because they were inserted before an
+    # interrupted generation or by an overlapping clip, are skipped
+    try:
+        coll.insert_many(docs, ordered=False)
+    except BulkWriteError as bwe:
+        for error in bwe.details["writeErrors"]:
+            if error["code"] != _DUPLICATE_KEY_ERROR:
+                raise ValueError(error["errmsg"]) from bwe
+
+
 def _parse_video_frames(
     video_path,
     sample_frames,
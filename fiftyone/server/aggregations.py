@@ -20,6 +20,7 @@ import fiftyone.core.media as fom
 from fiftyone.core.utils import datetime_to_timestamp
 import fiftyone.core.view as fov
 
+import fiftyone.server.cache as fosc
 from fiftyone.server.constants import LIST_LIMIT
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 from fiftyone.server.scalars import BSON, BSONArray
@@ -117,7 +118,7 @@ AggregateResult = gql.union(
 async def aggregate_resolver(
     form: AggregationForm,
 ) -> t.List[AggregateResult]:
-    view = fosv.get_view(
+    view = await fosv.get_view(
         form.dataset,
         stages=form.view,
         filters=form.filters,
@@ -154,7 +155,12 @@ async def aggregate_resolver(
     for aggs in aggregations:
         flattened += aggs
 
-    result = await view._async_aggregate(flattened)
+    key = await fosc.make_key(form.dataset, "aggregate", form)
+    result = fosc.aggregations.get(key)
+    if result is None:
+        result = await view._async_aggregate(flattened)
+        fosc.aggregations.set(key, result)
+
     results = []
     offset = 0
     for length, deserialize in zip(counts, deserializers):
@@ -162,7 +168,7 @@ async def aggregate_resolver(
         offset += length
 
     if form.mixed and "" in form.paths:
-        slice_view = fosv.get_view(
+        slice_view = await fosv.get_view(
             form.dataset,
             stages=form.view,
             filters=form.filters,
@@ -172,9 +178,15 @@ async def aggregate_resolver(
             ),
         )
 
+        slice_key = await fosc.make_key(form.dataset, "aggregate_slice", form)
+        slice_count = fosc.aggregations.get(slice_key)
+        if slice_count is None:
+            slice_count = await slice_view._async_aggregate(foa.Count())
+            fosc.aggregations.set(slice_key, slice_count)
+
         for result in results:
             if isinstance(result, RootAggregation):
-                result.slice = await slice_view._async_aggregate(foa.Count())
+                result.slice = slice_count
                 break
 
     return results
@@ -0,0 +1,263 @@
+"""
+FiftyOne Server caching
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+import hashlib
+import sys
+import threading
+import timeit
+
+from bson import json_util
+
+import fiftyone.core.odm as foo
+
+from fiftyone.server.constants import (
+    AGGREGATION_CACHE_MAX_BYTES,
+    CACHE_TTL,
+    DATASET_TOKEN_CACHE_MAX_ENTRIES,
+    DATASET_TOKEN_TTL,
+    PIPELINE_CACHE_MAX_ENTRIES,
+    VIEW_CACHE_MAX_ENTRIES,
+)
+
+
+class LRUCache(object):
+    """A thread-safe least-recently-used cache whose keys are tuples whose
+    first element is a dataset name.
+
+    Args:
+        max_size: the maximum total size of the cached values
+        size_fcn (None): an optional function that computes the size of a
+            value. By default, each value has size 1
+        ttl (None): an optional number of seconds after which entries expire
+    """
+
+    def __init__(self, max_size, size_fcn=None, ttl=None):
+        self.max_size = max_size
+        self.size_fcn = size_fcn
+        self.ttl = ttl
+
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self):
+        """The total size of the values in the cache."""
+        return self._size
+
+    def get(self, key, default=None):
+        """Retrieves the value for the given key, if it exists.
+
+        Args:
+            key: the key
+            default (None): a value to return if the key is not in the cache
+
+        Returns:
+            the value, or ``default``
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return default
+
+            value, size, created_at = entry
+            if (
+                self.ttl is not None
+                and timeit.default_timer() - created_at > self.ttl
+            ):
+                self._pop(key)
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Adds the given value to the cache, evicting the least recently used
+        values if necessary.
+
+        Args:
+            key: the key
+            value: the value
+        """
+        size = self.size_fcn(value) if self.size_fcn is not None else 1
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+
+            self._entries[key] = (value, size, timeit.default_timer())
+            self._size += size
+
+            while self._size > self.max_size:
+                self._pop(next(iter(self._entries)))
+
+    def get_or_set(self, key, fcn):
+        """Retrieves the value for the given key, computing and caching it via
+        the provided function if necessary.
+
+        Args:
+            key: the key
+            fcn: a function that returns the value
+
+        Returns:
+            the value
+        """
+        value = self.get(key)
+        if value is None:
+            value = fcn()
+            self.set(key, value)
+
+        return value
+
+    def clear(self, dataset_name=None):
+        """Removes entries from the cache.
+
+        Args:
+            dataset_name (None): the name of a dataset whose entries to remove.
+                By default, all entries are removed
+        """
+        with self._lock:
+            if dataset_name is None:
+                self._entries.clear()
+                self._size = 0
+                return
+
+            for key in list(self._entries.keys()):
+                if key[0] == dataset_name:
+                    self._pop(key)
+
+    def _pop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+
+def get_size(value):
+    """Estimates the in-memory size of the given JSON-like value, in bytes.
+
+    Args:
+        value: a value
+
+    Returns:
+        the size, in bytes
+    """
+    size = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += get_size(k) + get_size(v)
+    elif isinstance(value, (list, tuple, set)):
+        for v in value:
+            size += get_size(v)
+
+    return size
+
+
+async def get_dataset_token(dataset_name):
+    """Returns a token that changes whenever the given dataset's document or
+    the number of its samples/frames change.
+
+    The token is computed via the async database client. Edits to existing
+    samples that do not change these values are picked up when the server's
+    caches are explicitly cleared, which happens whenever the App's state is
+    updated (e.g., via :meth:`fiftyone.core.session.Session.refresh`) and
+    when the App tags samples or labels, and otherwise after
+    ``fiftyone.server.constants.CACHE_TTL`` seconds.
+
+    Tokens are cached for ``fiftyone.server.constants.DATASET_TOKEN_TTL``
+    seconds, so repeated calls do not each require database queries.
+
+    Args:
+        dataset_name: the dataset name
+
+    Returns:
+        a token string, or None if the dataset does not exist
+    """
+    key = (dataset_name,)
+    token = tokens.get(key)
+    if token is None:
+        token = await _load_dataset_token(dataset_name)
+        tokens.set(key, token)
+
+    return token
+
+
+async def make_key(dataset_name, *args):
+    """Generates a cache key for the given dataset and arguments.
+
+    The key incorporates the dataset's current token, so entries are
+    implicitly invalidated when the dataset changes.
+
+    Args:
+        dataset_name: the dataset name
+        *args: JSON-serializable arguments (dataclasses are also supported)
+
+    Returns:
+        a key tuple
+    """
+    token = await get_dataset_token(dataset_name)
+    return (dataset_name, token, _hash(args))
+
+
+def clear(dataset_name=None):
+    """Clears all server caches.
+
+    Args:
+        dataset_name (None): the name of a dataset whose entries to remove. By
+            default, all entries are removed
+    """
+    tokens.clear(dataset_name=dataset_name)
+    views.clear(dataset_name=dataset_name)
+    pipelines.clear(dataset_name=dataset_name)
+    aggregations.clear(dataset_name=dataset_name)
+
+
+async def _load_dataset_token(dataset_name):
+    db = foo.get_async_db_conn()
+    doc = await db.datasets.find_one(
+        {"name": dataset_name}, {"last_loaded_at": False}
+    )
+    if doc is None:
+        return None
+
+    counts = [
+        await db[doc["sample_collection_name"]].estimated_document_count()
+    ]
+
+    frame_collection_name = doc.get("frame_collection_name", None)
+    if frame_collection_name:
+        counts.append(
+            await db[frame_collection_name].estimated_document_count()
+        )
+
+    return _hash([doc, counts])
+
+
+def _hash(obj):
+    s = json_util.dumps(obj, sort_keys=True, default=_serialize)
+    return hashlib.md5(s.encode()).hexdigest()
+
+
+def _serialize(obj):
+    if is_dataclass(obj):
+        return asdict(obj)
+
+    return str(obj)
+
+
+tokens = LRUCache(DATASET_TOKEN_CACHE_MAX_ENTRIES, ttl=DATASET_TOKEN_TTL)
+views = LRUCache(VIEW_CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+pipelines = LRUCache(PIPELINE_CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+aggregations = LRUCache(
+    AGGREGATION_CACHE_MAX_BYTES, size_fcn=get_size, ttl=CACHE_TTL
+)
@@ -5,5 +5,26 @@ FiftyOne Server constants
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+
+import fiftyone.constants as foc
+
 
 LIST_LIMIT = 200
+
+# Server caches; entries are invalidated when their dataset changes and expire
+# after `CACHE_TTL` seconds
+CACHE_TTL = 60
+VIEW_CACHE_MAX_ENTRIES = 256
+PIPELINE_CACHE_MAX_ENTRIES = 1024
+AGGREGATION_CACHE_MAX_BYTES = 64 * 1024**2
+
+# Dataset tokens, which determine when cache entries are invalidated, are
+# reloaded from the database at most every `DATASET_TOKEN_TTL` seconds
+DATASET_TOKEN_TTL = 1
+DATASET_TOKEN_CACHE_MAX_ENTRIES = 256
+
+# Persistent cache of media metadata computed by the App server
+MEDIA_METADATA_CACHE_PATH = os.path.join(
+    foc.FIFTYONE_CONFIG_DIR, "var", "media_metadata.db"
+)
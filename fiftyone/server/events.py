@@ -27,6 +27,7 @@ from fiftyone.core.session.events import (
     StateUpdate,
 )
 import fiftyone.core.state as fos
+import fiftyone.server.cache as fosc
 from fiftyone.server.query import serialize_dataset
 
 
@@ -58,6 +59,10 @@ async def dispatch_event(
         global _state
         _state = event.state
 
+        if event.refresh:
+            # The dataset may have been modified by the session's process
+            fosc.clear()
+
     if isinstance(event, ReactivateNotebookCell):
         await dispatch_event(subscription, DeactivateNotebookCell())
 
@@ -6,13 +6,17 @@ FiftyOne Server JIT metadata utilities
 |
 """
 from enum import Enum
+import json
 import logging
 import shutil
+import sqlite3
 import struct
+import threading
 import typing as t
 
 import asyncio
 import aiofiles
+import aiofiles.os
 import strawberry as gql
 
 import eta.core.serial as etas
@@ -21,6 +25,7 @@ import eta.core.video as etav
 from fiftyone.core.collections import SampleCollection
 
 import fiftyone.core.media as fom
+from fiftyone.server.constants import MEDIA_METADATA_CACHE_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -81,8 +86,10 @@ async def get_metadata(
 
     if filepath not in metadata_cache:
         try:
-            # Retrieve media metadata from disk
-            metadata_cache[filepath] = await read_metadata(filepath, is_video)
+            # Retrieve media metadata from the persistent cache or from disk
+            metadata_cache[filepath] = await _read_metadata_cached(
+                filepath, is_video
+            )
         except Exception as exc:
             # Immediately fail so the user knows they should install FFmpeg
             if isinstance(exc, FFmpegNotFoundException):
@@ -120,6 +127,153 @@ async def read_metadata(filepath, is_video):
         return dict(aspect_ratio=width / height)
 
 
+class MediaMetadataCache(object):
+    """A persistent cache of media metadata stored in a local sqlite database.
+
+    Entries are keyed by filepath and are only valid as long as the
+    modification time and size of the file are unchanged, so metadata is
+    computed once per file and reused across requests and server restarts.
+
+    New entries are buffered in memory and written to the database in a single
+    transaction when :meth:`flush` is called.
+
+    Args:
+        path: the path to the sqlite database file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._conn = None
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def get(self, filepath, mtime, size):
+        """Retrieves the cached metadata for the given file, if possible.
+
+        Args:
+            filepath: the filepath
+            mtime: the file's modification time
+            size: the file's size, in bytes
+
+        Returns:
+            a metadata dict, or None if no valid entry exists
+        """
+        with self._lock:
+            row = self._pending.get(filepath, None)
+            if row is None:
+                conn = self._get_conn()
+                row = conn.execute(
+                    "SELECT mtime, size, metadata FROM media_metadata "
+                    "WHERE filepath = ?",
+                    (filepath,),
+                ).fetchone()
+
+        if row is None or row[0] != mtime or row[1] != size:
+            return None
+
+        return json.loads(row[2])
+
+    def set(self, filepath, mtime, size, metadata):
+        """Adds the metadata for the given file to the cache.
+
+        The entry is not written to the database until :meth:`flush` is
+        called.
+
+        Args:
+            filepath: the filepath
+            mtime: the file's modification time
+            size: the file's size, in bytes
+            metadata: a metadata dict
+        """
+        with self._lock:
+            self._pending[filepath] = (mtime, size, json.dumps(metadata))
+
+    def flush(self):
+        """Writes any pending entries to the database."""
+        with self._lock:
+            if not self._pending:
+                return
+
+            rows = [(f, *row) for f, row in self._pending.items()]
+
+            conn = self._get_conn()
+            conn.executemany(
+                "INSERT OR REPLACE INTO media_metadata "
+                "(filepath, mtime, size, metadata) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+
+            self._pending.clear()
+
+    def clear(self):
+        """Deletes all entries from the cache."""
+        with self._lock:
+            self._pending.clear()
+
+            conn = self._get_conn()
+            conn.execute("DELETE FROM media_metadata")
+            conn.commit()
+
+    def _get_conn(self):
+        if self._conn is None:
+            etau.ensure_basedir(self.path)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS media_metadata ("
+                "filepath TEXT PRIMARY KEY, "
+                "mtime REAL, "
+                "size INTEGER, "
+                "metadata TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+
+        return self._conn
+
+
+_media_metadata_cache = MediaMetadataCache(MEDIA_METADATA_CACHE_PATH)
+
+
+async def flush_metadata_cache():
+    """Writes any metadata that has been computed since the last flush to the
+    persistent media metadata cache.
+
+    The database is accessed in a worker thread so that the event loop is not
+    blocked.
+    """
+    try:
+        await _run_in_thread(_media_metadata_cache.flush)
+    except Exception as e:
+        logger.debug("Failed to write media metadata cache: %s", e)
+
+
+async def _read_metadata_cached(filepath, is_video):
+    try:
+        stat = await aiofiles.os.stat(filepath)
+        mtime, size = stat.st_mtime, stat.st_size
+        metadata = await _run_in_thread(
+            _media_metadata_cache.get, filepath, mtime, size
+        )
+    except Exception as e:
+        logger.debug("Failed to read media metadata cache: %s", e)
+        return await read_metadata(filepath, is_video)
+
+    if metadata is not None:
+        return metadata
+
+    metadata = await read_metadata(filepath, is_video)
+    _media_metadata_cache.set(filepath, mtime, size, metadata)
+
+    return metadata
+
+
+async def _run_in_thread(fcn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, fcn, *args)
+
+
 class Reader(object):
     """Asynchronous file-like reader.
 
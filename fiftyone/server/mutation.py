@@ -80,7 +80,7 @@ class Mutation:
         stages: BSONArray,
         sidebar_groups: t.List[SidebarGroupInput],
     ) -> bool:
-        view = get_view(dataset, stages)
+        view = await get_view(dataset, stages)
 
         current = (
             {
@@ -142,7 +142,7 @@ class Mutation:
         state.selected = []
         state.selected_labels = []
         if form:
-            view = get_view(
+            view = await get_view(
                 dataset,
                 view,
                 form.filters,
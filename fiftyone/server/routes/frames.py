@@ -28,7 +28,9 @@ class Frames(HTTPEndpoint):
         stages = data.get("view")
         sample_id = data.get("sampleId")
 
-        view = fosv.get_view(dataset, stages=stages, extended_stages=extended)
+        view = await fosv.get_view(
+            dataset, stages=stages, extended_stages=extended
+        )
         view = fov.make_optimized_select_view(view, sample_id)
 
         end_frame = min(num_frames + start_frame, frame_count)
@@ -25,13 +25,17 @@ class Samples(HTTPEndpoint):
         page_length = data.get("page_length", 20)
         slice = data.get("slice", None)
         extended = data.get("extended", None)
+        after = data.get("after", None)
+
+        if after is None:
+            after = str((page - 1) * page_length - 1)
 
         results = await paginate_samples(
             dataset,
             stages,
             filters,
             page_length,
-            (page - 1) * page_length - 1,
+            after,
             sample_filter=SampleFilter(group=GroupElementFilter(slice=slice)),
             extended_stages=extended,
         )
@@ -39,4 +43,5 @@ class Samples(HTTPEndpoint):
         return {
             "results": [asdict(edge.node) for edge in results.edges],
             "more": results.page_info.has_next_page,
+            "cursor": results.edges[-1].cursor if results.edges else None,
         }
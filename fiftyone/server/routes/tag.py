@@ -14,6 +14,7 @@ import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
 import fiftyone.core.view as fov
 
+import fiftyone.server.cache as fosc
 from fiftyone.server.decorators import route
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 import fiftyone.server.tags as fost
@@ -39,7 +40,7 @@ class Tag(HTTPEndpoint):
         slice = data.get("slice", None)
         group_id = data.get("group_id", None)
 
-        view = fost.get_tag_view(
+        view = await fost.get_tag_view(
             dataset,
             stages=stages,
             filters=filters,
@@ -60,10 +61,12 @@ class Tag(HTTPEndpoint):
         else:
             fosu.change_sample_tags(view, changes)
 
+        fosc.clear(dataset_name=dataset)
+
         if not modal:
             return {"samples": []}
 
-        view = fost.get_tag_view(
+        view = await fost.get_tag_view(
             dataset,
             stages=stages,
             filters=filters,
@@ -37,7 +37,7 @@ class Tagging(HTTPEndpoint):
         group_id = data.get("group_id", None)
         modal = data.get("modal", False)
 
-        view = fost.get_tag_view(
+        view = await fost.get_tag_view(
             dataset,
             stages=stages,
             filters=filters,
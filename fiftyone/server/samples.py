@@ -6,6 +6,7 @@ FiftyOne Server samples pagination
 |
 """
 import asyncio
+from bson import json_util
 from dacite import Config, from_dict
 import strawberry as gql
 import typing as t
@@ -16,6 +17,8 @@ from fiftyone.core.collections import SampleCollection
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+import fiftyone.core.stages as fosg
+import fiftyone.server.cache as fosc
 from fiftyone.server.filters import SampleFilter
 
 import fiftyone.server.metadata as fosm
@@ -63,6 +66,21 @@ MEDIA_TYPES = {
     fom.VIDEO: VideoSample,
 }
 
+# Pipeline operators that neither reorder, skip, nor duplicate samples. Views
+# whose pipelines only contain these operators support keyset pagination
+_KEYSET_OPERATORS = {
+    "$addFields",
+    "$lookup",
+    "$match",
+    "$project",
+    "$set",
+    "$unset",
+}
+
+# Hidden field that records the sort key of each sample when paginating views
+# that sort by a field
+_SORT_KEY = "_pagination_sort_key"
+
 
 async def paginate_samples(
     dataset: str,
@@ -73,7 +91,7 @@ async def paginate_samples(
     extended_stages: t.Optional[BSON] = None,
     sample_filter: t.Optional[SampleFilter] = None,
 ) -> Connection[t.Union[ImageSample, VideoSample], str]:
-    view = fosv.get_view(
+    view = await fosv.get_view(
         dataset,
         stages=stages,
         filters=filters,
@@ -84,7 +102,7 @@ async def paginate_samples(
         sample_filter=sample_filter,
     )
 
-    root_view = fosv.get_view(
+    root_view = await fosv.get_view(
         dataset,
         stages=stages,
     )
@@ -99,25 +117,55 @@ async def paginate_samples(
     if after is None:
         after = "-1"
 
-    view = view.skip(int(after) + 1)
+    manual_group_select = (
+        sample_filter
+        and sample_filter.group
+        and (sample_filter.group.id and not sample_filter.group.slice)
+    )
+
+    key = await fosc.make_key(
+        dataset, "samples", stages, filters, extended_stages, sample_filter
+    )
+    pipeline = fosv.get_pipeline(
+        view,
+        key,
+        attach_frames=True,
+        detach_frames=False,
+        manual_group_select=manual_group_select,
+        support=[1, 1],
+    )
 
-    samples = await foo.aggregate(
-        foo.get_async_db_conn()[view._dataset._sample_collection_name],
-        view._pipeline(
+    coll = foo.get_async_db_conn()[view._dataset._sample_collection_name]
+
+    sort_idx = _get_keyset_sort_index(view, pipeline)
+    if sort_idx is not None:
+        ((field, _),) = pipeline[sort_idx]["$sort"].items()
+        if not await _has_keyset_index(coll, field):
+            sort_idx = None
+
+    if sort_idx is not None:
+        # The view sorts by a single field with a `(field, _id)` index, so
+        # pages can be retrieved via an indexed range match
+        pipeline = _make_sort_keyset_pipeline(pipeline, sort_idx, after, first)
+    else:
+        view = view.skip(_parse_offset(after) + 1)
+        pipeline = view._pipeline(
             attach_frames=True,
             detach_frames=False,
-            manual_group_select=sample_filter
-            and sample_filter.group
-            and (sample_filter.group.id and not sample_filter.group.slice),
+            manual_group_select=manual_group_select,
             support=[1, 1],
-        ),
-    ).to_list(first + 1)
+        )
+
+    samples = await foo.aggregate(coll, pipeline).to_list(first + 1)
 
     more = False
     if len(samples) > first:
         samples = samples[:first]
         more = True
 
+    # The recorded sort keys are only needed for cursors
+    sort_keys = [sample.pop(_SORT_KEY, None) for sample in samples]
+
     metadata_cache = {}
     url_cache = {}
     nodes = await asyncio.gather(
@@ -126,15 +174,16 @@ async def paginate_samples(
             for sample in samples
         ]
     )
+    await fosm.flush_metadata_cache()
 
     edges = []
     for idx, node in enumerate(nodes):
-        edges.append(
-            Edge(
-                node=node,
-                cursor=str(idx + int(after) + 1),
-            )
-        )
+        if sort_idx is not None:
+            cursor = _make_sort_cursor(sort_keys[idx], samples[idx]["_id"])
+        else:
+            cursor = str(idx + int(after) + 1)
+
+        edges.append(Edge(node=node, cursor=cursor))
 
     return Connection(
         page_info=PageInfo(
@@ -147,6 +196,138 @@ async def paginate_samples(
     )
 
 
+def _get_keyset_sort_index(view, pipeline):
+    # Views that sort by a single non-list field, and whose pipelines contain
+    # no other operators that reorder, skip, or drop fields from samples,
+    # support keyset pagination on `(sort key, _id)`. Returns the index of the
+    # `$sort` stage in `pipeline`, or None if keyset pagination is unsupported
+    sort_stages = [
+        stage for stage in view._all_stages if isinstance(stage, fosg.SortBy)
+    ]
+    if len(sort_stages) != 1:
+        return None
+
+    field_or_expr = sort_stages[0]._get_mongo_field_or_expr()
+    if not isinstance(field_or_expr, str):
+        return None
+
+    parsed = view._parse_field_name(
+        field_or_expr, auto_unwind=False, allow_missing=True
+    )
+    path, is_frame_field, unwind_fields, list_fields, _ = parsed
+    if is_frame_field or unwind_fields or list_fields or path == "_id":
+        return None
+
+    sort_idx = None
+    for idx, stage in enumerate(pipeline):
+        if "$sort" in stage:
+            if sort_idx is not None or list(stage["$sort"].keys()) != [path]:
+                return None
+
+            sort_idx = idx
+        elif not set(stage.keys()).issubset(_KEYSET_OPERATORS):
+            return None
+        elif sort_idx is not None and _is_inclusion_project(stage):
+            return None
+
+    return sort_idx
+
+
+def _is_inclusion_project(stage):
+    project = stage.get("$project", None)
+    if not project:
+        return False
+
+    return any(v not in (0, False) for k, v in project.items() if k != "_id")
+
+
+async def _has_keyset_index(coll, field):
+    # The server never creates indexes, so keyset pagination is only used
+    # when the dataset already has an index on `(field, _id)`
+    index_info = await coll.index_information()
+    for info in index_info.values():
+        if any(k in info for k in ("sparse", "partialFilterExpression")):
+            continue
+
+        keys = info["key"]
+        if (
+            len(keys) >= 2
+            and keys[0][0] == field
+            and keys[1][0] == "_id"
+            and keys[0][1] == keys[1][1]
+        ):
+            return True
+
+    return False
+
+
+def _is_sort_cursor(after):
+    return after.startswith("{")
+
+
+def _make_sort_cursor(sort_key, _id):
+    return json_util.dumps({"key": sort_key, "_id": _id})
+
+
+def _parse_offset(after):
+    if _is_sort_cursor(after):
+        raise ValueError(
+            "Cursor '%s' cannot be used with a view that reorders samples"
+            % after
+        )
+
+    return int(after)
+
+
+def _make_sort_keyset_pipeline(pipeline, sort_idx, after, first):
+    ((field, order),) = pipeline[sort_idx]["$sort"].items()
+
+    if _is_sort_cursor(after):
+        start = [{"$match": _make_sort_cursor_query(field, order, after)}]
+        skip = []
+    else:
+        start = []
+        offset = int(after) + 1
+        skip = [{"$skip": offset}] if offset > 0 else []
+
+    # `_id` breaks ties so that every sample has a unique position, and the
+    # sort key is recorded before any later stages can modify it
+    sort = [
+        {"$sort": {field: order, "_id": order}},
+        {"$set": {_SORT_KEY: "$" + field}},
+    ]
+
+    return (
+        pipeline[:sort_idx]
+        + start
+        + sort
+        + pipeline[sort_idx + 1 :]
+        + skip
+        + [{"$limit": first + 1}]
+    )
+
+
+def _make_sort_cursor_query(field, order, after):
+    cursor = json_util.loads(after)
+    sort_key = cursor["key"]
+    op = "$gt" if order > 0 else "$lt"
+
+    ties = {field: sort_key, "_id": {op: cursor["_id"]}}
+
+    # Null and missing values sort before all other values
+    if sort_key is None:
+        if order > 0:
+            return {"$or": [ties, {field: {"$ne": None}}]}
+
+        return ties
+
+    query = {"$or": [{field: {op: sort_key}}, ties]}
+    if order < 0:
+        query["$or"].append({field: None})
+
+    return query
+
+
 async def _create_sample_item(
     dataset: SampleCollection,
     sample: t.Dict,
@@ -14,13 +14,14 @@ import fiftyone.core.stages as fosg
 import fiftyone.core.utils as fou
 import fiftyone.core.view as fov
 
+import fiftyone.server.cache as fosc
 from fiftyone.server.utils import iter_label_fields
 
 
 _LABEL_TAGS = "_label_tags"
 
 
-def get_view(
+async def get_view(
     dataset_name,
     stages=None,
     filters=None,
@@ -49,6 +50,70 @@ def get_view(
     Returns:
         a :class:`fiftyone.core.view.DatasetView`
     """
+    key = await fosc.make_key(
+        dataset_name,
+        "view",
+        stages,
+        filters,
+        count_label_tags,
+        only_matches,
+        extended_stages,
+        sample_filter,
+        sort,
+    )
+
+    view = fosc.views.get(key)
+    if view is None:
+        view = _make_view(
+            dataset_name,
+            stages=stages,
+            filters=filters,
+            count_label_tags=count_label_tags,
+            only_matches=only_matches,
+            extended_stages=extended_stages,
+            sample_filter=sample_filter,
+            sort=sort,
+        )
+        fosc.views.set(key, view)
+
+    return view
+
+
+def get_pipeline(view, key, **kwargs):
+    """Returns the aggregation pipeline for the given view, using the server's
+    pipeline cache when possible.
+
+    Args:
+        view: a :class:`fiftyone.core.view.DatasetView`
+        key: a cache key for ``view``, as returned by
+            :func:`fiftyone.server.cache.make_key`
+        **kwargs: keyword arguments for
+            :meth:`fiftyone.core.collections.SampleCollection._pipeline`
+
+    Returns:
+        a list of pipeline stage dicts
+    """
+    dataset_name, token, digest = key
+    pipeline_key = (dataset_name, token, digest, fosc._hash(kwargs))
+
+    pipeline = fosc.pipelines.get_or_set(
+        pipeline_key, lambda: view._pipeline(**kwargs)
+    )
+
+    # Shallow copy so that callers may safely append stages
+    return list(pipeline)
+
+
+def _make_view(
+    dataset_name,
+    stages=None,
+    filters=None,
+    count_label_tags=False,
+    only_matches=True,
+    extended_stages=None,
+    sample_filter=None,
+    sort=False,
+):
     view = fod.load_dataset(dataset_name).view()
     view.reload()
 
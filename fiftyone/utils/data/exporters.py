@@ -5,12 +5,21 @@ Dataset exporters.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
+from collections import defaultdict, deque
 import inspect
 import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 import os
+import shutil
+import timeit
 import warnings
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
 from bson import json_util
 import numpy as np
 
@@ -163,6 +172,8 @@ def export_samples(
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
             -   ``"manifest"``: create a ``data.json`` in the output directory
                 that maps UUIDs used in the labels files to the filepaths of
                 the source media, rather than exporting the actual media
@@ -1011,14 +1022,16 @@ class MediaExporter(object):
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
             -   ``"manifest"``: create a ``data.json`` in the output directory
                 that maps UUIDs used in the labels files to the filepaths of
                 the source media, rather than exporting the actual media
         export_path (None): the location to export the media. Can be any of the
             following:
 
-            -   When ``export_media`` is True, "move", or "symlink", a
-                directory in which to export the media
+            -   When ``export_media`` is True, "move", "symlink", or
+                "hardlink", a directory in which to export the media
             -   When ``export_mode`` is "manifest", the path to write a JSON
                 file mapping UUIDs to input filepaths
             -   When ``export_media`` is False, this parameter has no effect
@@ -1035,6 +1048,10 @@ class MediaExporter(object):
             output paths
         ignore_exts (False): whether to omit file extensions when generating
             UUIDs for files
+        num_workers (None): the number of worker threads to use to transfer
+            media files in the background. By default,
+            ``multiprocessing.cpu_count()`` is used. Use ``num_workers <= 1``
+            to transfer files synchronously
     """
 
     def __init__(
@@ -1045,9 +1062,17 @@ class MediaExporter(object):
         supported_modes=None,
         default_ext=None,
         ignore_exts=False,
+        num_workers=None,
     ):
         if supported_modes is None:
-            supported_modes = (True, False, "move", "symlink", "manifest")
+            supported_modes = (
+                True,
+                False,
+                "move",
+                "symlink",
+                "hardlink",
+                "manifest",
+            )
 
         if export_mode not in supported_modes:
             raise ValueError(
@@ -1067,10 +1092,12 @@ class MediaExporter(object):
         self.supported_modes = supported_modes
         self.default_ext = default_ext
         self.ignore_exts = ignore_exts
+        self.num_workers = num_workers
 
         self._filename_maker = None
         self._manifest = None
         self._manifest_path = None
+        self._transfer = None
 
     def _write_media(self, media, outpath):
         raise NotImplementedError("subclass must implement _write_media()")
@@ -1103,7 +1130,7 @@ class MediaExporter(object):
         manifest_path = None
         manifest = None
 
-        if self.export_mode in (True, "move", "symlink"):
+        if self.export_mode in (True, "move", "symlink", "hardlink"):
             output_dir = self.export_path
         elif self.export_mode == "manifest":
             manifest_path = self.export_path
@@ -1119,6 +1146,11 @@ class MediaExporter(object):
         self._manifest_path = manifest_path
         self._manifest = manifest
 
+        if self.export_mode in (True, "move", "symlink", "hardlink"):
+            self._transfer = _MediaTransfer(
+                self.export_mode, num_workers=self.num_workers
+            )
+
     def export(self, media_or_path, outpath=None):
         """Exports the given media.
 
@@ -1149,12 +1181,8 @@ class MediaExporter(object):
                 outpath = self._filename_maker.get_output_path(media_path)
                 uuid = self._get_uuid(outpath)
 
-            if self.export_mode == True:
-                etau.copy_file(media_path, outpath)
-            elif self.export_mode == "move":
-                etau.move_file(media_path, outpath)
-            elif self.export_mode == "symlink":
-                etau.symlink_file(media_path, outpath)
+            if self._transfer is not None:
+                self._transfer.submit(media_path, outpath)
             elif self.export_mode == "manifest":
                 self._manifest[uuid] = media_path
         else:
@@ -1177,11 +1205,188 @@ class MediaExporter(object):
         return outpath, uuid
 
     def close(self):
-        """Performs any necessary actions to complete the export."""
+        """Performs any necessary actions to complete the export.
+
+        If media files are being transferred in the background, this method
+        blocks until all transfers have completed.
+        """
+        if self._transfer is not None:
+            self._transfer.close()
+            self._transfer = None
+
         if self.export_mode == "manifest":
             etas.write_json(self._manifest, self._manifest_path)
 
 
+class _MediaTransfer(object):
+    """Transfers media files via a bounded pool of background threads.
+
+    Copies skip destination files that already exist with the same size and
+    modification time, and use copy-on-write clones (reflinks) when the
+    filesystem supports them. Hard links fall back to copies when linking is
+    not possible, e.g., across devices.
+
+    Args:
+        mode: the transfer mode. Supported values are ``True`` (copy),
+            ``"move"``, ``"symlink"``, and ``"hardlink"``
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used. If ``num_workers <= 1``,
+            transfers are performed synchronously
+    """
+
+    def __init__(self, mode, num_workers=None):
+        if num_workers is None:
+            num_workers = multiprocessing.cpu_count()
+
+        self.mode = mode
+        self.num_workers = num_workers
+
+        self._pool = None
+        self._pending = deque()
+        self._num_files = 0
+        self._num_skipped = 0
+        self._num_bytes = 0
+        self._start_time = None
+
+    def submit(self, inpath, outpath):
+        """Transfers the given file, possibly asynchronously.
+
+        Args:
+            inpath: the input path
+            outpath: the output path
+        """
+        if self._start_time is None:
+            self._start_time = timeit.default_timer()
+
+        if self.num_workers <= 1:
+            self._record(_transfer_file(self.mode, inpath, outpath))
+            return
+
+        if self._pool is None:
+            self._pool = ThreadPool(processes=self.num_workers)
+
+        # Bound the number of pending transfers so that memory usage does not
+        # grow if the filesystem falls behind
+        while len(self._pending) >= 4 * self.num_workers:
+            self._record(self._pending.popleft().get())
+
+        self._pending.append(
+            self._pool.apply_async(
+                _transfer_file, (self.mode, inpath, outpath)
+            )
+        )
+
+    def close(self):
+        """Waits for all pending transfers to complete and logs throughput
+        statistics.
+        """
+        try:
+            while self._pending:
+                self._record(self._pending.popleft().get())
+        finally:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool = None
+
+        if self._num_files > 0:
+            elapsed = max(timeit.default_timer() - self._start_time, 1e-6)
+            logger.info(
+                "Transferred %d media files (%s, %d skipped) in %.1fs "
+                "(%.1f files/s, %s/s)",
+                self._num_files,
+                etau.to_human_bytes_str(self._num_bytes),
+                self._num_skipped,
+                elapsed,
+                self._num_files / elapsed,
+                etau.to_human_bytes_str(self._num_bytes / elapsed),
+            )
+
+    def _record(self, result):
+        num_bytes, skipped = result
+        self._num_files += 1
+        self._num_bytes += num_bytes
+        if skipped:
+            self._num_skipped += 1
+
+
+def _transfer_file(mode, inpath, outpath):
+    # Returns a `(num_bytes, skipped)` tuple
+
+    # Output directories are created here with `exist_ok=True` because
+    # multiple threads may be populating the same directory
+    outdir = os.path.dirname(outpath)
+    if outdir:
+        os.makedirs(outdir, exist_ok=True)
+
+    if mode == "symlink":
+        etau.symlink_file(inpath, outpath)
+        return 0, False
+
+    if mode == "move":
+        num_bytes = os.path.getsize(inpath)
+        etau.move_file(inpath, outpath)
+        return num_bytes, False
+
+    stat = os.stat(inpath)
+
+    if _is_same_file(stat, outpath):
+        return stat.st_size, True
+
+    if mode == "hardlink":
+        if os.path.lexists(outpath):
+            os.remove(outpath)
+
+        try:
+            os.link(inpath, outpath)
+            return stat.st_size, False
+        except OSError:
+            pass
+
+    _copy_file(inpath, outpath)
+    return stat.st_size, False
+
+
+def _is_same_file(stat, outpath):
+    try:
+        out_stat = os.stat(outpath)
+    except OSError:
+        return False
+
+    if (stat.st_dev, stat.st_ino) == (out_stat.st_dev, out_stat.st_ino):
+        return True
+
+    # Copies preserve modification times, so existing files with matching size
+    # and mtime are presumed to be from a previous export
+    return (
+        stat.st_size == out_stat.st_size
+        and abs(stat.st_mtime - out_stat.st_mtime) < 1
+    )
+
+
+def _copy_file(inpath, outpath):
+    if not _reflink_file(inpath, outpath):
+        shutil.copyfile(inpath, outpath)
+
+    shutil.copystat(inpath, outpath)
+
+
+# https://man7.org/linux/man-pages/man2/ioctl_ficlone.2.html
+_FICLONE = 0x40049409
+
+
+def _reflink_file(inpath, outpath):
+    if fcntl is None:
+        return False
+
+    try:
+        with open(inpath, "rb") as fin, open(outpath, "wb") as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+
+        return True
+    except OSError:
+        return False
+
+
 class ImageExporter(MediaExporter):
     """Utility class for :class:`DatasetExporter` instances that export images.
 
@@ -1595,6 +1800,8 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
             -   ``"move"``: move media files into the export directory
             -   ``"symlink"``: create symlinks to each media file in the export
                 directory
+            -   ``"hardlink"``: create hard links to each media file in the
+                export directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each media. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -1656,7 +1863,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
             self.export_media,
             export_path=self._data_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, False, "move", "symlink"),
+            supported_modes=(True, False, "move", "symlink", "hardlink"),
         )
         self._media_exporter.setup()
 
@@ -1823,7 +2030,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
             self.export_media,
             export_path=field_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, False, "move", "symlink"),
+            supported_modes=(True, False, "move", "symlink", "hardlink"),
         )
         media_exporter.setup()
         self._media_field_exporters[field_name] = media_exporter
@@ -1833,7 +2040,7 @@ class LegacyFiftyOneDatasetExporter(GenericSampleDatasetExporter):
 
 class FiftyOneDatasetExporter(BatchDatasetExporter):
     """Exporter that writes an entire FiftyOne dataset to disk in a serialized
-    JSON format along with its source media.
+    JSON or sharded BSON format along with its source media.
 
     See :ref:`this page <FiftyOneDataset-export>` for format details.
 
@@ -1848,6 +2055,8 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             -   ``"move"``: move media files into the export directory
             -   ``"symlink"``: create symlinks to each media file in the export
                 directory
+            -   ``"hardlink"``: create hard links to each media file in the
+                export directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each media. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -1861,6 +2070,13 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             sample/frame files
         ordered (True): whether to preserve the order of the exported
             collections
+        use_bson (False): whether to export samples/frames as directories of
+            gzip-compressed BSON shards rather than JSON. This format is more
+            compact and much faster to export and import. If True,
+            ``use_dirs`` is ignored
+        num_workers (None): the number of worker threads to use when writing
+            BSON shards. Only applicable when ``use_bson`` is True. By
+            default, ``multiprocessing.cpu_count()`` is used
     """
 
     def __init__(
@@ -1871,6 +2087,8 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         export_runs=True,
         use_dirs=False,
         ordered=True,
+        use_bson=False,
+        num_workers=None,
     ):
         if export_media is None:
             export_media = True
@@ -1885,6 +2103,8 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self.export_runs = export_runs
         self.use_dirs = use_dirs
         self.ordered = ordered
+        self.use_bson = use_bson
+        self.num_workers = num_workers
 
         self._data_dir = None
         self._fields_dir = None
@@ -1906,7 +2126,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         self._eval_dir = os.path.join(self.export_dir, "evaluations")
         self._metadata_path = os.path.join(self.export_dir, "metadata.json")
 
-        if self.use_dirs:
+        if self.use_bson or self.use_dirs:
             self._samples_path = os.path.join(self.export_dir, "samples")
             self._frames_path = os.path.join(self.export_dir, "frames")
         else:
@@ -1917,7 +2137,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             self.export_media,
             export_path=self._data_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, False, "move", "symlink"),
+            supported_modes=(True, False, "move", "symlink", "hardlink"),
         )
         self._media_exporter.setup()
 
@@ -1966,12 +2186,12 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         else:
             patt = None
 
-        foo.export_collection(
+        self._export_collection(
             map(_prep_sample, _samples),
             self._samples_path,
-            key="samples",
-            patt=patt,
-            num_docs=num_samples,
+            "samples",
+            patt,
+            num_samples,
         )
 
         if sample_collection._contains_videos(any_slice=True):
@@ -1992,12 +2212,8 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             frames = foo.aggregate(coll, pipeline)
 
             # @todo export segmentation/heatmap masks stored as paths
-            foo.export_collection(
-                frames,
-                self._frames_path,
-                key="frames",
-                patt=patt,
-                num_docs=num_frames,
+            self._export_collection(
+                frames, self._frames_path, "frames", patt, num_frames
             )
 
         dataset = sample_collection._dataset
@@ -2032,6 +2248,16 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
         for media_exporter in self._media_field_exporters.values():
             media_exporter.close()
 
+    def _export_collection(self, docs, path, key, patt, num_docs):
+        if self.use_bson:
+            foo.export_bson_collection(
+                docs, path, num_docs=num_docs, num_workers=self.num_workers
+            )
+        else:
+            foo.export_collection(
+                docs, path, key=key, patt=patt, num_docs=num_docs
+            )
+
     def _export_media_fields(self, sd):
         for field_name, label_type in self._media_fields.items():
             value = sd.get(field_name, None)
@@ -2074,7 +2300,7 @@ class FiftyOneDatasetExporter(BatchDatasetExporter):
             self.export_media,
             export_path=field_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, False, "move", "symlink"),
+            supported_modes=(True, False, "move", "symlink", "hardlink"),
         )
         media_exporter.setup()
         self._media_field_exporters[field_name] = media_exporter
@@ -2125,6 +2351,8 @@ class ImageDirectoryExporter(UnlabeledImageDatasetExporter):
             -   ``"move"``: move media files into the export directory
             -   ``"symlink"``: create symlinks to each media file in the export
                 directory
+            -   ``"hardlink"``: create hard links to each media file in the
+                export directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each image. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -2160,7 +2388,7 @@ class ImageDirectoryExporter(UnlabeledImageDatasetExporter):
             self.export_media,
             export_path=self.export_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, "move", "symlink"),
+            supported_modes=(True, "move", "symlink", "hardlink"),
             default_ext=self.image_format,
         )
         self._media_exporter.setup()
@@ -2191,6 +2419,8 @@ class VideoDirectoryExporter(UnlabeledVideoDatasetExporter):
             -   ``"move"``: move media files into the export directory
             -   ``"symlink"``: create symlinks to each media file in the export
                 directory
+            -   ``"hardlink"``: create hard links to each media file in the
+                export directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each video. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -2220,7 +2450,7 @@ class VideoDirectoryExporter(UnlabeledVideoDatasetExporter):
             self.export_media,
             export_path=self.export_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, "move", "symlink"),
+            supported_modes=(True, "move", "symlink", "hardlink"),
         )
         self._media_exporter.setup()
 
@@ -2286,6 +2516,8 @@ class FiftyOneImageClassificationDatasetExporter(
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
             -   ``"manifest"``: create a ``data.json`` in the output directory
                 that maps UUIDs used in the labels files to the filepaths of
                 the source media, rather than exporting the actual media
@@ -2437,6 +2669,8 @@ class ImageClassificationDirectoryTreeExporter(LabeledImageDatasetExporter):
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each image. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -2487,7 +2721,7 @@ class ImageClassificationDirectoryTreeExporter(LabeledImageDatasetExporter):
         self._filename_counts = defaultdict(int)
         self._media_exporter = ImageExporter(
             self.export_media,
-            supported_modes=(True, "move", "symlink"),
+            supported_modes=(True, "move", "symlink", "hardlink"),
         )
         self._media_exporter.setup()
 
@@ -2553,6 +2787,8 @@ class VideoClassificationDirectoryTreeExporter(LabeledVideoDatasetExporter):
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each video. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -2595,7 +2831,7 @@ class VideoClassificationDirectoryTreeExporter(LabeledVideoDatasetExporter):
         self._filename_counts = defaultdict(int)
         self._media_exporter = VideoExporter(
             self.export_media,
-            supported_modes=(True, "move", "symlink"),
+            supported_modes=(True, "move", "symlink", "hardlink"),
         )
         self._media_exporter.setup()
 
@@ -2687,6 +2923,8 @@ class FiftyOneImageDetectionDatasetExporter(
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
             -   ``"manifest"``: create a ``data.json`` in the output directory
                 that maps UUIDs used in the labels files to the filepaths of
                 the source media, rather than exporting the actual media
@@ -2872,6 +3110,8 @@ class FiftyOneTemporalDetectionDatasetExporter(
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
             -   ``"manifest"``: create a ``data.json`` in the output directory
                 that maps UUIDs used in the labels files to the filepaths of
                 the source media, rather than exporting the actual media
@@ -3061,6 +3301,8 @@ class ImageSegmentationDirectoryExporter(
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
             -   ``"manifest"``: create a ``data.json`` in the output directory
                 that maps UUIDs used in the labels files to the filepaths of
                 the source media, rather than exporting the actual media
@@ -3207,6 +3449,8 @@ class FiftyOneImageLabelsDatasetExporter(LabeledImageDatasetExporter):
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each image. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -3271,7 +3515,7 @@ class FiftyOneImageLabelsDatasetExporter(LabeledImageDatasetExporter):
             self.export_media,
             export_path=self._data_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, "move", "symlink"),
+            supported_modes=(True, "move", "symlink", "hardlink"),
             default_ext=self.image_format,
             ignore_exts=True,
         )
@@ -3326,6 +3570,8 @@ class FiftyOneVideoLabelsDatasetExporter(LabeledVideoDatasetExporter):
             -   ``"move"``: move all media files into the output directory
             -   ``"symlink"``: create symlinks to the media files in the output
                 directory
+            -   ``"hardlink"``: create hard links to the media files in the
+                output directory
         rel_dir (None): an optional relative directory to strip from each input
             filepath to generate a unique identifier for each video. When
             exporting media, this identifier is joined with ``export_dir`` to
@@ -3385,7 +3631,7 @@ class FiftyOneVideoLabelsDatasetExporter(LabeledVideoDatasetExporter):
             self.export_media,
             export_path=self._data_dir,
             rel_dir=self.rel_dir,
-            supported_modes=(True, "move", "symlink"),
+            supported_modes=(True, "move", "symlink", "hardlink"),
             ignore_exts=True,
         )
         self._media_exporter.setup()
@@ -1597,7 +1597,8 @@ class LegacyFiftyOneDatasetImporter(GenericSampleDatasetImporter):
 
 
 class FiftyOneDatasetImporter(BatchDatasetImporter):
-    """Importer for FiftyOne datasets stored on disk in serialized JSON format.
+    """Importer for FiftyOne datasets stored on disk in serialized JSON or
+    sharded BSON format.
 
     See :ref:`this page <FiftyOneDataset-import>` for format details.
 
@@ -1754,14 +1755,17 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         #
 
         logger.info("Importing samples...")
-        samples, num_samples = foo.import_collection(
+        samples, num_samples = _import_collection(
             self._samples_path, key="samples"
         )
 
         samples = self._preprocess_list(samples)
 
         if self.max_samples is not None:
-            num_samples = self.max_samples
+            if num_samples is not None:
+                num_samples = min(num_samples, self.max_samples)
+            else:
+                num_samples = self.max_samples
 
         if self.rel_dir is not None:
             # Prepend `rel_dir` to all relative paths
@@ -1798,15 +1802,14 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
 
         if self._has_frames:
             logger.info("Importing frames...")
-            frames, num_frames = foo.import_collection(
+            frames, num_frames = _import_collection(
                 self._frames_path, key="frames"
             )
 
-            # @todo optimize by only loading these docs in the first place
             if self.max_samples is not None:
                 _sample_ids = set(sample_ids)
-                frames = [f for f in frames if f["_sample_id"] in _sample_ids]
-                num_frames = len(frames)
+                frames = (f for f in frames if f["_sample_id"] in _sample_ids)
+                num_frames = None
 
             foo.insert_documents(
                 frames,
@@ -1865,8 +1868,14 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
     def _get_num_samples(dataset_dir):
         # Used only by dataset zoo
         samples_path = os.path.join(dataset_dir, "samples.json")
-        samples = etas.read_json(samples_path).get("samples", [])
-        return len(samples)
+        if not os.path.isfile(samples_path):
+            samples_path = os.path.join(dataset_dir, "samples")
+
+        samples, num_samples = _import_collection(samples_path, key="samples")
+        if num_samples is None:
+            num_samples = sum(1 for _ in samples)
+
+        return num_samples
 
     def _is_legacy_format_data(self):
         metadata_path = os.path.join(self.dataset_dir, "metadata.json")
@@ -1886,6 +1895,13 @@ class FiftyOneDatasetImporter(BatchDatasetImporter):
         )
 
 
+def _import_collection(path, key):
+    if os.path.isdir(path) and foo.is_bson_collection(path):
+        return foo.import_bson_collection(path)
+
+    return foo.import_collection(path, key=key)
+
+
 def _parse_media_fields(sd, media_fields, rel_dir):
     for field_name in media_fields:
         value = sd.get(field_name, None)
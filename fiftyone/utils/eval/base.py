@@ -7,11 +7,19 @@ Base evaluation methods.
 """
 import itertools
 
+from bson import ObjectId
 import numpy as np
 import sklearn.metrics as skm
 
+import fiftyone.core.dataset as fod
 import fiftyone.core.evaluation as foe
+import fiftyone.core.odm.database as food
 import fiftyone.core.plots as fop
+import fiftyone.core.view as fovi
+
+
+# Number of ID-range shards per worker used by sharded evaluations
+_SHARDS_PER_WORKER = 4
 
 
 class BaseEvaluationResults(foe.EvaluationResults):
@@ -518,3 +526,53 @@ def _compute_confusion_matrix(
             ids[yt, yp].append(ip)
 
     return confusion_matrix, ids
+
+
+def _can_shard(samples):
+    return type(samples) is fod.Dataset or (
+        type(samples) is fovi.DatasetView
+        and samples._dataset is samples._root_dataset
+    )
+
+
+def _split_ids(ids, num_shards):
+    if num_shards <= 0:
+        return []
+
+    shard_size, remainder = divmod(len(ids), num_shards)
+
+    shards = []
+    start = 0
+    for idx in range(num_shards):
+        end = start + shard_size + (1 if idx < remainder else 0)
+        shards.append(ids[start:end])
+        start = end
+
+    return shards
+
+
+def _init_worker():
+    # Database clients cannot be shared with the parent process
+    food._disconnect()
+
+
+def _load_shard(dataset_name, stages, fields, first_id, last_id):
+    samples = fod.load_dataset(dataset_name)
+    if stages is not None:
+        samples = fovi.DatasetView._build(samples, stages)
+
+    if fields is not None:
+        samples = samples.select_fields(fields)
+
+    return samples.mongo(
+        [
+            {
+                "$match": {
+                    "_id": {
+                        "$gte": ObjectId(first_id),
+                        "$lte": ObjectId(last_id),
+                    }
+                }
+            }
+        ]
+    )
@@ -5,22 +5,37 @@ Detection evaluation.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import hashlib
 import itertools
 import logging
 
+from bson import json_util
 import numpy as np
 
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
+import fiftyone.core.view as fovi
 
-from .base import BaseEvaluationResults
+from .base import (
+    BaseEvaluationResults,
+    _SHARDS_PER_WORKER,
+    _can_shard,
+    _init_worker,
+    _load_shard,
+    _split_ids,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of changed samples to evaluate per batch in incremental mode
+_INCREMENTAL_BATCH_SIZE = 100000
+
+
 def evaluate_detections(
     samples,
     pred_field,
@@ -34,6 +49,8 @@ def evaluate_detections(
     use_boxes=False,
     classwise=True,
     dynamic=True,
+    num_workers=None,
+    incremental=False,
     **kwargs,
 ):
     """Evaluates the predicted detections in the given samples with respect to
@@ -120,6 +137,18 @@ def evaluate_detections(
             label (True) or allow matches between classes (False)
         dynamic (True): whether to declare the dynamic object-level attributes
             that are populated on the dataset's schema
+        num_workers (None): an optional number of processes to use. If
+            provided, the samples are split into shards of contiguous sample
+            IDs that are evaluated in parallel. Only supported when
+            ``samples`` is a :class:`fiftyone.core.dataset.Dataset` or a
+            plain :class:`fiftyone.core.view.DatasetView`. By default,
+            evaluation is performed in the main process
+        incremental (False): whether to only evaluate samples whose ground
+            truth or predicted objects have changed since the last evaluation
+            with the same ``eval_key`` and configuration, reusing the stored
+            results of the unchanged samples. The content fingerprint of each
+            sample is recorded in a ``<eval_key>_fingerprint`` field. If no
+            compatible previous evaluation exists, all samples are evaluated
         **kwargs: optional keyword arguments for the constructor of the
             :class:`DetectionEvaluationConfig` being used
 
@@ -154,50 +183,75 @@ def evaluate_detections(
     eval_method = config.build()
     eval_method.ensure_requirements()
 
-    eval_method.register_run(samples, eval_key)
+    if incremental:
+        incremental = _validate_incremental(samples, eval_key, config)
+
+    if incremental:
+        prev_results = _load_previous_results(eval_method, samples, eval_key)
+    else:
+        prev_results = None
+
+    # When results are reused, the fingerprints and evaluation fields of
+    # unchanged samples must not be cleaned up
+    eval_method.register_run(samples, eval_key, cleanup=prev_results is None)
     eval_method.register_samples(samples, eval_key, dynamic=dynamic)
 
     processing_frames = samples._is_frame_field(pred_field)
 
-    if eval_key is not None:
-        tp_field = "%s_tp" % eval_key
-        fp_field = "%s_fp" % eval_key
-        fn_field = "%s_fn" % eval_key
-
     if config.requires_additional_fields:
-        _samples = samples
+        fields = None
     else:
-        _samples = samples.select_fields([gt_field, pred_field])
+        fields = [gt_field, pred_field]
+
+    if num_workers is not None and num_workers > 1:
+        if not _can_shard(samples):
+            logger.warning(
+                "Sharded evaluation is not supported for collections of type "
+                "%s; evaluating in the main process",
+                type(samples),
+            )
+            num_workers = None
 
-    matches = []
-    logger.info("Evaluating detections...")
-    for sample in _samples.iter_samples(progress=True):
-        if processing_frames:
-            docs = sample.frames.values()
-        else:
-            docs = [sample]
+    if incremental:
+        fingerprint_field = _get_fingerprint_field(eval_key)
+        samples._dataset.add_sample_field(fingerprint_field, fof.StringField)
 
-        sample_tp = 0
-        sample_fp = 0
-        sample_fn = 0
-        for doc in docs:
-            doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
-            matches.extend(doc_matches)
-            tp, fp, fn = _tally_matches(doc_matches)
-            sample_tp += tp
-            sample_fp += fp
-            sample_fn += fn
-
-            if processing_frames and eval_key is not None:
-                doc[tp_field] = tp
-                doc[fp_field] = fp
-                doc[fn_field] = fn
-
-        if eval_key is not None:
-            sample[tp_field] = sample_tp
-            sample[fp_field] = sample_fp
-            sample[fn_field] = sample_fn
-            sample.save()
+        logger.info("Computing sample fingerprints...")
+        changed, unchanged_label_ids = _compute_changes(
+            samples, gt_field, pred_field, fingerprint_field, prev_results
+        )
+
+        matches = _get_unchanged_matches(prev_results, unchanged_label_ids)
+
+        logger.info(
+            "Evaluating detections for %d changed samples...", len(changed)
+        )
+        for batch in fou.iter_batches(
+            list(changed.keys()), _INCREMENTAL_BATCH_SIZE
+        ):
+            matches.extend(
+                _run_evaluation(
+                    samples.select(batch),
+                    fields,
+                    eval_method,
+                    eval_key,
+                    processing_frames,
+                    num_workers,
+                )
+            )
+
+        if changed:
+            samples.set_values(fingerprint_field, changed, key_field="id")
+    else:
+        logger.info("Evaluating detections...")
+        matches = _run_evaluation(
+            samples,
+            fields,
+            eval_method,
+            eval_key,
+            processing_frames,
+            num_workers,
+        )
 
     results = eval_method.generate_results(
         samples, matches, eval_key=eval_key, classes=classes, missing=missing
@@ -406,6 +460,10 @@ class DetectionEvaluation(foe.EvaluationMethod):
                 ["%s_tp" % prefix, "%s_fp" % prefix, "%s_fn" % prefix]
             )
 
+        fingerprint_field = _get_fingerprint_field(eval_key)
+        if samples.get_field(fingerprint_field) is not None:
+            fields.append(fingerprint_field)
+
         return fields
 
     def cleanup(self, samples, eval_key):
@@ -415,6 +473,10 @@ class DetectionEvaluation(foe.EvaluationMethod):
             "%s_fn" % eval_key,
         ]
 
+        fingerprint_field = _get_fingerprint_field(eval_key)
+        if samples.get_field(fingerprint_field) is not None:
+            samples._dataset.delete_sample_field(fingerprint_field)
+
         try:
             pred_field, _ = samples._handle_frame_field(self.config.pred_field)
             pred_type = samples._get_label_field_type(self.config.pred_field)
@@ -574,6 +636,303 @@ def _parse_config(pred_field, gt_field, method, is_temporal, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
+def _run_evaluation(
+    samples, fields, eval_method, eval_key, processing_frames, num_workers
+):
+    if num_workers is not None and num_workers > 1:
+        return _evaluate_sharded(
+            samples,
+            fields,
+            eval_method,
+            eval_key,
+            processing_frames,
+            num_workers,
+        )
+
+    if fields is not None:
+        samples = samples.select_fields(fields)
+
+    return _evaluate_samples(
+        samples, eval_method, eval_key, processing_frames, progress=True
+    )
+
+
+def _evaluate_samples(
+    samples, eval_method, eval_key, processing_frames, progress=False
+):
+    if eval_key is not None:
+        tp_field = "%s_tp" % eval_key
+        fp_field = "%s_fp" % eval_key
+        fn_field = "%s_fn" % eval_key
+
+    matches = []
+    with samples.save_context() as context:
+        for sample in samples.iter_samples(progress=progress):
+            if processing_frames:
+                docs = sample.frames.values()
+            else:
+                docs = [sample]
+
+            sample_tp = 0
+            sample_fp = 0
+            sample_fn = 0
+            for doc in docs:
+                doc_matches = eval_method.evaluate(doc, eval_key=eval_key)
+                matches.extend(doc_matches)
+                tp, fp, fn = _tally_matches(doc_matches)
+                sample_tp += tp
+                sample_fp += fp
+                sample_fn += fn
+
+                if processing_frames and eval_key is not None:
+                    doc[tp_field] = tp
+                    doc[fp_field] = fp
+                    doc[fn_field] = fn
+
+            if eval_key is not None:
+                sample[tp_field] = sample_tp
+                sample[fp_field] = sample_fp
+                sample[fn_field] = sample_fn
+                context.save(sample)
+
+    return matches
+
+
+def _evaluate_sharded(
+    samples, fields, eval_method, eval_key, processing_frames, num_workers
+):
+    if isinstance(samples, fovi.DatasetView):
+        stages = samples._serialize()
+    else:
+        stages = None
+
+    ids = sorted(samples.values("_id"))
+    num_shards = min(len(ids), _SHARDS_PER_WORKER * num_workers)
+
+    tasks = []
+    for shard_ids in _split_ids(ids, num_shards):
+        tasks.append(
+            (
+                samples._dataset.name,
+                stages,
+                fields,
+                eval_method,
+                eval_key,
+                processing_frames,
+                str(shard_ids[0]),
+                str(shard_ids[-1]),
+                len(shard_ids),
+            )
+        )
+
+    matches = []
+    ctx = fou.get_multiprocessing_context()
+    with fou.ProgressBar(total=len(ids)) as pb:
+        with ctx.Pool(num_workers, initializer=_init_worker) as pool:
+            for shard_matches, num_samples in pool.imap_unordered(
+                _evaluate_shard, tasks
+            ):
+                matches.extend(shard_matches)
+                pb.update(count=num_samples)
+
+    # Evaluation results were written by the workers
+    samples._dataset._reload_docs()
+
+    return matches
+
+
+def _evaluate_shard(args):
+    (
+        dataset_name,
+        stages,
+        fields,
+        eval_method,
+        eval_key,
+        processing_frames,
+        first_id,
+        last_id,
+        num_samples,
+    ) = args
+
+    samples = _load_shard(dataset_name, stages, fields, first_id, last_id)
+
+    matches = _evaluate_samples(
+        samples, eval_method, eval_key, processing_frames
+    )
+
+    return matches, num_samples
+
+
+def _get_fingerprint_field(eval_key):
+    return "%s_fingerprint" % eval_key
+
+
+def _validate_incremental(samples, eval_key, config):
+    if eval_key is None:
+        logger.warning(
+            "Incremental evaluation requires an `eval_key`; evaluating all "
+            "samples"
+        )
+        return False
+
+    if config.requires_additional_fields:
+        logger.warning(
+            "Incremental evaluation is not supported for evaluation methods "
+            "that require additional fields; evaluating all samples"
+        )
+        return False
+
+    return True
+
+
+def _load_previous_results(eval_method, samples, eval_key):
+    # Returns the stored results of a previous evaluation with the same key and
+    # configuration, if possible
+    if not samples.has_evaluation(eval_key):
+        return None
+
+    try:
+        prev_config = samples.get_evaluation_info(eval_key).config
+        if dict(prev_config.serialize()) != dict(
+            eval_method.config.serialize()
+        ):
+            return None
+
+        prev_results = eval_method.load_run_results(
+            samples, eval_key, cache=False, load_view=False
+        )
+    except Exception as e:
+        logger.debug("Failed to load previous results: %s", e)
+        return None
+
+    if not isinstance(prev_results, DetectionResults):
+        return None
+
+    if prev_results.ytrue_ids is None or prev_results.ypred_ids is None:
+        return None
+
+    if samples.get_field(_get_fingerprint_field(eval_key)) is None:
+        return None
+
+    return prev_results
+
+
+def _compute_changes(
+    samples, gt_field, pred_field, fingerprint_field, prev_results
+):
+    # Returns a dict mapping IDs of samples that must be (re)evaluated to their
+    # current fingerprints, and the set of label IDs in unchanged samples
+    gt_list_field = samples._get_label_field_type(gt_field)._LABEL_LIST_FIELD
+    pred_list_field = samples._get_label_field_type(
+        pred_field
+    )._LABEL_LIST_FIELD
+
+    _gt_field, is_frame_field = samples._handle_frame_field(gt_field)
+    _pred_field, _ = samples._handle_frame_field(pred_field)
+
+    # Exclude the object-level attributes populated by evaluations
+    exclude = set()
+    for eval_key in samples.list_evaluations():
+        exclude.update([eval_key, eval_key + "_id", eval_key + "_iou"])
+
+    view = samples.select_fields([gt_field, pred_field, fingerprint_field])
+
+    changed = {}
+    unchanged_label_ids = set()
+    for d in view._aggregate(attach_frames=is_frame_field):
+        if is_frame_field:
+            docs = d.get("frames", None) or []
+        else:
+            docs = [d]
+
+        content = []
+        for doc in docs:
+            gt = _strip_keys(_get_value(doc, _gt_field), exclude)
+            pred = _strip_keys(_get_value(doc, _pred_field), exclude)
+            content.append([doc.get("frame_number", None), gt, pred])
+
+        fingerprint = hashlib.md5(
+            json_util.dumps(content, sort_keys=True).encode()
+        ).hexdigest()
+
+        if prev_results is not None and fingerprint == d.get(
+            fingerprint_field, None
+        ):
+            for _, gt, pred in content:
+                unchanged_label_ids.update(_get_label_ids(gt, gt_list_field))
+                unchanged_label_ids.update(
+                    _get_label_ids(pred, pred_list_field)
+                )
+        else:
+            changed[str(d["_id"])] = fingerprint
+
+    return changed, unchanged_label_ids
+
+
+def _get_value(doc, path):
+    for key in path.split("."):
+        if doc is None:
+            return None
+
+        doc = doc.get(key, None)
+
+    return doc
+
+
+def _strip_keys(value, keys):
+    if isinstance(value, dict):
+        return {
+            k: _strip_keys(v, keys) for k, v in value.items() if k not in keys
+        }
+
+    if isinstance(value, list):
+        return [_strip_keys(v, keys) for v in value]
+
+    return value
+
+
+def _get_label_ids(label, list_field):
+    if not label:
+        return []
+
+    return [str(l["_id"]) for l in label.get(list_field, None) or []]
+
+
+def _get_unchanged_matches(prev_results, unchanged_label_ids):
+    if prev_results is None:
+        return []
+
+    confs = prev_results.confs
+    if confs is None:
+        confs = itertools.repeat(None)
+    else:
+        confs = confs.tolist()
+
+    matches = []
+    for gt, pred, iou, conf, gt_id, pred_id in zip(
+        prev_results.ytrue.tolist(),
+        prev_results.ypred.tolist(),
+        prev_results.ious.tolist(),
+        confs,
+        prev_results.ytrue_ids.tolist(),
+        prev_results.ypred_ids.tolist(),
+    ):
+        label_id = gt_id if gt_id is not None else pred_id
+        if label_id not in unchanged_label_ids:
+            continue
+
+        # Unmatched objects were stored with the `missing` label
+        if gt_id is None:
+            gt = None
+
+        if pred_id is None:
+            pred = None
+
+        matches.append((gt, pred, iou, conf, gt_id, pred_id))
+
+    return matches
+
+
 def _tally_matches(matches):
     tp = 0
     fp = 0
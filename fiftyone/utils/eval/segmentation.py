@@ -9,21 +9,34 @@ import logging
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import eta.core.image as etai
 
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
+import fiftyone.core.view as fovi
 
-from .base import BaseEvaluationResults
+from .base import (
+    BaseEvaluationResults,
+    _SHARDS_PER_WORKER,
+    _can_shard,
+    _init_worker,
+    _load_shard,
+    _split_ids,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+# Maximum number of mask pixels (and confusion matrix bins) that are computed
+# via a single `np.bincount()` call
+_MAX_BATCH_PIXELS = 2**24
+
+
 def evaluate_segmentations(
     samples,
     pred_field,
@@ -31,6 +44,7 @@ def evaluate_segmentations(
     eval_key=None,
     mask_targets=None,
     method="simple",
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the specified semantic segmentation masks in the given
@@ -78,6 +92,12 @@ def evaluate_segmentations(
             provided, the observed pixel values are used
         method ("simple"): a string specifying the evaluation method to use.
             Supported values are ``("simple")``
+        num_workers (None): an optional number of processes to use. If
+            provided, the samples are split into shards of contiguous sample
+            IDs that are evaluated in parallel. Only supported when
+            ``samples`` is a :class:`fiftyone.core.dataset.Dataset` or a
+            plain :class:`fiftyone.core.view.DatasetView`. By default,
+            evaluation is performed in the main process
         **kwargs: optional keyword arguments for the constructor of the
             :class:`SegmentationEvaluationConfig` being used
 
@@ -95,8 +115,19 @@ def evaluate_segmentations(
     eval_method.register_run(samples, eval_key)
     eval_method.register_samples(samples, eval_key)
 
+    eval_kwargs = {}
+    if num_workers is not None and num_workers > 1:
+        if _can_shard(samples):
+            eval_kwargs["num_workers"] = num_workers
+        else:
+            logger.warning(
+                "Sharded evaluation is not supported for collections of type "
+                "%s; evaluating in the main process",
+                type(samples),
+            )
+
     results = eval_method.evaluate_samples(
-        samples, eval_key=eval_key, mask_targets=mask_targets
+        samples, eval_key=eval_key, mask_targets=mask_targets, **eval_kwargs
     )
     eval_method.save_run_results(samples, eval_key, results)
 
@@ -156,7 +187,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
             dataset.add_frame_field(pre_field, fof.FloatField)
             dataset.add_frame_field(rec_field, fof.FloatField)
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         """Evaluates the predicted segmentation masks in the given samples with
         respect to the specified ground truth masks.
 
@@ -167,6 +200,8 @@ class SegmentationEvaluation(foe.EvaluationMethod):
                 contain a subset of the possible classes if you wish to
                 evaluate a subset of the semantic classes. By default, the
                 observed pixel values are used as labels
+            num_workers (None): an optional number of processes to use to
+                evaluate shards of the samples in parallel
 
         Returns:
             a :class:`SegmentationResults` instance
@@ -252,7 +287,9 @@ class SimpleEvaluation(SegmentationEvaluation):
         config: a :class:`SimpleEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         pred_field = self.config.pred_field
         gt_field = self.config.gt_field
 
@@ -260,73 +297,42 @@ class SimpleEvaluation(SegmentationEvaluation):
             values, classes = zip(*sorted(mask_targets.items()))
         else:
             logger.info("Computing possible mask values...")
-            values = _get_mask_values(samples, pred_field, gt_field)
+            values = _get_mask_values(
+                samples, pred_field, gt_field, num_workers=num_workers
+            )
             classes = [str(v) for v in values]
 
-        _samples = samples.select_fields([gt_field, pred_field])
+        fields = [gt_field, pred_field]
         pred_field, processing_frames = samples._handle_frame_field(pred_field)
         gt_field, _ = samples._handle_frame_field(gt_field)
 
-        nc = len(values)
-        confusion_matrix = np.zeros((nc, nc), dtype=int)
-
-        bandwidth = self.config.bandwidth
-        average = self.config.average
+        args = (
+            pred_field,
+            gt_field,
+            processing_frames,
+            values,
+            self.config.bandwidth,
+            self.config.average,
+            eval_key,
+        )
 
-        if eval_key is not None:
-            acc_field = "%s_accuracy" % eval_key
-            pre_field = "%s_precision" % eval_key
-            rec_field = "%s_recall" % eval_key
+        nc = len(values)
 
         logger.info("Evaluating segmentations...")
-        for sample in _samples.iter_samples(progress=True):
-            if processing_frames:
-                images = sample.frames.values()
-            else:
-                images = [sample]
-
-            sample_conf_mat = np.zeros((nc, nc), dtype=int)
-            for image in images:
-                gt_seg = image[gt_field]
-                if gt_seg is None or not gt_seg.has_mask:
-                    msg = "Skipping sample with missing ground truth mask"
-                    warnings.warn(msg)
-                    continue
-
-                pred_seg = image[pred_field]
-                if pred_seg is None or not pred_seg.has_mask:
-                    msg = "Skipping sample with missing prediction mask"
-                    warnings.warn(msg)
-                    continue
-
-                image_conf_mat = _compute_pixel_confusion_matrix(
-                    pred_seg.get_mask(),
-                    gt_seg.get_mask(),
-                    values,
-                    bandwidth=bandwidth,
-                )
-                sample_conf_mat += image_conf_mat
-
-                # Record frame stats, if requested
-                if processing_frames and eval_key is not None:
-                    facc, fpre, frec = _compute_accuracy_precision_recall(
-                        image_conf_mat, values, average
-                    )
-                    image[acc_field] = facc
-                    image[pre_field] = fpre
-                    image[rec_field] = frec
-
-            confusion_matrix += sample_conf_mat
+        if num_workers is not None and num_workers > 1:
+            shard_conf_mats = _run_sharded(
+                samples, fields, _evaluate_shard, args, num_workers
+            )
+            confusion_matrix = sum(
+                shard_conf_mats, np.zeros((nc, nc), dtype=int)
+            )
 
-            # Record sample stats, if requested
-            if eval_key is not None:
-                sacc, spre, srec = _compute_accuracy_precision_recall(
-                    sample_conf_mat, values, average
-                )
-                sample[acc_field] = sacc
-                sample[pre_field] = spre
-                sample[rec_field] = srec
-                sample.save()
+            # Evaluation results were written by the workers
+            samples._dataset._reload_docs()
+        else:
+            confusion_matrix = _evaluate_samples(
+                samples.select_fields(fields), *args, progress=True
+            )
 
         if nc > 0:
             missing = classes[0] if values[0] == 0 else None
@@ -438,9 +444,135 @@ def _parse_config(pred_field, gt_field, method, **kwargs):
     raise ValueError("Unsupported evaluation method '%s'" % method)
 
 
-def _compute_pixel_confusion_matrix(
-    pred_mask, gt_mask, values, bandwidth=None
+def _evaluate_samples(
+    samples,
+    pred_field,
+    gt_field,
+    processing_frames,
+    values,
+    bandwidth,
+    average,
+    eval_key,
+    progress=False,
 ):
+    nc = len(values)
+    confusion_matrix = np.zeros((nc, nc), dtype=int)
+    max_pairs = _get_max_batch_pairs(nc)
+
+    # Mask pairs are evaluated in batches, which may end partway through the
+    # frames of a video. Each pair contributes to the running confusion
+    # matrix of its sample, and samples whose pairs have all been evaluated
+    # are pending until the next batch is evaluated
+    batch = []
+    pending = []
+    num_pixels = 0
+
+    with samples.save_context() as context:
+        for sample in samples.iter_samples(progress=progress):
+            if processing_frames:
+                images = sample.frames.values()
+            else:
+                images = [sample]
+
+            sample_conf_mat = np.zeros((nc, nc), dtype=int)
+            for image in images:
+                gt_seg = image[gt_field]
+                if gt_seg is None or not gt_seg.has_mask:
+                    msg = "Skipping sample with missing ground truth mask"
+                    warnings.warn(msg)
+                    continue
+
+                pred_seg = image[pred_field]
+                if pred_seg is None or not pred_seg.has_mask:
+                    msg = "Skipping sample with missing prediction mask"
+                    warnings.warn(msg)
+                    continue
+
+                pred_mask, gt_mask = _prepare_masks(
+                    pred_seg.get_mask(), gt_seg.get_mask(), bandwidth
+                )
+                batch.append((image, pred_mask, gt_mask, sample_conf_mat))
+                num_pixels += gt_mask.size
+
+                if num_pixels >= _MAX_BATCH_PIXELS or len(batch) >= max_pairs:
+                    confusion_matrix += _evaluate_batch(
+                        batch, values, average, eval_key, processing_frames
+                    )
+                    _record_samples(
+                        pending, values, average, eval_key, context
+                    )
+                    batch = []
+                    pending = []
+                    num_pixels = 0
+
+            pending.append((sample, sample_conf_mat))
+
+        if batch:
+            confusion_matrix += _evaluate_batch(
+                batch, values, average, eval_key, processing_frames
+            )
+
+        _record_samples(pending, values, average, eval_key, context)
+
+    return confusion_matrix
+
+
+def _evaluate_batch(batch, values, average, eval_key, processing_frames):
+    if eval_key is not None:
+        acc_field = "%s_accuracy" % eval_key
+        pre_field = "%s_precision" % eval_key
+        rec_field = "%s_recall" % eval_key
+
+    nc = len(values)
+    confusion_matrix = np.zeros((nc, nc), dtype=int)
+
+    mask_pairs = [(p, g) for _, p, g, _ in batch]
+    image_conf_mats = _compute_pixel_confusion_matrices(mask_pairs, values)
+
+    for (image, _, _, sample_conf_mat), image_conf_mat in zip(
+        batch, image_conf_mats
+    ):
+        sample_conf_mat += image_conf_mat
+        confusion_matrix += image_conf_mat
+
+        # Record frame stats, if requested
+        if processing_frames and eval_key is not None:
+            facc, fpre, frec = _compute_accuracy_precision_recall(
+                image_conf_mat, values, average
+            )
+            image[acc_field] = facc
+            image[pre_field] = fpre
+            image[rec_field] = frec
+
+    return confusion_matrix
+
+
+def _record_samples(pending, values, average, eval_key, ctx):
+    # Records the stats of samples whose mask pairs have all been evaluated
+    if eval_key is None:
+        return
+
+    acc_field = "%s_accuracy" % eval_key
+    pre_field = "%s_precision" % eval_key
+    rec_field = "%s_recall" % eval_key
+
+    for sample, sample_conf_mat in pending:
+        sacc, spre, srec = _compute_accuracy_precision_recall(
+            sample_conf_mat, values, average
+        )
+        sample[acc_field] = sacc
+        sample[pre_field] = spre
+        sample[rec_field] = srec
+        ctx.save(sample)
+
+
+def _get_max_batch_pairs(nc):
+    # `_compute_pixel_confusion_matrices()` allocates `num_pairs * nc * nc`
+    # bins, so the number of mask pairs per batch is limited accordingly
+    return max(1, _MAX_BATCH_PIXELS // max(1, nc * nc))
+
+
+def _prepare_masks(pred_mask, gt_mask, bandwidth):
     if pred_mask.shape != gt_mask.shape:
         msg = (
             "Resizing predicted mask with shape %s to match ground truth mask "
@@ -455,15 +587,101 @@ def _compute_pixel_confusion_matrix(
             pred_mask, gt_mask, bandwidth
         )
 
-    try:
-        return skm.confusion_matrix(
-            gt_mask.ravel(), pred_mask.ravel(), labels=values
+    return pred_mask, gt_mask
+
+
+def _compute_pixel_confusion_matrices(mask_pairs, values):
+    # Computes the confusion matrices of all mask pairs via a single
+    # `np.bincount()` over the flattened (pair, gt, pred) indices. Pixels whose
+    # values are not in `values` are ignored
+    num_pairs = len(mask_pairs)
+    nc = len(values)
+    values = np.asarray(values)
+
+    inds = []
+    for idx, (pred_mask, gt_mask) in enumerate(mask_pairs):
+        gt_inds, gt_found = _get_value_indices(gt_mask.ravel(), values)
+        pred_inds, pred_found = _get_value_indices(pred_mask.ravel(), values)
+        found = gt_found & pred_found
+        inds.append(idx * nc * nc + gt_inds[found] * nc + pred_inds[found])
+
+    if inds:
+        inds = np.concatenate(inds)
+    else:
+        inds = np.zeros(0, dtype=int)
+
+    counts = np.bincount(inds, minlength=num_pairs * nc * nc)
+    return counts.reshape((num_pairs, nc, nc))
+
+
+def _get_value_indices(arr, values):
+    nc = len(values)
+
+    if nc == 0:
+        return np.zeros(arr.shape, dtype=int), np.zeros(arr.shape, dtype=bool)
+
+    if (
+        np.issubdtype(arr.dtype, np.integer)
+        and values[0] == 0
+        and values[-1] == nc - 1
+    ):
+        # Values are 0, 1, ..., nc - 1, so they are their own indices
+        inds = arr.astype(int)
+        found = (inds >= 0) & (inds < nc)
+        inds[~found] = 0
+        return inds, found
+
+    inds = np.searchsorted(values, arr)
+    inds[inds >= nc] = 0
+    found = values[inds] == arr
+
+    return inds, found
+
+
+def _run_sharded(samples, fields, shard_fcn, args, num_workers):
+    if isinstance(samples, fovi.DatasetView):
+        stages = samples._serialize()
+    else:
+        stages = None
+
+    ids = sorted(samples.values("_id"))
+    num_shards = min(len(ids), _SHARDS_PER_WORKER * num_workers)
+
+    tasks = []
+    for shard_ids in _split_ids(ids, num_shards):
+        tasks.append(
+            (
+                samples._dataset.name,
+                stages,
+                fields,
+                str(shard_ids[0]),
+                str(shard_ids[-1]),
+                len(shard_ids),
+                args,
+            )
         )
-    except ValueError:
-        # Assume that no `values` appear in `gt_mask`, which causes
-        # `skm.confusion_matrix` to raise an error
-        num_classes = len(values)
-        return np.zeros((num_classes, num_classes), dtype=int)
+
+    results = []
+    ctx = fou.get_multiprocessing_context()
+    with fou.ProgressBar(total=len(ids)) as pb:
+        with ctx.Pool(num_workers, initializer=_init_worker) as pool:
+            for result, num_samples in pool.imap_unordered(shard_fcn, tasks):
+                results.append(result)
+                pb.update(count=num_samples)
+
+    return results
+
+
+def _evaluate_shard(task):
+    dataset_name, stages, fields, first_id, last_id, num_samples, args = task
+    samples = _load_shard(dataset_name, stages, fields, first_id, last_id)
+    return _evaluate_samples(samples, *args), num_samples
+
+
+def _get_mask_values_shard(task):
+    dataset_name, stages, fields, first_id, last_id, num_samples, args = task
+    samples = _load_shard(dataset_name, stages, fields, first_id, last_id)
+    return _get_samples_mask_values(samples, *args), num_samples
 
 
 def _extract_contour_band_values(pred_mask, gt_mask, bandwidth):
@@ -481,14 +699,32 @@ def _compute_accuracy_precision_recall(confusion_matrix, values, average):
     return metrics["accuracy"], metrics["precision"], metrics["recall"]
 
 
-def _get_mask_values(samples, pred_field, gt_field):
-    _samples = samples.select_fields([gt_field, pred_field])
+def _get_mask_values(samples, pred_field, gt_field, num_workers=None):
+    fields = [gt_field, pred_field]
     pred_field, processing_frames = samples._handle_frame_field(pred_field)
     gt_field, _ = samples._handle_frame_field(gt_field)
 
+    args = (pred_field, gt_field, processing_frames)
+
+    if num_workers is not None and num_workers > 1:
+        shard_values = _run_sharded(
+            samples, fields, _get_mask_values_shard, args, num_workers
+        )
+        values = set().union(*shard_values)
+    else:
+        values = _get_samples_mask_values(
+            samples.select_fields(fields), *args, progress=True
+        )
+
+    return sorted(values)
+
+
+def _get_samples_mask_values(
+    samples, pred_field, gt_field, processing_frames, progress=False
+):
     values = set()
 
-    for sample in _samples.iter_samples(progress=True):
+    for sample in samples.iter_samples(progress=progress):
         if processing_frames:
             images = sample.frames.values()
         else:
@@ -498,6 +734,6 @@ def _get_mask_values(samples, pred_field, gt_field):
             for field in (pred_field, gt_field):
                 seg = image[field]
                 if seg is not None and seg.has_mask:
-                    values.update(seg.get_mask().ravel())
+                    values.update(np.unique(seg.get_mask()).tolist())
 
-    return sorted(values)
+    return values
@@ -5,9 +5,14 @@ Image utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import OrderedDict
+import hashlib
 import logging
 import multiprocessing
 import os
+import threading
+
+import numpy as np
 
 import eta.core.image as etai
 import eta.core.utils as etau
@@ -215,6 +220,166 @@ def transform_image(
     )
 
 
+class ImageCache(object):
+    """A cache of decoded images.
+
+    Images are decoded via :func:`eta.core.image.read` the first time they
+    are requested and served from the cache thereafter. Cached images are
+    keyed by their path, modification time, and size, so images that are
+    modified on disk are automatically decoded again.
+
+    By default, decoded images are stored in memory in a least recently used
+    cache of bounded size. In-memory caches are local to each process, so
+    they are not shared by the worker processes of a
+    :class:`torch:torch.utils.data.DataLoader`.
+
+    If a ``cache_dir`` is provided, decoded images are instead written to
+    uncompressed ``.npy`` files in that directory and loaded via memory
+    mapping. On-disk caches are shared by all processes that use the same
+    directory and persist until :meth:`clear` is called.
+
+    Examples::
+
+        import fiftyone as fo
+        import fiftyone.utils.image as foui
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        image_cache = foui.ImageCache(cache_dir="/tmp/image-cache")
+
+        # Each image is only decoded once
+        for name in ("resnet50-imagenet-torch", "mobilenet-v2-imagenet-torch"):
+            model = foz.load_zoo_model(name)
+            dataset.compute_embeddings(model, image_cache=image_cache)
+
+    Args:
+        cache_dir (None): an optional directory in which to store decoded
+            images
+        max_size (1073741824): the maximum size, in bytes, of the in-memory
+            cache. Only applicable when no ``cache_dir`` is provided
+    """
+
+    def __init__(self, cache_dir=None, max_size=1024**3):
+        if cache_dir is not None:
+            cache_dir = fou.normalize_path(cache_dir)
+            etau.ensure_dir(cache_dir)
+
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+        self._images = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        if self.cache_dir is not None:
+            return len(etau.list_files(self.cache_dir))
+
+        return len(self._images)
+
+    def __getstate__(self):
+        # In-memory caches are not transferred to other processes
+        d = self.__dict__.copy()
+        d["_images"] = OrderedDict()
+        d["_size"] = 0
+        d.pop("_lock")
+        return d
+
+    def __setstate__(self, d):
+        self.__dict__.update(d)
+        self._lock = threading.Lock()
+
+    def read(self, image_path, flag=None, copy=True):
+        """Reads the given image, using the cache when possible.
+
+        Args:
+            image_path: the path to the image
+            flag (None): an optional OpenCV image format flag to pass to
+                :func:`eta.core.image.read`
+            copy (True): whether to return a writable copy of the image. If
+                False, a read-only array is returned that must not be modified
+
+        Returns:
+            the image
+        """
+        key = self._get_key(image_path, flag)
+
+        if self.cache_dir is not None:
+            img = self._read_disk(key, image_path, flag)
+        else:
+            img = self._read_memory(key, image_path, flag)
+
+        if copy:
+            img = np.array(img)
+
+        return img
+
+    def clear(self):
+        """Deletes all images from the cache."""
+        with self._lock:
+            self._images.clear()
+            self._size = 0
+
+        if self.cache_dir is not None:
+            for filename in etau.list_files(self.cache_dir):
+                etau.delete_file(os.path.join(self.cache_dir, filename))
+
+    def _get_key(self, image_path, flag):
+        st = os.stat(image_path)
+        key = "%s:%d:%d:%s" % (image_path, st.st_mtime_ns, st.st_size, flag)
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _read_memory(self, key, image_path, flag):
+        with self._lock:
+            img = self._images.get(key, None)
+            if img is not None:
+                self._images.move_to_end(key)
+                return img
+
+        img = etai.read(image_path, flag=flag)
+        img.flags.writeable = False
+
+        if img.nbytes > self.max_size:
+            return img
+
+        with self._lock:
+            if key not in self._images:
+                self._images[key] = img
+                self._size += img.nbytes
+
+            while self._size > self.max_size:
+                _, _img = self._images.popitem(last=False)
+                self._size -= _img.nbytes
+
+        return img
+
+    def _read_disk(self, key, image_path, flag):
+        cache_path = os.path.join(self.cache_dir, key + ".npy")
+
+        try:
+            return np.load(cache_path, mmap_mode="r")
+        except (FileNotFoundError, ValueError):
+            pass
+
+        img = etai.read(image_path, flag=flag)
+
+        # Write to a temporary path and atomically rename it so that
+        # concurrent readers never see partial files
+        tmp_path = "%s.%d.%d.tmp" % (
+            cache_path,
+            os.getpid(),
+            threading.get_ident(),
+        )
+        with open(tmp_path, "wb") as f:
+            np.save(f, img)
+
+        os.replace(tmp_path, cache_path)
+
+        img.flags.writeable = False
+        return img
+
+
 def _transform_images(
     sample_collection,
     size=None,
@@ -21,6 +21,10 @@ sg = fou.lazy_import("shapely.geometry")
 so = fou.lazy_import("shapely.ops")
 
 
+# Maximum number of box pairs whose IoUs are computed at once
+_MAX_PAIRS_PER_BATCH = 1000000
+
+
 def compute_ious(
     preds,
     gts,
@@ -168,6 +172,62 @@ def compute_max_ious(
     )
     _other_field, _ = sample_collection._handle_frame_field(other_field)
 
+    results = None
+    if _can_use_bbox_arrays(kwargs):
+        results = _compute_max_ious_arrays(
+            sample_collection, label_field, other_field, **kwargs
+        )
+
+    if results is not None:
+        max_ious1, max_ious2, label_ids1, label_ids2 = results
+    else:
+        max_ious1, max_ious2, label_ids1, label_ids2 = _compute_max_ious_loop(
+            sample_collection,
+            label_field,
+            other_field,
+            _label_field,
+            _other_field,
+            is_frame_field,
+            **kwargs,
+        )
+
+    _, iou_path1 = sample_collection._get_label_field_path(
+        label_field, iou_attr
+    )
+
+    sample_collection.set_values(iou_path1, max_ious1)
+
+    if id_attr is not None:
+        _, id_path1 = sample_collection._get_label_field_path(
+            label_field, id_attr
+        )
+
+        sample_collection.set_values(id_path1, label_ids1)
+
+    if other_field != label_field:
+        _, iou_path2 = sample_collection._get_label_field_path(
+            other_field, iou_attr
+        )
+
+        sample_collection.set_values(iou_path2, max_ious2)
+
+        if id_attr is not None:
+            _, id_path2 = sample_collection._get_label_field_path(
+                other_field, id_attr
+            )
+
+            sample_collection.set_values(id_path2, label_ids2)
+
+
+def _compute_max_ious_loop(
+    sample_collection,
+    label_field,
+    other_field,
+    _label_field,
+    _other_field,
+    is_frame_field,
+    **kwargs,
+):
     if other_field != label_field:
         view = sample_collection.select_fields([label_field, other_field])
     else:
@@ -206,32 +266,7 @@ def compute_max_ious(
             label_ids1.append(id1)
             label_ids2.append(id2)
 
-    _, iou_path1 = sample_collection._get_label_field_path(
-        label_field, iou_attr
-    )
-
-    sample_collection.set_values(iou_path1, max_ious1)
-
-    if id_attr is not None:
-        _, id_path1 = sample_collection._get_label_field_path(
-            label_field, id_attr
-        )
-
-        sample_collection.set_values(id_path1, label_ids1)
-
-    if other_field != label_field:
-        _, iou_path2 = sample_collection._get_label_field_path(
-            other_field, iou_attr
-        )
-
-        sample_collection.set_values(iou_path2, max_ious2)
-
-        if id_attr is not None:
-            _, id_path2 = sample_collection._get_label_field_path(
-                other_field, id_attr
-            )
-
-            sample_collection.set_values(id_path2, label_ids2)
+    return max_ious1, max_ious2, label_ids1, label_ids2
 
 
 def find_duplicates(
@@ -271,6 +306,16 @@ def find_duplicates(
         sample_collection, label_field, (fol.Detections, fol.Polylines)
     )
 
+    if method not in ("simple", "greedy"):
+        raise ValueError("Unsupported method '%s'" % method)
+
+    if _can_use_bbox_arrays(kwargs):
+        dup_ids = _find_duplicates_arrays(
+            sample_collection, label_field, iou_thresh, method, **kwargs
+        )
+        if dup_ids is not None:
+            return dup_ids
+
     _label_field, is_frame_field = sample_collection._handle_frame_field(
         label_field
     )
@@ -295,11 +340,24 @@ def find_duplicates(
     return dup_ids
 
 
+def _can_use_bbox_arrays(kwargs):
+    # Whether the IoUs requested by the given `compute_ious()` kwargs can be
+    # computed from bounding boxes alone by the vectorized implementation
+    iscrowd = kwargs.get("iscrowd", None)
+    if iscrowd is not None and not etau.is_str(iscrowd):
+        return False
+
+    return not set(kwargs.keys()) - {"iscrowd", "classwise"}
+
+
 def _compute_max_ious(doc, field1, field2, **kwargs):
     if field1 != field2:
         labels1 = _get_labels(doc, field1)
         labels2 = _get_labels(doc, field2)
 
+        if labels1 is None and labels2 is None:
+            return None, None, None, None
+
         ious = compute_ious(labels1, labels2, **kwargs)
 
         return _extract_max_ious(ious, labels1, labels2)
@@ -402,9 +460,9 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
     is_symmetric = preds is gts
 
     if iscrowd is not None:
-        gt_crowds = [iscrowd(gt) for gt in gts]
+        gt_crowds = np.array([iscrowd(gt) for gt in gts], dtype=bool)
     else:
-        gt_crowds = [False] * len(gts)
+        gt_crowds = None
 
     if isinstance(preds[0], fol.Polyline):
         preds = _polylines_to_detections(preds)
@@ -414,45 +472,330 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
         else:
             gts = _polylines_to_detections(gts)
 
-    ious = np.zeros((len(preds), len(gts)))
+    num_preds = len(preds)
+    num_gts = len(gts)
 
-    for j, (gt, gt_crowd) in enumerate(zip(gts, gt_crowds)):
-        gx, gy, gw, gh = gt.bounding_box
-        gt_area = gh * gw
+    pred_boxes = _to_bbox_array(preds)
+    gt_boxes = pred_boxes if is_symmetric else _to_bbox_array(gts)
 
-        for i, pred in enumerate(preds):
-            if is_symmetric and i < j:
-                iou = ious[j, i]
-            elif is_symmetric and i == j:
-                iou = 1
-            elif classwise and pred.label != gt.label:
-                continue
+    inds1 = np.repeat(np.arange(num_preds), num_gts)
+    inds2 = np.tile(np.arange(num_gts), num_preds)
+
+    ious = _compute_bbox_ious_arrays(
+        pred_boxes, gt_boxes, inds1, inds2, crowds2=gt_crowds
+    )
+
+    if classwise:
+        pred_labels = np.array([pred.label for pred in preds], dtype=object)
+        gt_labels = np.array([gt.label for gt in gts], dtype=object)
+        ious[pred_labels[inds1] != gt_labels[inds2]] = 0
+
+    ious = ious.reshape(num_preds, num_gts)
+
+    if is_symmetric:
+        # Mirror the lower triangle so that the result is exactly symmetric
+        ious = np.tril(ious, k=-1)
+        ious += ious.T
+        np.fill_diagonal(ious, 1)
+
+    return ious
+
+
+def _to_bbox_array(detections):
+    return np.array(
+        [detection.bounding_box for detection in detections], dtype=float
+    ).reshape(-1, 4)
+
+
+def _compute_bbox_ious_arrays(boxes1, boxes2, inds1, inds2, crowds2=None):
+    # IoUs between `boxes1[inds1]` (predictions) and `boxes2[inds2]` (ground
+    # truth), where boxes are `[top-left-x, top-left-y, width, height]`
+    px, py, pw, ph = boxes1[inds1].T
+    gx, gy, gw, gh = boxes2[inds2].T
+
+    # Width and height of intersection
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+
+    overlaps = (w > 0) & (h > 0)
+    inter = np.where(overlaps, h * w, 0.0)
+
+    pred_areas = ph * pw
+    union = pred_areas + gh * gw - inter
+
+    if crowds2 is not None:
+        union = np.where(crowds2[inds2], pred_areas, union)
+
+    ious = np.zeros(len(inds1))
+    np.divide(inter, union, out=ious, where=overlaps & (union != 0))
+
+    return np.minimum(ious, 1, out=ious)
+
+
+def _get_bbox_arrays(sample_collection, label_field, iscrowd=None):
+    # Loads the boxes of all objects in `label_field` into contiguous arrays,
+    # or returns None if the field's contents are not supported
+    label_type, boxes_path = sample_collection._get_label_field_path(
+        label_field, "bounding_box"
+    )
+
+    if label_type is not fol.Detections:
+        return None
+
+    paths = [
+        boxes_path,
+        sample_collection._get_label_field_path(label_field, "label")[1],
+        sample_collection._get_label_field_path(label_field, "id")[1],
+    ]
+
+    if iscrowd is not None:
+        _, crowd_path = sample_collection._get_label_field_path(
+            label_field, iscrowd
+        )
+
+        # Crowd attributes that are not declared fields may be stored in
+        # dynamic `attributes`, which we don't handle here
+        if sample_collection.get_field(crowd_path) is None:
+            return None
+
+        paths.append(crowd_path)
+
+    results = sample_collection.values(paths, as_arrays=True)
+
+    boxes, box_offsets = results[0]
+    coord_offsets = box_offsets[-1]
+
+    # All boxes must have exactly 4 numeric coordinates
+    if boxes.dtype == object or np.any(np.diff(coord_offsets) != 4):
+        return None
+
+    boxes = boxes.reshape(-1, 4)
+    offsets = box_offsets[:-1]
+    labels = results[1][0]
+    ids = results[2][0]
+
+    if iscrowd is not None:
+        crowds = np.array(
+            [bool(c) for c in results[3][0].tolist()], dtype=bool
+        )
+    else:
+        crowds = None
+
+    return boxes, labels, ids, crowds, offsets
+
+
+def _iter_bbox_ious(
+    boxes1,
+    boxes2,
+    offsets1,
+    offsets2,
+    labels1=None,
+    labels2=None,
+    crowds2=None,
+    symmetric=False,
+):
+    # Generates `(inds1, inds2, ious)` for all pairs of boxes that belong to
+    # the same sample/frame, as defined by `offsets1` and `offsets2`, in
+    # chunks of at most ~`_MAX_PAIRS_PER_BATCH` pairs. When `symmetric` is
+    # True, self-pairs are omitted
+    starts1 = offsets1[:-1]
+    starts2 = offsets2[:-1]
+    counts1 = np.diff(offsets1)
+    counts2 = np.diff(offsets2)
+    num_pairs = counts1 * counts2
+    cum_pairs = np.cumsum(num_pairs)
+
+    num_groups = len(counts1)
+    start = 0
+    while start < num_groups:
+        offset = cum_pairs[start - 1] if start > 0 else 0
+        end = np.searchsorted(
+            cum_pairs, offset + _MAX_PAIRS_PER_BATCH, side="right"
+        )
+        end = max(end, start + 1)
+
+        _num_pairs = num_pairs[start:end]
+        total = _num_pairs.sum()
+        if total > 0:
+            groups = np.repeat(np.arange(start, end), _num_pairs)
+            pos = np.arange(total) - np.repeat(
+                np.cumsum(_num_pairs) - _num_pairs, _num_pairs
+            )
+
+            _counts2 = counts2[groups]
+            inds1 = starts1[groups] + pos // _counts2
+            inds2 = starts2[groups] + pos % _counts2
+
+            if symmetric:
+                keep = inds1 != inds2
+                inds1 = inds1[keep]
+                inds2 = inds2[keep]
+
+                # Match the convention of `compute_ious()`, in which the
+                # latter object is the prediction
+                ious = _compute_bbox_ious_arrays(
+                    boxes1,
+                    boxes2,
+                    np.maximum(inds1, inds2),
+                    np.minimum(inds1, inds2),
+                    crowds2=crowds2,
+                )
             else:
-                px, py, pw, ph = pred.bounding_box
-                pred_area = ph * pw
+                ious = _compute_bbox_ious_arrays(
+                    boxes1, boxes2, inds1, inds2, crowds2=crowds2
+                )
 
-                # Width of intersection
-                w = min(px + pw, gx + gw) - max(px, gx)
-                if w <= 0:
-                    continue
+            if labels1 is not None:
+                ious[labels1[inds1] != labels2[inds2]] = 0
 
-                # Height of intersection
-                h = min(py + ph, gy + gh) - max(py, gy)
-                if h <= 0:
-                    continue
+            yield inds1, inds2, ious
 
-                inter = h * w
+        start = end
 
-                if gt_crowd:
-                    union = pred_area
-                else:
-                    union = pred_area + gt_area - inter
 
-                iou = min(etan.safe_divide(inter, union), 1)
+def _reduce_max_ious(inds, other_inds, ious, max_ious, max_inds):
+    # Records the max IoU (and the first index achieving it) for each `inds`
+    order = np.lexsort((other_inds, -ious, inds))
+    inds = inds[order]
+    first = np.ones(len(inds), dtype=bool)
+    first[1:] = inds[1:] != inds[:-1]
 
-            ious[i, j] = iou
+    max_ious[inds[first]] = ious[order][first]
+    max_inds[inds[first]] = other_inds[order][first]
 
-    return ious
+
+def _compute_max_ious_arrays(
+    sample_collection, label_field, other_field, iscrowd=None, classwise=False
+):
+    arrays1 = _get_bbox_arrays(sample_collection, label_field, iscrowd=iscrowd)
+    if arrays1 is None:
+        return None
+
+    symmetric = other_field == label_field
+
+    if symmetric:
+        arrays2 = arrays1
+    else:
+        arrays2 = _get_bbox_arrays(
+            sample_collection, other_field, iscrowd=iscrowd
+        )
+        if arrays2 is None:
+            return None
+
+    boxes1, labels1, ids1, _, offsets1 = arrays1
+    boxes2, labels2, ids2, crowds2, offsets2 = arrays2
+
+    if not classwise:
+        labels1 = None
+        labels2 = None
+
+    num1 = len(boxes1)
+    num2 = len(boxes2)
+    max_ious1 = np.full(num1, np.nan)
+    max_ious2 = np.full(num2, np.nan)
+    max_inds1 = np.full(num1, -1)
+    max_inds2 = np.full(num2, -1)
+
+    for inds1, inds2, ious in _iter_bbox_ious(
+        boxes1,
+        boxes2,
+        offsets1[-1],
+        offsets2[-1],
+        labels1=labels1,
+        labels2=labels2,
+        crowds2=crowds2,
+        symmetric=symmetric,
+    ):
+        _reduce_max_ious(inds1, inds2, ious, max_ious1, max_inds1)
+        if not symmetric:
+            _reduce_max_ious(inds2, inds1, ious, max_ious2, max_inds2)
+
+    ious1, label_ids1 = _parse_max_ious(max_ious1, max_inds1, ids2, offsets1)
+
+    if symmetric:
+        return ious1, ious1, label_ids1, label_ids1
+
+    ious2, label_ids2 = _parse_max_ious(max_ious2, max_inds2, ids1, offsets2)
+
+    return ious1, ious2, label_ids1, label_ids2
+
+
+def _parse_max_ious(max_ious, max_inds, other_ids, offsets):
+    found = max_inds >= 0
+    ious = [float(i) if f else None for i, f in zip(max_ious, found)]
+    ids = [str(other_ids[i]) if f else None for i, f in zip(max_inds, found)]
+
+    return _unflatten(ious, offsets), _unflatten(ids, offsets)
+
+
+def _find_duplicates_arrays(
+    sample_collection,
+    label_field,
+    iou_thresh,
+    method,
+    iscrowd=None,
+    classwise=False,
+):
+    arrays = _get_bbox_arrays(sample_collection, label_field, iscrowd=iscrowd)
+    if arrays is None:
+        return None
+
+    boxes, labels, ids, crowds, offsets = arrays
+
+    if not classwise:
+        labels = None
+
+    group_offsets = offsets[-1]
+
+    dup_inds = []
+    for inds1, inds2, ious in _iter_bbox_ious(
+        boxes,
+        boxes,
+        group_offsets,
+        group_offsets,
+        labels1=labels,
+        labels2=labels,
+        crowds2=crowds,
+        symmetric=True,
+    ):
+        # Only the upper triangle is relevant
+        keep = (inds1 < inds2) & (ious > iou_thresh)
+        inds1 = inds1[keep]
+        inds2 = inds2[keep]
+        ious = ious[keep]
+
+        if method == "simple":
+            dup_inds.append(np.unique(inds2))
+            continue
+
+        # Greedy deduplication is only needed for groups with duplicates
+        groups = np.searchsorted(group_offsets, inds1, side="right") - 1
+        for group in np.unique(groups):
+            in_group = groups == group
+            start = group_offsets[group]
+            num = group_offsets[group + 1] - start
+
+            _ious = np.zeros((num, num))
+            _ious[inds1[in_group] - start, inds2[in_group] - start] = ious[
+                in_group
+            ]
+
+            _dup_inds = _find_duplicates_greedy(_ious, iou_thresh)
+            dup_inds.append(np.asarray(_dup_inds, dtype=int) + start)
+
+    if not dup_inds:
+        return []
+
+    dup_inds = np.unique(np.concatenate(dup_inds))
+
+    return [str(ids[i]) for i in dup_inds]
+
+
+def _unflatten(values, offsets):
+    for _offsets in reversed(offsets):
+        values = [values[i:j] for i, j in zip(_offsets[:-1], _offsets[1:])]
+
+    return values
 
 
 def _compute_polyline_ious(
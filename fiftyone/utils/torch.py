@@ -382,7 +382,7 @@ class TorchImageModel(
         frame_size = (width, height)
 
         if self._using_gpu:
-            imgs = imgs.cuda()
+            imgs = imgs.cuda(non_blocking=True)
 
         if self._using_half_precision:
             imgs = imgs.half()
@@ -1057,6 +1057,9 @@ class TorchImageDataset(Dataset):
         force_rgb (False): whether to force convert the images to RGB
         skip_failures (False): whether to return an ``Exception`` object rather
             than raising it if an error occurs while loading a sample
+        image_cache (None): an optional
+            :class:`fiftyone.utils.image.ImageCache` from which to load the
+            images
     """
 
     def __init__(
@@ -1069,6 +1072,7 @@ class TorchImageDataset(Dataset):
         use_numpy=False,
         force_rgb=False,
         skip_failures=False,
+        image_cache=None,
     ):
         image_paths, sample_ids = self._parse_inputs(
             image_paths=image_paths,
@@ -1083,6 +1087,7 @@ class TorchImageDataset(Dataset):
         self.force_rgb = force_rgb
         self.use_numpy = use_numpy
         self.skip_failures = skip_failures
+        self.image_cache = image_cache
 
     def __len__(self):
         return len(self.image_paths)
@@ -1091,7 +1096,12 @@ class TorchImageDataset(Dataset):
         try:
             image_path = self.image_paths[idx].decode()
 
-            img = _load_image(image_path, self.use_numpy, self.force_rgb)
+            img = _load_image(
+                image_path,
+                self.use_numpy,
+                self.force_rgb,
+                image_cache=self.image_cache,
+            )
 
             if self.transform is not None:
                 img = self.transform(img)
@@ -1337,6 +1347,9 @@ class TorchImagePatchesDataset(Dataset):
             to contract the boxes by 10%
         skip_failures (False): whether to return an ``Exception`` object rather
             than raising it if an error occurs while loading a sample
+        image_cache (None): an optional
+            :class:`fiftyone.utils.image.ImageCache` from which to load the
+            images
     """
 
     def __init__(
@@ -1355,6 +1368,7 @@ class TorchImagePatchesDataset(Dataset):
         force_square=False,
         alpha=None,
         skip_failures=False,
+        image_cache=None,
     ):
         image_paths, sample_ids, patch_edges, patches = self._parse_inputs(
             image_paths=image_paths,
@@ -1375,6 +1389,7 @@ class TorchImagePatchesDataset(Dataset):
         self.force_square = force_square
         self.alpha = alpha
         self.skip_failures = skip_failures
+        self.image_cache = image_cache
 
         self._patch_edges = patch_edges
         self._patches = patches
@@ -1411,7 +1426,9 @@ class TorchImagePatchesDataset(Dataset):
         return self.sample_ids is not None
 
     def _extract_patches(self, image_path, patches):
-        img = _load_image(image_path, True, self.force_rgb)
+        img = _load_image(
+            image_path, True, self.force_rgb, image_cache=self.image_cache
+        )
 
         img_patches = []
         for bounding_box in patches:
@@ -1589,7 +1606,13 @@ def from_image_classification_dir_tree(dataset_dir):
     return torchvision.datasets.ImageFolder(dataset_dir)
 
 
-def _load_image(image_path, use_numpy, force_rgb):
+def _load_image(image_path, use_numpy, force_rgb, image_cache=None):
+    if image_cache is not None:
+        # pylint: disable=no-member
+        flag = cv2.IMREAD_COLOR if force_rgb else cv2.IMREAD_UNCHANGED
+        img = image_cache.read(image_path, flag=flag, copy=use_numpy)
+        return img if use_numpy else Image.fromarray(img)
+
     if use_numpy:
         # pylint: disable=no-member
         flag = cv2.IMREAD_COLOR if force_rgb else cv2.IMREAD_UNCHANGED
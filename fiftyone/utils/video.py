@@ -5,10 +5,14 @@ Video utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import deque
 import itertools
 import json
 import logging
 import os
+import threading
+
+import psutil
 
 import eta.core.frameutils as etaf
 import eta.core.image as etai
@@ -24,6 +28,10 @@ import fiftyone.core.validation as fov
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of jobs per worker that may be queued when processing videos
+# in a worker pool
+_MAX_PENDING_JOBS_PER_WORKER = 4
+
 
 def extract_clip(
     video_path,
@@ -93,6 +101,8 @@ def reencode_videos(
     output_dir=None,
     rel_dir=None,
     delete_originals=False,
+    num_workers=None,
+    timeout=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -141,6 +151,12 @@ def reencode_videos(
         delete_originals (False): whether to delete the original videos after
             re-encoding. This parameter has no effect if the videos are being
             updated in-place
+        num_workers (None): the number of worker processes to use. By default,
+            videos are processed serially in the calling process
+        timeout (None): an optional timeout, in seconds, after which the
+            ``ffmpeg`` processes for a video are killed and the video is
+            treated as a failure. When a timeout is provided, videos are
+            always processed in worker processes
         skip_failures (False): whether to gracefully continue without raising
             an error if a video cannot be re-encoded
         verbose (False): whether to log the ``ffmpeg`` commands that are
@@ -158,6 +174,8 @@ def reencode_videos(
         output_dir=output_dir,
         rel_dir=rel_dir,
         delete_originals=delete_originals,
+        num_workers=num_workers,
+        timeout=timeout,
         skip_failures=skip_failures,
         verbose=verbose,
         **kwargs,
@@ -179,6 +197,8 @@ def transform_videos(
     output_dir=None,
     rel_dir=None,
     delete_originals=False,
+    num_workers=None,
+    timeout=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -239,6 +259,12 @@ def transform_videos(
             ``output_dir`` that match the shape of the input paths
         delete_originals (False): whether to delete the original videos after
             re-encoding
+        num_workers (None): the number of worker processes to use. By default,
+            videos are processed serially in the calling process
+        timeout (None): an optional timeout, in seconds, after which the
+            ``ffmpeg`` processes for a video are killed and the video is
+            treated as a failure. When a timeout is provided, videos are
+            always processed in worker processes
         skip_failures (False): whether to gracefully continue without raising
             an error if a video cannot be transformed
         verbose (False): whether to log the ``ffmpeg`` commands that are
@@ -262,6 +288,8 @@ def transform_videos(
         output_dir=output_dir,
         rel_dir=rel_dir,
         delete_originals=delete_originals,
+        num_workers=num_workers,
+        timeout=timeout,
         skip_failures=skip_failures,
         verbose=verbose,
         **kwargs,
@@ -285,6 +313,8 @@ def sample_videos(
     output_dir=None,
     rel_dir=None,
     delete_originals=False,
+    num_workers=None,
+    timeout=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -384,6 +414,12 @@ def sample_videos(
             folder structure
         delete_originals (False): whether to delete the original videos after
             sampling
+        num_workers (None): the number of worker processes to use. By default,
+            videos are processed serially in the calling process
+        timeout (None): an optional timeout, in seconds, after which the
+            ``ffmpeg`` processes for a video are killed and the video is
+            treated as a failure. When a timeout is provided, videos are
+            always processed in worker processes
         skip_failures (False): whether to gracefully continue without raising
             an error if a video cannot be sampled
         verbose (False): whether to log the ``ffmpeg`` commands that are
@@ -410,6 +446,8 @@ def sample_videos(
         rel_dir=rel_dir,
         save_filepaths=save_filepaths,
         delete_originals=delete_originals,
+        num_workers=num_workers,
+        timeout=timeout,
         skip_failures=skip_failures,
         verbose=verbose,
         **kwargs,
@@ -706,6 +744,8 @@ def _transform_videos(
     output_dir=None,
     rel_dir=None,
     delete_originals=False,
+    num_workers=None,
+    timeout=None,
     skip_failures=False,
     verbose=False,
     **kwargs,
@@ -727,78 +767,298 @@ def _transform_videos(
     if frames is None:
         frames = itertools.repeat(None)
 
-    with fou.ProgressBar(total=len(view)) as pb:
-        for sample, _frames in pb(zip(view, frames)):
-            inpath = sample[media_field]
+    transform_kwargs = dict(
+        fps=fps,
+        min_fps=min_fps,
+        max_fps=max_fps,
+        size=size,
+        min_size=min_size,
+        max_size=max_size,
+        original_frame_numbers=original_frame_numbers,
+        reencode=reencode,
+        force_reencode=force_reencode,
+        delete_original=delete_originals,
+        verbose=verbose,
+        **kwargs,
+    )
 
-            _outpath = _get_outpath(
-                inpath, output_dir=output_dir, rel_dir=rel_dir
-            )
+    num_videos = len(view)
+    num_failures = 0
+
+    with fou.ProgressBar(total=num_videos) as pb:
+        with _VideoJobPool(
+            num_workers=num_workers,
+            timeout=timeout,
+            skip_failures=skip_failures,
+        ) as pool:
+            for sample, _frames in zip(view, frames):
+                inpath = sample[media_field]
 
-            if sample_frames:
-                outpath = os.path.join(
-                    os.path.splitext(_outpath)[0], frames_patt
+                _outpath = _get_outpath(
+                    inpath, output_dir=output_dir, rel_dir=rel_dir
                 )
 
-                # If sampling was not forced and the first frame exists, assume
-                # that all frames exist
-                fn = _frames[0] if _frames else 1
-                if not force_reencode and os.path.isfile(outpath % fn):
-                    continue
-            elif reencode:
-                root, ext = os.path.splitext(_outpath)
-                if ext.lower() != ".mp4":
-                    outpath = root + ".mp4"
+                if sample_frames:
+                    outpath = os.path.join(
+                        os.path.splitext(_outpath)[0], frames_patt
+                    )
+
+                    # If sampling was not forced and the first frame exists,
+                    # assume that all frames exist
+                    fn = _frames[0] if _frames else 1
+                    if not force_reencode and os.path.isfile(outpath % fn):
+                        pb.update()
+                        continue
+                elif reencode:
+                    root, ext = os.path.splitext(_outpath)
+                    if ext.lower() != ".mp4":
+                        outpath = root + ".mp4"
+                    else:
+                        outpath = _outpath
                 else:
                     outpath = _outpath
-            else:
-                outpath = _outpath
 
-            _transform_video(
-                inpath,
-                outpath,
-                frames=_frames,
-                fps=fps,
-                min_fps=min_fps,
-                max_fps=max_fps,
-                size=size,
-                min_size=min_size,
-                max_size=max_size,
-                original_frame_numbers=original_frame_numbers,
-                reencode=reencode,
-                force_reencode=force_reencode,
-                delete_original=delete_originals,
-                skip_failures=skip_failures,
-                verbose=verbose,
-                **kwargs,
+                results = pool.submit(
+                    (sample, _frames, inpath, outpath),
+                    inpath,
+                    outpath,
+                    frames=_frames,
+                    **transform_kwargs,
+                )
+
+                num_failures += _save_results(
+                    results,
+                    sample_frames,
+                    save_filepaths,
+                    output_field,
+                    diff_field,
+                    skip_failures,
+                )
+                pb.update(len(results))
+
+            results = pool.flush()
+
+            num_failures += _save_results(
+                results,
+                sample_frames,
+                save_filepaths,
+                output_field,
+                diff_field,
+                skip_failures,
+            )
+            pb.update(len(results))
+
+    if num_failures > 0:
+        logger.warning(
+            "Failed to process %d/%d videos", num_failures, num_videos
+        )
+
+
+def _save_results(
+    results,
+    sample_frames,
+    save_filepaths,
+    output_field,
+    diff_field,
+    skip_failures,
+):
+    num_failures = 0
+
+    for (sample, frames, inpath, outpath), error in results:
+        if error is not None:
+            num_failures += 1
+            logger.warning(error)
+
+        if save_filepaths and sample_frames:
+            if frames is None:
+                try:
+                    if sample.metadata is None:
+                        sample.compute_metadata()
+
+                    frames = range(1, sample.metadata.total_frame_count + 1)
+                except Exception as e:
+                    if not skip_failures:
+                        raise
+
+                    frames = []
+                    logger.warning(e)
+
+            for fn in frames:
+                frame_path = outpath % fn
+                if os.path.isfile(frame_path):
+                    sample.frames[fn][output_field] = frame_path
+
+            sample.save()
+
+        if (diff_field or outpath != inpath) and not sample_frames:
+            sample[output_field] = outpath
+            sample.save()
+
+    return num_failures
+
+
+class _VideoJobPool(object):
+    """Context that runs :func:`_transform_video` jobs, optionally in a pool
+    of worker processes.
+
+    Jobs are submitted via :meth:`submit`, which returns the results of any
+    jobs that have completed, in submission order. At most
+    ``_MAX_PENDING_JOBS_PER_WORKER * num_workers`` jobs may be pending;
+    :meth:`submit` blocks when this limit is reached.
+
+    Each result is a ``(ctx, error)`` tuple, where ``ctx`` is the context that
+    was passed to :meth:`submit` and ``error`` is None if the job succeeded
+    or a message describing the failure when ``skip_failures`` is True.
+
+    Args:
+        num_workers (None): the number of worker processes to use. By
+            default, jobs are run serially in the calling process
+        timeout (None): an optional timeout, in seconds, after which a job's
+            ``ffmpeg`` processes are killed and the job is marked as failed.
+            Timeouts always run jobs in worker processes
+        skip_failures (False): whether to return, rather than raise, errors
+            that occur when running a job
+    """
+
+    def __init__(self, num_workers=None, timeout=None, skip_failures=False):
+        if num_workers is None:
+            num_workers = 1
+
+        self.num_workers = num_workers
+        self.timeout = timeout
+        self.skip_failures = skip_failures
+
+        self._pool = None
+        self._pending = deque()
+
+    def __enter__(self):
+        if self.num_workers > 1 or self.timeout is not None:
+            self._pool = fou.get_multiprocessing_context().Pool(
+                processes=self.num_workers
             )
 
-            if save_filepaths and sample_frames:
-                if _frames is None:
-                    try:
-                        if sample.metadata is None:
-                            sample.compute_metadata()
+        return self
+
+    def __exit__(self, *args):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+        self._pending.clear()
+
+    def submit(self, ctx, inpath, outpath, **kwargs):
+        """Submits a job.
+
+        Args:
+            ctx: an arbitrary context to return with the job's result
+            inpath: the input video path
+            outpath: the output path
+            **kwargs: keyword arguments for :func:`_transform_video`
+
+        Returns:
+            a list of ``(ctx, error)`` tuples for completed jobs
+        """
+        args = (inpath, outpath, self.timeout, self.skip_failures, kwargs)
+
+        if self._pool is None:
+            return [(ctx, _do_transform_video(args))]
+
+        self._pending.append(
+            (ctx, self._pool.apply_async(_do_transform_video, (args,)))
+        )
+
+        max_pending = _MAX_PENDING_JOBS_PER_WORKER * self.num_workers
+
+        results = []
+        while self._pending and (
+            len(self._pending) > max_pending or self._pending[0][1].ready()
+        ):
+            ctx, result = self._pending.popleft()
+            results.append((ctx, result.get()))
+
+        return results
+
+    def flush(self):
+        """Waits for all pending jobs to complete.
 
-                        _frames = range(
-                            1, sample.metadata.total_frame_count + 1
-                        )
-                    except Exception as e:
-                        if not skip_failures:
-                            raise
+        Returns:
+            a list of ``(ctx, error)`` tuples for the completed jobs
+        """
+        results = []
+        while self._pending:
+            ctx, result = self._pending.popleft()
+            results.append((ctx, result.get()))
 
-                        _frames = []
-                        logger.warning(e)
+        return results
 
-                for fn in _frames:
-                    frame_path = outpath % fn
-                    if os.path.isfile(frame_path):
-                        sample.frames[fn][output_field] = frame_path
 
-                sample.save()
+class _JobTimeout(object):
+    """Context that kills the child processes of the current process (i.e.,
+    the ``ffmpeg`` processes launched by a job) if the context is not exited
+    within the given number of seconds.
+
+    This must only be used in worker processes, whose only children are the
+    processes launched by the current job.
+
+    Args:
+        timeout (None): the timeout, in seconds. If None, no timeout is
+            enforced
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+        self.timed_out = False
+        self._timer = None
+
+    def __enter__(self):
+        if self.timeout is not None:
+            self._timer = threading.Timer(self.timeout, self._kill_children)
+            self._timer.daemon = True
+            self._timer.start()
+
+        return self
+
+    def __exit__(self, *args):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _kill_children(self):
+        self.timed_out = True
+
+        for child in psutil.Process().children(recursive=True):
+            try:
+                child.kill()
+            except psutil.NoSuchProcess:
+                pass
+
+
+def _do_transform_video(args):
+    inpath, outpath, timeout, skip_failures, kwargs = args
+
+    timer = _JobTimeout(timeout=timeout)
+    error = None
+
+    try:
+        with timer:
+            _transform_video(inpath, outpath, **kwargs)
+    except Exception as e:
+        error = e
+
+    if timer.timed_out:
+        error = TimeoutError(
+            "Processing video '%s' timed out after %s seconds"
+            % (inpath, timeout)
+        )
+
+    if error is None:
+        return None
+
+    if not skip_failures:
+        raise error
 
-            if (diff_field or outpath != inpath) and not sample_frames:
-                sample[output_field] = outpath
-                sample.save()
+    return str(error)
 
 
 def _transform_video(
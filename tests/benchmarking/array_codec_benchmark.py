@@ -0,0 +1,159 @@
+"""
+Benchmarking for the numpy array codecs used by
+:class:`fiftyone.core.fields.VectorField` and
+:class:`fiftyone.core.fields.ArrayField`.
+
+Compares the legacy :func:`fiftyone.core.utils.serialize_numpy_array` format
+with :func:`fiftyone.core.utils.encode_numpy_array`.
+
+Results are written to `array_codec_benchmark.log`.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import timeit
+
+import numpy as np
+
+import eta.core.logging as etal
+
+import fiftyone as fo
+import fiftyone.core.utils as fou
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+def make_mask(size):
+    # Piecewise constant masks, which compress like real segmentations
+    mask = np.zeros((size, size), dtype=np.uint8)
+    for i in range(10):
+        x, y, w = np.random.randint(0, size, size=3)
+        mask[y : y + w, x : x + w] = i
+    return mask
+
+
+CODECS = [
+    (
+        "legacy",
+        fou.serialize_numpy_array,
+        fou.deserialize_numpy_array,
+    ),
+    (
+        "raw",
+        lambda a: fou.encode_numpy_array(a, compression=None),
+        fou.decode_numpy_array,
+    ),
+    (
+        "raw (read-only)",
+        lambda a: fou.encode_numpy_array(a, compression=None),
+        lambda b: fou.decode_numpy_array(b, writable=False),
+    ),
+    (
+        "zlib-1",
+        lambda a: fou.encode_numpy_array(a, compression="zlib"),
+        fou.decode_numpy_array,
+    ),
+]
+
+try:
+    fou.ensure_import("lz4")
+    CODECS.append(
+        (
+            "lz4",
+            lambda a: fou.encode_numpy_array(a, compression="lz4"),
+            fou.decode_numpy_array,
+        )
+    )
+except ImportError:
+    logger.info("lz4 is not installed; skipping lz4 codec")
+
+
+def benchmark_codecs(arrays):
+    for name, encode, decode in CODECS:
+        start = timeit.default_timer()
+        encoded = [encode(a) for a in arrays]
+        encode_time = timeit.default_timer() - start
+
+        start = timeit.default_timer()
+        for b in encoded:
+            decode(b)
+
+        decode_time = timeit.default_timer() - start
+        num_bytes = sum(len(b) for b in encoded)
+
+        logger.info(
+            "%s: encode %.3f sec, decode %.3f sec, %.1f MB"
+            % (name, encode_time, decode_time, num_bytes / 1024**2)
+        )
+
+
+#
+# Codec-only benchmarks
+#
+
+logger.info("\nStarting vector codec test")
+for dim in [128, 512, 2048]:
+    arrays = list(np.random.rand(10000, dim).astype(np.float32))
+    logger.info("\n10000 vectors of dimension %d" % dim)
+    benchmark_codecs(arrays)
+
+logger.info("\nStarting mask codec test")
+for size in [64, 256, 1024]:
+    arrays = [make_mask(size) for _ in range(1000)]
+    logger.info("\n1000 masks of size %dx%d" % (size, size))
+    benchmark_codecs(arrays)
+
+#
+# Database round trip benchmark
+#
+
+logger.info("\nStarting database round trip test")
+for num_samples in [1000, 10000]:
+    dataset = fo.Dataset()
+
+    start = timeit.default_timer()
+    dataset.add_samples(
+        [
+            fo.Sample(
+                filepath="image%d.jpg" % i,
+                embedding=np.random.rand(512).astype(np.float32),
+                mask=make_mask(256),
+            )
+            for i in range(num_samples)
+        ]
+    )
+    elapsed = timeit.default_timer() - start
+
+    logger.info("%d samples: write %.3f sec" % (num_samples, elapsed))
+
+    start = timeit.default_timer()
+    dataset.values("embedding")
+    elapsed = timeit.default_timer() - start
+
+    logger.info("%d samples: values() %.3f sec" % (num_samples, elapsed))
+
+    start = timeit.default_timer()
+    for sample in dataset.select_fields("mask"):
+        sample.mask
+
+    elapsed = timeit.default_timer() - start
+
+    logger.info("%d samples: iter_samples() %.3f sec" % (num_samples, elapsed))
+
+    dataset.delete()
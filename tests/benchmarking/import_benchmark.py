@@ -0,0 +1,92 @@
+"""
+Benchmarking for the startup cost of ``import fiftyone``.
+
+Each statement is timed in a fresh interpreter, and the heavy subsystems that
+have been imported after each statement are reported.
+
+Results are written to `import_benchmark.log`.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import subprocess
+import sys
+
+import eta.core.logging as etal
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+NUM_RUNS = 5
+
+HEAVY_MODULES = [
+    "matplotlib",
+    "plotly",
+    "sklearn",
+    "fiftyone.core.plots",
+    "fiftyone.core.session",
+    "fiftyone.server",
+    "fiftyone.utils.eval",
+]
+
+STATEMENTS = [
+    ("import", "import fiftyone as fo"),
+    ("import + lazy attribute", "import fiftyone as fo; fo.launch_app"),
+    (
+        "import + first database use",
+        "import fiftyone as fo; fo.list_datasets()",
+    ),
+]
+
+TIMER_SCRIPT = """
+import sys
+import timeit
+
+start = timeit.default_timer()
+exec(sys.argv[1])
+elapsed = timeit.default_timer() - start
+
+heavy = [m for m in sys.argv[2].split(",") if m in sys.modules]
+print("%f %s" % (elapsed, ",".join(heavy)))
+"""
+
+
+def time_statement(statement):
+    args = [sys.executable, "-c", TIMER_SCRIPT, statement]
+    output = subprocess.check_output(args + [",".join(HEAVY_MODULES)])
+    elapsed, _, heavy = output.decode().strip().splitlines()[-1].partition(" ")
+    return float(elapsed), heavy
+
+
+#
+# Import time benchmark
+#
+
+logger.info("\nStarting import time test")
+for name, statement in STATEMENTS:
+    times = []
+    for _ in range(NUM_RUNS):
+        elapsed, heavy = time_statement(statement)
+        times.append(elapsed)
+
+    logger.info(
+        "%s: min %.3f sec, mean %.3f sec (%d runs)"
+        % (name, min(times), sum(times) / len(times), NUM_RUNS)
+    )
+    logger.info("  heavy modules imported: %s" % (heavy or "none"))
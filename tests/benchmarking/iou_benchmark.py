@@ -0,0 +1,112 @@
+"""
+Benchmarking for the bounding box IoU utilities in :mod:`fiftyone.utils.iou`.
+
+Results are written to `iou_benchmark.log`.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import random
+import timeit
+
+import eta.core.logging as etal
+
+import fiftyone as fo
+import fiftyone.utils.iou as foui
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+def make_detections(num_objects):
+    detections = []
+    for _ in range(num_objects):
+        x, y = random.random(), random.random()
+        w, h = random.random() * (1 - x), random.random() * (1 - y)
+        detections.append(
+            fo.Detection(
+                label=random.choice(["cat", "dog"]), bounding_box=[x, y, w, h]
+            )
+        )
+
+    return fo.Detections(detections=detections)
+
+
+#
+# Single document IoU benchmark
+#
+
+logger.info("\nStarting compute_ious() test")
+for num_objects in [1, 10, 100, 1000]:
+    dets = make_detections(num_objects).detections
+    start = timeit.default_timer()
+    for _ in range(10):
+        foui.compute_ious(dets, dets, classwise=True)
+
+    elapsed = timeit.default_timer() - start
+    logger.info("%d objects: %.4f sec/call" % (num_objects, elapsed / 10))
+
+#
+# Collection-wide IoU benchmark
+#
+
+logger.info("\nStarting find_duplicates() and compute_max_ious() test")
+for num_samples in [100, 1000, 10000]:
+    dataset = fo.Dataset()
+    dataset.add_samples(
+        [
+            fo.Sample(
+                filepath="image%d.jpg" % i,
+                ground_truth=make_detections(random.randint(0, 50)),
+            )
+            for i in range(num_samples)
+        ]
+    )
+    num_objects = dataset.count("ground_truth.detections")
+
+    start = timeit.default_timer()
+    foui.find_duplicates(dataset, "ground_truth", iou_thresh=0.75)
+    elapsed = timeit.default_timer() - start
+
+    logger.info(
+        "%d samples, %d objects: find_duplicates() %.3f sec"
+        % (num_samples, num_objects, elapsed)
+    )
+
+    # A callable `iscrowd` forces the per-sample implementation
+    start = timeit.default_timer()
+    foui.find_duplicates(
+        dataset, "ground_truth", iou_thresh=0.75, iscrowd=lambda l: False
+    )
+    elapsed = timeit.default_timer() - start
+
+    logger.info(
+        "%d samples, %d objects: find_duplicates() per-sample %.3f sec"
+        % (num_samples, num_objects, elapsed)
+    )
+
+    start = timeit.default_timer()
+    foui.compute_max_ious(dataset, "ground_truth")
+    elapsed = timeit.default_timer() - start
+
+    logger.info(
+        "%d samples, %d objects: compute_max_ious() %.3f sec"
+        % (num_samples, num_objects, elapsed)
+    )
+
+    dataset.delete()
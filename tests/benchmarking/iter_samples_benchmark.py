@@ -0,0 +1,63 @@
+"""
+Benchmarking for
+:meth:`fiftyone.core.collections.SampleCollection.iter_samples_sharded`.
+
+Results are written to `iter_samples_benchmark.log`.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import logging
+import os
+import timeit
+
+import eta.core.logging as etal
+
+import fiftyone.zoo as foz
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+def time_iteration(samples):
+    start = timeit.default_timer()
+    count = sum(1 for _ in samples)
+    return timeit.default_timer() - start, count
+
+
+#
+# Iteration benchmark
+#
+
+dataset = foz.load_zoo_dataset("cifar10", split="train")
+
+logger.info("\nStarting test")
+
+elapsed, count = time_iteration(dataset.iter_samples())
+logger.info("iter_samples(): %d samples in %.3f sec" % (count, elapsed))
+
+for num_workers in [1, 2, 4, 8]:
+    for use_processes in [False, True]:
+        for raw in [False, True]:
+            samples = dataset.iter_samples_sharded(
+                num_workers=num_workers, use_processes=use_processes, raw=raw
+            )
+            elapsed, count = time_iteration(samples)
+            logger.info(
+                "iter_samples_sharded(num_workers=%d, use_processes=%s, "
+                "raw=%s): %d samples in %.3f sec"
+                % (num_workers, use_processes, raw, count, elapsed)
+            )
@@ -153,7 +153,7 @@ def test_transform_videos(tmpdir):
     fouv.transform_videos(dataset, reencode=True, force_reencode=True)
     assert sample.filepath.endswith(".mp4")
 
-    fouv.transform_videos(dataset, max_size=(256, 256))
+    fouv.transform_videos(dataset, max_size=(256, 256), num_workers=2)
     dataset.compute_metadata(overwrite=True)
     assert sample.metadata.frame_height <= 256
     assert sample.metadata.frame_width <= 256
@@ -164,6 +164,37 @@ def test_transform_videos(tmpdir):
     assert sample.metadata.frame_width >= 512
 
 
+def test_sample_videos(tmpdir):
+    video_path = os.path.join(tmpdir, "video.mp4")
+    dataset_dir = os.path.join(tmpdir, "videos")
+    frames_dir = os.path.join(tmpdir, "frames")
+
+    _write_video(video_path, fps=5, size=(720, 1280), num_frames=30)
+    dataset = _make_dataset(video_path, dataset_dir, num_samples=4)
+
+    fouv.sample_videos(
+        dataset, output_dir=frames_dir, save_filepaths=True, num_workers=2
+    )
+
+    frame_paths = dataset.values("frames.filepath", unwind=True)
+    assert len(frame_paths) == 4 * 30
+    assert all(os.path.isfile(p) for p in frame_paths)
+
+    # Videos that exceed the timeout are failures
+    with pytest.raises(TimeoutError):
+        fouv.sample_videos(
+            dataset, output_dir=frames_dir, force_sample=True, timeout=1e-3
+        )
+
+    fouv.sample_videos(
+        dataset,
+        output_dir=frames_dir,
+        force_sample=True,
+        timeout=1e-3,
+        skip_failures=True,
+    )
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     pytest.main([__file__])
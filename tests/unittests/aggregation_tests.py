@@ -545,6 +545,88 @@ class DatasetTests(unittest.TestCase):
         self.assertListEqual(values1, expected)
         self.assertListEqual(values2, expected)
 
+    @drop_datasets
+    def test_values_as_arrays(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpeg",
+                    float=1.0,
+                    list_field=[1, 2, 3],
+                    predictions=fo.Detections(
+                        detections=[
+                            fo.Detection(label="cat", confidence=0.9),
+                            fo.Detection(label="dog", confidence=0.8),
+                        ]
+                    ),
+                ),
+                fo.Sample(
+                    filepath="image2.jpeg",
+                    float=2.0,
+                    list_field=[4],
+                    predictions=fo.Detections(detections=[]),
+                ),
+                fo.Sample(
+                    filepath="image3.jpeg",
+                    float=3.0,
+                    predictions=fo.Detections(
+                        detections=[
+                            fo.Detection(label="rabbit", confidence=0.7)
+                        ]
+                    ),
+                ),
+            ]
+        )
+
+        values = dataset.values("float", as_arrays=True)
+        self.assertIsInstance(values, np.ndarray)
+        self.assertListEqual(values.tolist(), [1.0, 2.0, 3.0])
+
+        values, offsets = dataset.values("list_field", as_arrays=True)
+        self.assertListEqual(values.tolist(), [1, 2, 3, 4])
+        self.assertEqual(len(offsets), 1)
+        self.assertListEqual(offsets[0].tolist(), [0, 3, 4, 4])
+
+        values, offsets = dataset.values(
+            "predictions.detections.confidence", as_arrays=True
+        )
+        self.assertEqual(values.dtype, np.float64)
+        self.assertListEqual(values.tolist(), [0.9, 0.8, 0.7])
+        self.assertListEqual(offsets[0].tolist(), [0, 2, 2, 3])
+
+        values, offsets = dataset.values(
+            "predictions.detections.label", as_arrays=True
+        )
+        self.assertListEqual(values.tolist(), ["cat", "dog", "rabbit"])
+        self.assertListEqual(offsets[0].tolist(), [0, 2, 2, 3])
+
+        values = dataset.limit(0).values("float", as_arrays=True)
+        self.assertEqual(len(values), 0)
+
+        video = fo.Sample(filepath="video1.mp4")
+        video.frames[1] = fo.Frame(
+            gt=fo.Classifications(
+                classifications=[
+                    fo.Classification(label="cat"),
+                    fo.Classification(label="dog"),
+                ]
+            )
+        )
+        video.frames[2] = fo.Frame()
+
+        dataset2 = fo.Dataset()
+        dataset2.add_sample(video)
+
+        # [num_samples][num_frames][num_classifications]
+        values, offsets = dataset2.values(
+            "frames.gt.classifications.label", as_arrays=True
+        )
+        self.assertListEqual(values.tolist(), ["cat", "dog"])
+        self.assertEqual(len(offsets), 2)
+        self.assertListEqual(offsets[0].tolist(), [0, 2])
+        self.assertListEqual(offsets[1].tolist(), [0, 2, 2])
+
     @drop_datasets
     def test_nan_inf(self):
         dataset = fo.Dataset()
@@ -13,13 +13,16 @@ from bson import ObjectId
 import numpy as np
 import pytz
 import unittest
+from unittest.mock import patch
 
 import eta.core.utils as etau
 
 import fiftyone as fo
 from fiftyone import ViewField as F
+import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.odm as foo
+import fiftyone.core.sample as fos
 import fiftyone.utils.data as foud
 
 from decorators import drop_datasets, skip_windows
@@ -460,6 +463,63 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
 
+    @drop_datasets
+    def test_iter_samples_sharded(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, int=i) for i in range(50)]
+        )
+
+        sample_ids = sorted(dataset.values("id"))
+
+        samples = list(
+            dataset.iter_samples_sharded(num_workers=3, shard_size=7)
+        )
+        self.assertListEqual([s.id for s in samples], sample_ids)
+        self.assertIsInstance(samples[0], fo.Sample)
+
+        docs = list(dataset.iter_samples_sharded(num_workers=1, raw=True))
+        self.assertListEqual([str(d["_id"]) for d in docs], sample_ids)
+
+        view = dataset.match(F("int") >= 20).select_fields()
+        samples = list(
+            view.iter_samples_sharded(
+                num_workers=2, shard_size=4, use_processes=True
+            )
+        )
+        self.assertListEqual(
+            [s.id for s in samples], sorted(view.values("id"))
+        )
+        self.assertIsInstance(samples[0], fos.SampleView)
+        self.assertFalse(samples[0].has_field("int"))
+
+        for sample in dataset.iter_samples_sharded(shard_size=10):
+            sample["int"] += 1
+            sample.save()
+
+        self.assertTupleEqual(dataset.bounds("int"), (1, 50))
+
+        empty = dataset.match(F("int") > 100)
+        self.assertListEqual(list(empty.iter_samples_sharded()), [])
+
+    @drop_datasets
+    def test_add_samples_num_workers(self):
+        samples = [
+            fo.Sample(filepath="image%d.jpg" % i, int=i) for i in range(100)
+        ]
+
+        dataset = fo.Dataset()
+        sample_ids = dataset.add_samples(samples, num_workers=4)
+
+        self.assertEqual(len(dataset), 100)
+        self.assertSetEqual(set(sample_ids), set(dataset.values("id")))
+        self.assertTrue(all(s.in_dataset for s in samples))
+        self.assertListEqual([s.id for s in samples], sample_ids)
+
+        view = dataset.sort_by("int")
+        self.assertListEqual(view.values("int"), list(range(100)))
+        self.assertListEqual(view.values("id"), sample_ids)
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
@@ -1138,6 +1198,38 @@ class DatasetTests(unittest.TestCase):
         self.assertIsNotNone(sample12.gt)
         self.assertIsNotNone(sample12.new_gt)
 
+    @drop_datasets
+    def test_merge_samples_key_fcn_batches(self):
+        dataset1 = fo.Dataset()
+        dataset1.add_samples(
+            [
+                fo.Sample(filepath="/a/image%d.jpg" % i, field=i)
+                for i in range(5)
+            ]
+        )
+
+        dataset2 = fo.Dataset()
+        dataset2.add_samples(
+            [
+                fo.Sample(filepath="/b/image%d.jpg" % i, new_field=i)
+                for i in range(1, 7)
+            ]
+        )
+
+        key_fcn = lambda sample: os.path.basename(sample.filepath)
+
+        # Existing samples are fetched across multiple batches
+        with patch.object(fod, "_MERGE_BATCH_SIZE", 2):
+            dataset1.merge_samples(dataset2, key_fcn=key_fcn)
+
+        self.assertEqual(len(dataset1), 7)
+        self.assertListEqual(
+            dataset1.values("field"), [0, 1, 2, 3, 4, None, None]
+        )
+        self.assertListEqual(
+            dataset1.values("new_field"), [None, 1, 2, 3, 4, 5, 6]
+        )
+
     @drop_datasets
     def test_merge_samples_and_labels(self):
         sample11 = fo.Sample(filepath="image1.png")
@@ -9,13 +9,17 @@ import os
 import random
 import string
 import unittest
+from unittest.mock import patch
 import warnings
 
 import numpy as np
+import sklearn.metrics as skm
 
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.utils.eval.detection as foud
+import fiftyone.utils.eval.segmentation as fouseg
 import fiftyone.utils.labels as foul
 
 from decorators import drop_datasets
@@ -1449,6 +1453,121 @@ class DetectionsTests(unittest.TestCase):
 
         self._evaluate_open_images(dataset, kwargs)
 
+    @drop_datasets
+    def test_evaluate_detections_num_workers(self):
+        dataset = self._make_detections_dataset()
+
+        results1 = dataset.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval1"
+        )
+        results2 = dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval2",
+            num_workers=2,
+        )
+
+        self.assertListEqual(
+            sorted(results1.ytrue.tolist(), key=str),
+            sorted(results2.ytrue.tolist(), key=str),
+        )
+        self.assertListEqual(
+            sorted(results1.ypred.tolist(), key=str),
+            sorted(results2.ypred.tolist(), key=str),
+        )
+
+        for suffix in ("tp", "fp", "fn"):
+            self.assertListEqual(
+                dataset.values("eval1_%s" % suffix),
+                dataset.values("eval2_%s" % suffix),
+            )
+
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.eval1"),
+            dataset.values("ground_truth.detections.eval2"),
+        )
+        self.assertListEqual(
+            dataset.values("predictions.detections.eval1_id"),
+            dataset.values("predictions.detections.eval2_id"),
+        )
+
+        # In-memory samples reflect the results written by the workers
+        sample = dataset.last()
+        self.assertEqual(sample["eval2_tp"], sample["eval1_tp"])
+
+    @drop_datasets
+    def test_evaluate_detections_incremental(self):
+        dataset = self._make_detections_dataset()
+
+        dataset.evaluate_detections(
+            "predictions",
+            gt_field="ground_truth",
+            eval_key="eval",
+            incremental=True,
+        )
+
+        self.assertIn("eval_fingerprint", dataset.get_field_schema())
+        self.assertEqual(dataset.count("eval_fingerprint"), len(dataset))
+
+        # Modify a single sample
+        sample = dataset.last()
+        sample["predictions"].detections[0].label = "dog"
+        sample.save()
+
+        fingerprints = dataset.values("eval_fingerprint")
+
+        with patch.object(
+            foud, "_run_evaluation", wraps=foud._run_evaluation
+        ) as run_evaluation:
+            results1 = dataset.evaluate_detections(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval",
+                incremental=True,
+            )
+
+        # Only the modified sample was evaluated
+        self.assertEqual(run_evaluation.call_count, 1)
+        evaluated = run_evaluation.call_args[0][0]
+        self.assertListEqual(evaluated.values("id"), [sample.id])
+
+        # Only the modified sample's fingerprint changed
+        new_fingerprints = dataset.values("eval_fingerprint")
+        self.assertListEqual(new_fingerprints[:-1], fingerprints[:-1])
+        self.assertNotEqual(new_fingerprints[-1], fingerprints[-1])
+
+        results2 = dataset.evaluate_detections(
+            "predictions", gt_field="ground_truth", eval_key="eval2"
+        )
+
+        self.assertListEqual(
+            sorted(results1.ytrue.tolist(), key=str),
+            sorted(results2.ytrue.tolist(), key=str),
+        )
+        self.assertListEqual(
+            sorted(results1.ypred.tolist(), key=str),
+            sorted(results2.ypred.tolist(), key=str),
+        )
+
+        for suffix in ("tp", "fp", "fn"):
+            self.assertListEqual(
+                dataset.values("eval_%s" % suffix),
+                dataset.values("eval2_%s" % suffix),
+            )
+
+        self.assertListEqual(
+            dataset.values("ground_truth.detections.eval"),
+            dataset.values("ground_truth.detections.eval2"),
+        )
+        self.assertListEqual(
+            dataset.values("predictions.detections.eval"),
+            dataset.values("predictions.detections.eval2"),
+        )
+
+        dataset.delete_evaluation("eval")
+
+        self.assertNotIn("eval_fingerprint", dataset.get_field_schema())
+
     @drop_datasets
     def test_load_evaluation_view_select_fields(self):
         dataset = self._make_detections_dataset()
@@ -2143,6 +2262,78 @@ class SegmentationTests(unittest.TestCase):
         self.assertNotIn("eval_precision", dataset.get_field_schema())
         self.assertNotIn("eval_recall", dataset.get_field_schema())
 
+    @drop_datasets
+    def test_evaluate_segmentations_num_workers(self):
+        dataset = self._make_segmentation_dataset()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # suppress missing masks warning
+
+            results1 = dataset.evaluate_segmentations(
+                "predictions", gt_field="ground_truth", eval_key="eval1"
+            )
+            results2 = dataset.evaluate_segmentations(
+                "predictions",
+                gt_field="ground_truth",
+                eval_key="eval2",
+                num_workers=2,
+            )
+
+        self.assertListEqual(results1.classes, results2.classes)
+        self.assertTrue(
+            (results1.confusion_matrix() == results2.confusion_matrix()).all()
+        )
+
+        for suffix in ("accuracy", "precision", "recall"):
+            self.assertListEqual(
+                dataset.values("eval1_%s" % suffix),
+                dataset.values("eval2_%s" % suffix),
+            )
+
+    def test_compute_pixel_confusion_matrices(self):
+        gt_mask = np.array([[0, 0], [1, 2]])
+        pred_mask = np.array([[1, 2], [0, 0]])
+
+        for values in ([0, 1, 2], [0, 2, 5]):
+            actual = fouseg._compute_pixel_confusion_matrices(
+                [(pred_mask, gt_mask), (gt_mask, gt_mask)], values
+            )
+
+            for conf_mat, (pred, gt) in zip(
+                actual, [(pred_mask, gt_mask), (gt_mask, gt_mask)]
+            ):
+                expected = skm.confusion_matrix(
+                    gt.ravel(), pred.ravel(), labels=values
+                )
+                self.assertTrue((conf_mat == expected).all())
+
+    @drop_datasets
+    def test_evaluate_segmentations_batches(self):
+        dataset = self._make_segmentation_dataset()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # suppress missing masks warning
+
+            results1 = dataset.evaluate_segmentations(
+                "predictions", gt_field="ground_truth", eval_key="eval1"
+            )
+
+            # Limit batches to a single mask pair
+            with patch.object(fouseg, "_MAX_BATCH_PIXELS", 9):
+                results2 = dataset.evaluate_segmentations(
+                    "predictions", gt_field="ground_truth", eval_key="eval2"
+                )
+
+        self.assertTrue(
+            (results1.confusion_matrix() == results2.confusion_matrix()).all()
+        )
+
+        for suffix in ("accuracy", "precision", "recall"):
+            self.assertListEqual(
+                dataset.values("eval1_%s" % suffix),
+                dataset.values("eval2_%s" % suffix),
+            )
+
 
 class VideoSegmentationTests(unittest.TestCase):
     def _make_video_segmentation_dataset(self):
@@ -2260,6 +2451,46 @@ class VideoSegmentationTests(unittest.TestCase):
         self.assertNotIn("eval_recall", dataset.get_field_schema())
         self.assertNotIn("eval_recall", dataset.get_frame_field_schema())
 
+    @drop_datasets
+    def test_evaluate_video_segmentations_batches(self):
+        dataset = self._make_video_segmentation_dataset()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # suppress missing masks warning
+
+            results1 = dataset.evaluate_segmentations(
+                "frames.predictions",
+                gt_field="frames.ground_truth",
+                eval_key="eval1",
+            )
+
+            # Limit batches to a single mask pair, so the frames of the last
+            # video are evaluated in separate batches
+            with patch.object(fouseg, "_MAX_BATCH_PIXELS", 4):
+                with patch.object(
+                    fouseg, "_evaluate_batch", wraps=fouseg._evaluate_batch
+                ) as evaluate_batch:
+                    results2 = dataset.evaluate_segmentations(
+                        "frames.predictions",
+                        gt_field="frames.ground_truth",
+                        eval_key="eval2",
+                    )
+
+        self.assertEqual(evaluate_batch.call_count, 2)
+        self.assertTrue(
+            (results1.confusion_matrix() == results2.confusion_matrix()).all()
+        )
+
+        for suffix in ("accuracy", "precision", "recall"):
+            self.assertListEqual(
+                dataset.values("eval1_%s" % suffix),
+                dataset.values("eval2_%s" % suffix),
+            )
+            self.assertListEqual(
+                dataset.values("frames.eval1_%s" % suffix),
+                dataset.values("frames.eval2_%s" % suffix),
+            )
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
@@ -20,6 +20,7 @@ import eta.core.video as etav
 
 import fiftyone as fo
 import fiftyone.utils.coco as fouc
+import fiftyone.utils.data as foud
 import fiftyone.utils.labels as foul
 import fiftyone.utils.yolo as fouy
 from fiftyone.core.expressions import ViewField as F
@@ -159,6 +160,63 @@ class DuplicateImageExportTests(ImageDatasetTests):
         self.assertEqual(len(dataset2), 2)
 
 
+class MediaExporterTests(ImageDatasetTests):
+    def _export(self, image_paths, export_mode, num_workers=None):
+        export_dir = self._new_dir()
+
+        media_exporter = foud.ImageExporter(
+            export_mode, export_path=export_dir, num_workers=num_workers
+        )
+        media_exporter.setup()
+        outpaths = [media_exporter.export(p)[0] for p in image_paths]
+        media_exporter.close()
+
+        return outpaths
+
+    def test_copy(self):
+        image_paths = [self._new_image() for _ in range(10)]
+
+        for num_workers in (1, 4):
+            outpaths = self._export(image_paths, True, num_workers)
+
+            for inpath, outpath in zip(image_paths, outpaths):
+                self.assertTrue(os.path.isfile(outpath))
+                self.assertEqual(
+                    os.path.getsize(inpath), os.path.getsize(outpath)
+                )
+
+    @skipwindows
+    def test_hardlink(self):
+        image_paths = [self._new_image() for _ in range(10)]
+
+        outpaths = self._export(image_paths, "hardlink")
+
+        for inpath, outpath in zip(image_paths, outpaths):
+            self.assertTrue(os.path.samefile(inpath, outpath))
+
+    def test_skip_existing(self):
+        image_path = self._new_image()
+        export_dir = self._new_dir()
+
+        media_exporter = foud.ImageExporter(True, export_path=export_dir)
+        media_exporter.setup()
+        outpath, _ = media_exporter.export(image_path)
+        media_exporter.close()
+
+        # Existing files whose size and mtime match are not copied again
+        os.utime(outpath, (0, os.path.getmtime(image_path)))
+        mtime = os.path.getmtime(outpath)
+        atime = os.path.getatime(outpath)
+
+        media_exporter = foud.ImageExporter(True, export_path=export_dir)
+        media_exporter.setup()
+        media_exporter.export(image_path, outpath=outpath)
+        media_exporter.close()
+
+        self.assertEqual(os.path.getatime(outpath), atime)
+        self.assertEqual(os.path.getmtime(outpath), mtime)
+
+
 class ImageExportCoersionTests(ImageDatasetTests):
     @drop_datasets
     def test_field_inference(self):
@@ -2693,6 +2751,41 @@ class MultitaskImageDatasetTests(ImageDatasetTests):
             dataset3.count("predictions.detections"),
         )
 
+        # Sharded BSON
+
+        export_dir = self._new_dir()
+
+        dataset.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            use_bson=True,
+        )
+
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(export_dir, "samples", "manifest.json")
+            )
+        )
+
+        dataset4 = fo.Dataset.from_dir(
+            dataset_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+        )
+
+        self.assertEqual(len(dataset), len(dataset4))
+        self.assertListEqual(
+            [os.path.basename(f) for f in dataset.values("filepath")],
+            [os.path.basename(f) for f in dataset4.values("filepath")],
+        )
+        self.assertListEqual(
+            dataset.values("weather.label"), dataset4.values("weather.label")
+        )
+        self.assertEqual(
+            dataset.count("predictions.detections"),
+            dataset4.count("predictions.detections"),
+        )
+        self.assertTrue("test" in dataset4.list_evaluations())
+
         # Labels-only (absolute paths)
 
         export_dir = self._new_dir()
@@ -3344,6 +3437,24 @@ class VideoExportCoersionTests(VideoDatasetTests):
             clips.values("support"), dataset3.values("support")
         )
 
+        export_dir = self._new_dir()
+
+        clips.export(
+            export_dir=export_dir,
+            dataset_type=fo.types.FiftyOneDataset,
+            use_bson=True,
+        )
+
+        dataset4 = fo.Dataset.from_dir(
+            dataset_dir=export_dir, dataset_type=fo.types.FiftyOneDataset
+        )
+
+        self.assertEqual(len(clips), len(dataset4))
+        self.assertEqual(clips.count("frames"), dataset4.count("frames"))
+        self.assertListEqual(
+            clips.values("support"), dataset4.values("support")
+        )
+
 
 class UnlabeledVideoDatasetTests(VideoDatasetTests):
     def _make_dataset(self):
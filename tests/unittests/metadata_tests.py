@@ -0,0 +1,107 @@
+"""
+FiftyOne metadata-related unit tests.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import unittest
+
+import numpy as np
+
+import eta.core.image as etai
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.metadata as fome
+
+from decorators import drop_datasets
+
+
+class ComputeMetadataTests(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = etau.TempDir()
+        self._root_dir = self._temp_dir.__enter__()
+
+    def tearDown(self):
+        self._temp_dir.__exit__()
+
+    def _make_dataset(self, num_samples=3, missing=None):
+        dataset = fo.Dataset()
+
+        samples = []
+        for idx in range(num_samples):
+            filepath = os.path.join(self._root_dir, "image%d.png" % idx)
+            if idx != missing:
+                img = np.zeros((idx + 2, idx + 3, 3), dtype=np.uint8)
+                etai.write(img, filepath)
+
+            samples.append(
+                fo.Sample(
+                    filepath=filepath,
+                    ground_truth=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat", bounding_box=[0, 0, 1, 1]
+                            )
+                        ]
+                    ),
+                )
+            )
+
+        dataset.add_samples(samples)
+
+        return dataset
+
+    @drop_datasets
+    def test_compute_metadata_view(self):
+        dataset = self._make_dataset()
+
+        view = dataset.skip(1)
+        view.compute_metadata(num_workers=2)
+
+        widths = dataset.values("metadata.width")
+        heights = dataset.values("metadata.height")
+
+        self.assertIsNone(widths[0])
+        self.assertListEqual(widths[1:], [4, 5])
+        self.assertListEqual(heights[1:], [3, 4])
+
+        dataset.compute_metadata(num_workers=2)
+        self.assertListEqual(dataset.values("metadata.width"), [3, 4, 5])
+
+    @drop_datasets
+    def test_compute_metadata_skip_failures(self):
+        dataset = self._make_dataset(missing=1)
+
+        with self.assertLogs(fome.logger, level="WARNING") as logs:
+            dataset.compute_metadata(num_workers=2)
+
+        self.assertIn(
+            "Failed to populate metadata on 1 samples", logs.output[0]
+        )
+
+        widths = dataset.values("metadata.width")
+        self.assertListEqual(widths, [3, None, 5])
+
+        with self.assertRaises(ValueError):
+            dataset.compute_metadata(num_workers=2, skip_failures=False)
+
+    @drop_datasets
+    def test_compute_metadata_generated_view(self):
+        dataset = self._make_dataset()
+
+        patches = dataset.to_patches("ground_truth")
+        patches.compute_metadata(num_workers=2)
+
+        self.assertEqual(len(patches.exists("metadata", False)), 0)
+        self.assertListEqual(patches.values("metadata.width"), [3, 4, 5])
+
+        # Only the patches dataset is modified
+        self.assertEqual(len(dataset.exists("metadata")), 0)
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
@@ -0,0 +1,381 @@
+"""
+FiftyOne model-related unit tests.
+
+| Copyright 2017-2022, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+import eta.core.image as etai
+import eta.core.utils as etau
+
+import fiftyone as fo
+import fiftyone.core.models as fomo
+
+from decorators import drop_datasets
+
+
+class _EmbeddingsModel(fomo.Model, fomo.EmbeddingsMixin):
+    """Stub model whose embedding of an image is its first pixel value
+    repeated ``num_dims`` times.
+    """
+
+    def __init__(self, num_dims=3, dtype=np.float32):
+        self.num_dims = num_dims
+        self.dtype = dtype
+
+    @property
+    def media_type(self):
+        return "image"
+
+    @property
+    def has_embeddings(self):
+        return True
+
+    @property
+    def ragged_batches(self):
+        return False
+
+    @property
+    def transforms(self):
+        return None
+
+    @property
+    def preprocess(self):
+        return False
+
+    @preprocess.setter
+    def preprocess(self, value):
+        pass
+
+    def embed(self, arg):
+        return self.embed_all([arg])
+
+    def embed_all(self, args):
+        return np.array(
+            [np.full(self.num_dims, arg[0, 0, 0]) for arg in args],
+            dtype=self.dtype,
+        )
+
+
+class EmbeddingsTests(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = etau.TempDir()
+        self._root_dir = self._temp_dir.__enter__()
+
+    def tearDown(self):
+        self._temp_dir.__exit__()
+
+    def _make_dataset(self, num_samples=3, missing=None):
+        dataset = fo.Dataset()
+
+        samples = []
+        for idx in range(num_samples):
+            filepath = os.path.join(self._root_dir, "image%d.png" % idx)
+            if idx != missing:
+                img = np.full((2, 2, 3), idx + 1, dtype=np.uint8)
+                etai.write(img, filepath)
+
+            samples.append(fo.Sample(filepath=filepath))
+
+        dataset.add_samples(samples)
+
+        return dataset
+
+    @drop_datasets
+    def test_embeddings_path(self):
+        dataset = self._make_dataset(missing=1)
+        model = _EmbeddingsModel()
+
+        embeddings_path = os.path.join(self._root_dir, "embeddings.npy")
+        ids_path = os.path.join(self._root_dir, "embeddings_ids.npy")
+
+        embeddings = dataset.compute_embeddings(
+            model, embeddings_path=embeddings_path
+        )
+
+        self.assertTrue(os.path.isfile(embeddings_path))
+        self.assertTrue(os.path.isfile(ids_path))
+
+        self.assertIsInstance(embeddings, np.memmap)
+        self.assertEqual(embeddings.shape, (3, 3))
+        self.assertEqual(embeddings.dtype, np.float32)
+
+        self.assertTrue((embeddings[0] == 1).all())
+        self.assertTrue(np.isnan(embeddings[1]).all())
+        self.assertTrue((embeddings[2] == 3).all())
+
+        embeddings2, sample_ids = fomo.load_embeddings(embeddings_path)
+
+        self.assertIsInstance(embeddings2, np.memmap)
+        self.assertTrue(
+            np.array_equal(embeddings, embeddings2, equal_nan=True)
+        )
+        self.assertListEqual(sample_ids.tolist(), dataset.values("id"))
+
+    @drop_datasets
+    def test_embeddings_path_batch(self):
+        dataset = self._make_dataset(num_samples=4, missing=3)
+        model = _EmbeddingsModel()
+
+        embeddings_path = os.path.join(self._root_dir, "embeddings.npy")
+
+        embeddings = dataset.compute_embeddings(
+            model, embeddings_path=embeddings_path, batch_size=2
+        )
+
+        self.assertEqual(embeddings.shape, (4, 3))
+        self.assertTrue((embeddings[0] == 1).all())
+        self.assertTrue((embeddings[1] == 2).all())
+
+        # The failed batch is filled with `nan`
+        self.assertTrue(np.isnan(embeddings[2:]).all())
+
+    @drop_datasets
+    def test_embeddings_dtype(self):
+        dataset = self._make_dataset(missing=1)
+
+        embeddings_path = os.path.join(self._root_dir, "embeddings.npy")
+
+        embeddings = dataset.compute_embeddings(
+            _EmbeddingsModel(),
+            embeddings_path=embeddings_path,
+            embeddings_dtype="float16",
+        )
+
+        self.assertEqual(embeddings.dtype, np.float16)
+        self.assertTrue((embeddings[0] == 1).all())
+        self.assertTrue(np.isnan(embeddings[1]).all())
+
+        # Integer embeddings are promoted so that failures can be `nan`
+        embeddings = dataset.compute_embeddings(
+            _EmbeddingsModel(dtype=np.int64), embeddings_path=embeddings_path
+        )
+
+        self.assertTrue(np.issubdtype(embeddings.dtype, np.floating))
+        self.assertTrue((embeddings[2] == 3).all())
+        self.assertTrue(np.isnan(embeddings[1]).all())
+
+        with self.assertRaises(ValueError):
+            dataset.compute_embeddings(
+                _EmbeddingsModel(),
+                embeddings_path=embeddings_path,
+                embeddings_dtype="int32",
+            )
+
+    @drop_datasets
+    def test_embeddings_path_all_failures(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(filepath=os.path.join(self._root_dir, "image1.png")),
+                fo.Sample(filepath=os.path.join(self._root_dir, "image2.png")),
+            ]
+        )
+
+        embeddings_path = os.path.join(self._root_dir, "embeddings.npy")
+
+        with self.assertRaises(ValueError):
+            dataset.compute_embeddings(
+                _EmbeddingsModel(), embeddings_path=embeddings_path
+            )
+
+        self.assertFalse(os.path.exists(embeddings_path))
+
+    @drop_datasets
+    def test_embeddings_path_empty(self):
+        view = self._make_dataset().limit(0)
+
+        embeddings_path = os.path.join(self._root_dir, "embeddings.npy")
+
+        embeddings = view.compute_embeddings(
+            _EmbeddingsModel(), embeddings_path=embeddings_path
+        )
+
+        self.assertEqual(len(embeddings), 0)
+
+        _, sample_ids = fomo.load_embeddings(embeddings_path)
+        self.assertEqual(len(sample_ids), 0)
+
+
+class AsyncSampleWriterTests(unittest.TestCase):
+    @drop_datasets
+    def test_flush_on_exit(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i) for i in range(5)]
+        )
+
+        samples = list(dataset)
+        with fomo._AsyncSampleWriter(dataset) as writer:
+            for batch in (samples[:2], samples[2:4], samples[4:]):
+                for sample in batch:
+                    sample["index"] = int(sample.filepath[-5])
+
+                writer.save(batch)
+
+        # All batches were written by the time the context exited
+        self.assertListEqual(dataset.values("index"), [0, 1, 2, 3, 4])
+
+    def test_max_pending(self):
+        release = threading.Event()
+        saved = []
+
+        def _save_batch(sample_batch):
+            release.wait()
+            saved.append(sample_batch)
+
+        samples = MagicMock()
+        with fomo._AsyncSampleWriter(samples, max_pending=1) as writer:
+            writer._save_batch = _save_batch
+
+            writer.save([1])
+
+            thread = threading.Thread(target=writer.save, args=([2],))
+            thread.start()
+            thread.join(timeout=0.5)
+
+            # The second batch waits for the first one to be saved
+            self.assertTrue(thread.is_alive())
+            self.assertListEqual(saved, [])
+
+            release.set()
+            thread.join()
+
+        self.assertListEqual(saved, [[1], [2]])
+
+    def test_skip_failures(self):
+        samples = MagicMock()
+        samples.save_context.side_effect = ValueError("boom")
+
+        with self.assertLogs(fomo.logger, level="WARNING") as logs:
+            with fomo._AsyncSampleWriter(samples) as writer:
+                writer.save([MagicMock(id="a"), MagicMock(id="b")])
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("boom", logs.output[0])
+
+        with self.assertRaises(ValueError):
+            with fomo._AsyncSampleWriter(
+                samples, skip_failures=False
+            ) as writer:
+                writer.save([MagicMock(id="a")])
+
+
+class _PatchIndexModel(object):
+    """Stub model whose embedding of each patch is the patch itself, so that
+    patches containing their row indices are embedded as those indices.
+    """
+
+    def __init__(self, fail_index=None):
+        self.fail_index = fail_index
+        self.batch_sizes = []
+
+    def embed_all(self, patches):
+        patches = np.asarray(patches)
+        self.batch_sizes.append(len(patches))
+
+        if self.fail_index is not None and self.fail_index in patches:
+            raise ValueError("Failed to embed patch %d" % self.fail_index)
+
+        return patches
+
+
+class PatchBatcherTests(unittest.TestCase):
+    def _make_patches(self, counts):
+        patches = []
+        start = 0
+        for count in counts:
+            patches.append(np.arange(start, start + count).reshape(-1, 1))
+            start += count
+
+        return patches
+
+    def _run(self, batcher, patches):
+        samples = [MagicMock(id=str(idx)) for idx in range(len(patches))]
+
+        results = []
+        for sample, sample_patches in zip(samples, patches):
+            results.extend(batcher.add(sample, sample_patches))
+
+        results.extend(batcher.flush())
+
+        self.assertListEqual([r[0] for r in results], samples)
+
+        return [r[1] for r in results]
+
+    def test_batches(self):
+        # The second and third samples have no patches, and the others
+        # straddle batch boundaries
+        patches = self._make_patches([3, 0, 0, 5, 2])
+        model = _PatchIndexModel()
+        batcher = fomo._PatchBatcher(model, 4, False)
+
+        embeddings = self._run(batcher, patches)
+
+        self.assertListEqual(model.batch_sizes, [4, 4, 2])
+
+        self.assertIsNone(embeddings[1])
+        self.assertIsNone(embeddings[2])
+
+        for idx in (0, 3, 4):
+            self.assertTrue((embeddings[idx] == patches[idx]).all())
+
+    def test_list_patches(self):
+        patches = [list(p) for p in self._make_patches([1, 3, 2])]
+        model = _PatchIndexModel()
+        batcher = fomo._PatchBatcher(model, 2, False)
+
+        embeddings = self._run(batcher, patches)
+
+        self.assertListEqual(model.batch_sizes, [2, 2, 2])
+
+        for sample_embeddings, sample_patches in zip(embeddings, patches):
+            self.assertListEqual(
+                sample_embeddings.ravel().tolist(),
+                np.concatenate(sample_patches).tolist(),
+            )
+
+    def test_failed_batch(self):
+        # The second batch contains patches 4-7, which belong to the second
+        # and third samples
+        patches = self._make_patches([3, 3, 2, 1])
+        model = _PatchIndexModel(fail_index=5)
+        batcher = fomo._PatchBatcher(model, 4, True)
+
+        with self.assertLogs(fomo.logger, level="WARNING") as logs:
+            embeddings = self._run(batcher, patches)
+
+        self.assertEqual(len(logs.output), 2)
+
+        self.assertTrue((embeddings[0] == patches[0]).all())
+        self.assertIsNone(embeddings[1])
+        self.assertIsNone(embeddings[2])
+        self.assertTrue((embeddings[3] == patches[3]).all())
+
+        batcher = fomo._PatchBatcher(_PatchIndexModel(fail_index=5), 4, False)
+
+        with self.assertRaises(ValueError):
+            self._run(batcher, patches)
+
+    def test_concat_patches(self):
+        arrays = [np.zeros((2, 3)), np.ones((1, 3))]
+        concat = fomo._concat_patches(arrays)
+        self.assertEqual(concat.shape, (3, 3))
+        self.assertTrue((concat[2] == 1).all())
+
+        lists = [[1, 2], [3]]
+        self.assertListEqual(fomo._concat_patches(lists), [1, 2, 3])
+
+        self.assertIs(fomo._concat_patches(arrays[:1]), arrays[0])
+
+
+if __name__ == "__main__":
+    fo.config.show_progress_bars = False
+    unittest.main(verbosity=2)
@@ -5,11 +5,21 @@ FiftyOne server-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+import os
 import unittest
 
+import eta.core.utils as etau
+
 import fiftyone.core.dataset as fod
+from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.sample as fos
+import fiftyone.core.stages as fosg
+import fiftyone.server.cache as fosc
+import fiftyone.server.metadata as fosm
+import fiftyone.server.samples as fosa
 import fiftyone.server.view as fosv
 
 from decorators import drop_datasets
@@ -35,8 +45,13 @@ class ServerViewTests(unittest.TestCase):
             "predictions", fof.EmbeddedDocumentField, fol.Detections
         )
 
-        returned = fosv.get_view(
-            "test", filters=filters, count_label_tags=True, only_matches=True
+        returned = asyncio.run(
+            fosv.get_view(
+                "test",
+                filters=filters,
+                count_label_tags=True,
+                only_matches=True,
+            )
         )._pipeline()
 
         expected = [
@@ -171,8 +186,13 @@ class ServerViewTests(unittest.TestCase):
             "predictions", fof.EmbeddedDocumentField, fol.Detections
         )
 
-        returned = fosv.get_view(
-            "test", filters=filters, count_label_tags=False, only_matches=True
+        returned = asyncio.run(
+            fosv.get_view(
+                "test",
+                filters=filters,
+                count_label_tags=False,
+                only_matches=True,
+            )
         )._pipeline()
 
         expected = [
@@ -268,8 +288,13 @@ class ServerViewTests(unittest.TestCase):
             "detections", fof.EmbeddedDocumentField, fol.Detections
         )
 
-        returned = fosv.get_view(
-            "test", filters=filters, count_label_tags=True, only_matches=True
+        returned = asyncio.run(
+            fosv.get_view(
+                "test",
+                filters=filters,
+                count_label_tags=True,
+                only_matches=True,
+            )
         )._pipeline()[1:]
 
         expected = [
@@ -490,8 +515,13 @@ class ServerViewTests(unittest.TestCase):
             "detections", fof.EmbeddedDocumentField, fol.Detections
         )
 
-        returned = fosv.get_view(
-            "test", filters=filters, count_label_tags=False, only_matches=True
+        returned = asyncio.run(
+            fosv.get_view(
+                "test",
+                filters=filters,
+                count_label_tags=False,
+                only_matches=True,
+            )
         )._pipeline()[1:]
 
         expected = [
@@ -657,8 +687,13 @@ class ServerViewTests(unittest.TestCase):
             "detections", fof.EmbeddedDocumentField, fol.Detections
         )
 
-        returned = fosv.get_view(
-            "test", filters=filters, count_label_tags=True, only_matches=True
+        returned = asyncio.run(
+            fosv.get_view(
+                "test",
+                filters=filters,
+                count_label_tags=True,
+                only_matches=True,
+            )
         )._pipeline()[1:]
 
         expected = [
@@ -795,8 +830,13 @@ class ServerViewTests(unittest.TestCase):
             "detections", fof.EmbeddedDocumentField, fol.Detections
         )
 
-        returned = fosv.get_view(
-            "test", filters=filters, count_label_tags=False, only_matches=True
+        returned = asyncio.run(
+            fosv.get_view(
+                "test",
+                filters=filters,
+                count_label_tags=False,
+                only_matches=True,
+            )
         )._pipeline()[1:]
 
         expected = [
@@ -877,3 +917,222 @@ class ServerViewTests(unittest.TestCase):
         ]
 
         self.assertEqual(expected, returned)
+
+
+class ServerPaginationTests(unittest.TestCase):
+    @drop_datasets
+    def test_offset_pagination(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(filepath="image%d.png" % i, index=i)
+                for i in range(25)
+            ]
+        )
+
+        # Views that do not sort by a field are paginated in their natural
+        # order via offset-based cursors
+        stages = [fosg.Match({"index": {"$gte": 5}})._serialize()]
+
+        results = asyncio.run(
+            fosa.paginate_samples(dataset.name, stages, None, 10)
+        )
+        cursor = results.edges[-1].cursor
+
+        self.assertTrue(results.page_info.has_next_page)
+        self.assertEqual(cursor, "9")
+
+        results = asyncio.run(
+            fosa.paginate_samples(dataset.name, stages, None, 10, cursor)
+        )
+        indexes = [edge.node.sample["index"] for edge in results.edges]
+
+        self.assertFalse(results.page_info.has_next_page)
+        self.assertListEqual(indexes, list(range(15, 25)))
+
+        # Views that sort by expressions also use offset-based cursors
+        stages = [fosg.SortBy(F("index") * -1)._serialize()]
+
+        results = asyncio.run(
+            fosa.paginate_samples(dataset.name, stages, None, 10, "9")
+        )
+        indexes = [edge.node.sample["index"] for edge in results.edges]
+
+        self.assertEqual(results.edges[0].cursor, "10")
+        self.assertListEqual(indexes, list(range(14, 4, -1)))
+
+        # As do views that sort by a field without a `(field, _id)` index
+        index_names = set(dataset.list_indexes())
+        stages = [fosg.SortBy("index")._serialize()]
+
+        results = asyncio.run(
+            fosa.paginate_samples(dataset.name, stages, None, 10, "9")
+        )
+        indexes = [edge.node.sample["index"] for edge in results.edges]
+
+        self.assertEqual(results.edges[0].cursor, "10")
+        self.assertListEqual(indexes, list(range(10, 20)))
+
+        # Pagination never creates indexes
+        self.assertSetEqual(set(dataset.list_indexes()), index_names)
+
+    @drop_datasets
+    def test_sort_keyset_pagination(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(
+                    filepath="image%d.png" % i,
+                    value=(i % 4) if i % 5 else None,
+                )
+                for i in range(25)
+            ]
+        )
+        dataset.create_index([("value", 1), ("_id", 1)])
+
+        for reverse in (False, True):
+            stages = [fosg.SortBy("value", reverse=reverse)._serialize()]
+
+            sample_ids = []
+            values = []
+            cursor = None
+            more = True
+            while more:
+                results = asyncio.run(
+                    fosa.paginate_samples(
+                        dataset.name, stages, None, 4, cursor
+                    )
+                )
+
+                for edge in results.edges:
+                    sample_ids.append(edge.node.id)
+                    values.append(edge.node.sample.get("value", None))
+                    self.assertNotIn(fosa._SORT_KEY, edge.node.sample)
+
+                cursor = results.edges[-1].cursor
+                more = results.page_info.has_next_page
+
+            self.assertTrue(fosa._is_sort_cursor(cursor))
+
+            # Every sample appears exactly once, including ties and nulls
+            self.assertEqual(len(sample_ids), 25)
+            self.assertSetEqual(
+                set(str(_id) for _id in sample_ids),
+                set(dataset.values("id")),
+            )
+
+            self.assertListEqual(
+                values,
+                dataset.sort_by("value", reverse=reverse).values("value"),
+            )
+
+
+class ServerCacheTests(unittest.TestCase):
+    def test_lru_cache(self):
+        cache = fosc.LRUCache(3)
+
+        cache.set(("a", None, 1), 1)
+        cache.set(("a", None, 2), 2)
+        cache.set(("b", None, 3), 3)
+
+        self.assertEqual(cache.get(("a", None, 1)), 1)
+
+        cache.set(("b", None, 4), 4)
+
+        self.assertEqual(len(cache), 3)
+        self.assertIsNone(cache.get(("a", None, 2)))
+        self.assertEqual(cache.get(("a", None, 1)), 1)
+
+        cache.clear(dataset_name="b")
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get(("a", None, 1)), 1)
+
+        cache = fosc.LRUCache(100, size_fcn=len)
+        cache.set(("a", None, 1), "x" * 60)
+        cache.set(("a", None, 2), "x" * 60)
+        cache.set(("a", None, 3), "x" * 101)
+
+        self.assertEqual(cache.size, 60)
+        self.assertIsNone(cache.get(("a", None, 1)))
+        self.assertIsNone(cache.get(("a", None, 3)))
+
+    @drop_datasets
+    def test_dataset_token(self):
+        def make_key():
+            return asyncio.run(fosc.make_key(dataset.name, "view", []))
+
+        dataset = fod.Dataset()
+        key = make_key()
+
+        self.assertEqual(key, make_key())
+
+        sample = fos.Sample(filepath="image.png", foo="bar")
+        dataset.add_sample(sample)
+
+        # Tokens are cached briefly
+        self.assertEqual(key, make_key())
+
+        # Adding samples changes the token
+        fosc.tokens.clear()
+        key2 = make_key()
+        self.assertNotEqual(key, key2)
+
+        # Schema changes change the token
+        dataset.add_sample_field("spam", fof.StringField)
+
+        fosc.tokens.clear()
+        key3 = make_key()
+        self.assertNotEqual(key2, key3)
+
+        token = asyncio.run(fosc.get_dataset_token("missing-dataset"))
+        self.assertIsNone(token)
+
+    @drop_datasets
+    def test_view_cache(self):
+        dataset = fod.Dataset()
+        dataset.add_sample(fos.Sample(filepath="image.png"))
+
+        view = asyncio.run(fosv.get_view(dataset.name))
+        self.assertIs(view, asyncio.run(fosv.get_view(dataset.name)))
+
+        # Explicitly clearing the caches, which the server does when the App's
+        # state changes, invalidates cached views
+        fosc.clear(dataset_name=dataset.name)
+
+        self.assertIsNot(view, asyncio.run(fosv.get_view(dataset.name)))
+
+
+class ServerMetadataTests(unittest.TestCase):
+    def test_media_metadata_cache(self):
+        with etau.TempDir() as tmp_dir:
+            cache = fosm.MediaMetadataCache(os.path.join(tmp_dir, "cache.db"))
+
+            self.assertIsNone(cache.get("image.png", 1.0, 100))
+
+            cache.set("image.png", 1.0, 100, {"aspect_ratio": 1.5})
+
+            # Pending entries are readable before they are flushed
+            self.assertDictEqual(
+                cache.get("image.png", 1.0, 100), {"aspect_ratio": 1.5}
+            )
+
+            cache2 = fosm.MediaMetadataCache(cache.path)
+            self.assertIsNone(cache2.get("image.png", 1.0, 100))
+
+            cache.flush()
+
+            self.assertDictEqual(
+                cache.get("image.png", 1.0, 100), {"aspect_ratio": 1.5}
+            )
+
+            # Modified files are invalidated
+            self.assertIsNone(cache.get("image.png", 2.0, 100))
+            self.assertIsNone(cache.get("image.png", 1.0, 200))
+
+            self.assertDictEqual(
+                cache2.get("image.png", 1.0, 100), {"aspect_ratio": 1.5}
+            )
+
+            cache.clear()
+            self.assertIsNone(cache.get("image.png", 1.0, 100))
@@ -5,16 +5,27 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
+import subprocess
+import sys
 import time
 import unittest
+from unittest.mock import patch
 
+from bson import json_util, ObjectId
 import numpy as np
 
+import eta.core.image as etai
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
 import fiftyone.core.uid as fou
+import fiftyone.core.utils as focu
+import fiftyone.utils.image as fouim
+import fiftyone.utils.iou as foui
 from fiftyone.migrations.runner import MigrationRunner
 
 from decorators import drop_datasets
@@ -81,6 +92,74 @@ class SerializationTests(unittest.TestCase):
         s = label1.to_json(pretty_print=True)
         self.assertEqual(fo.Classification.from_json(s), label1)
 
+    def test_encode_numpy_array(self):
+        arrays = [
+            np.arange(5, dtype=np.float32),
+            np.random.randint(0, 255, size=(4, 6), dtype=np.uint8),
+            np.ones((2, 3, 4), dtype=">i4"),
+            np.asfortranarray(np.random.rand(3, 2)),
+            np.array(3.5),
+            np.zeros((0, 3)),
+        ]
+
+        for compression in (None, "zlib"):
+            for array in arrays:
+                array_bytes = focu.encode_numpy_array(
+                    array, compression=compression
+                )
+                self.assertTrue(focu.is_encoded_numpy_array(array_bytes))
+
+                array2 = focu.deserialize_numpy_array(array_bytes)
+                self.assertEqual(array2.dtype, array.dtype)
+                self.assertEqual(array2.shape, array.shape)
+                self.assertTrue(np.array_equal(array2, array))
+                self.assertTrue(array2.flags.writeable)
+
+        array_bytes = focu.encode_numpy_array(arrays[0], compression=None)
+        array2 = focu.decode_numpy_array(array_bytes, writable=False)
+        self.assertTrue(np.array_equal(array2, arrays[0]))
+        self.assertFalse(array2.flags.writeable)
+
+        # Arrays serialized in the legacy format are still supported
+        legacy_bytes = focu.serialize_numpy_array(arrays[1])
+        self.assertFalse(focu.is_encoded_numpy_array(legacy_bytes))
+        array2 = focu.deserialize_numpy_array(legacy_bytes)
+        self.assertTrue(np.array_equal(array2, arrays[1]))
+
+        with self.assertRaises(ValueError):
+            focu.encode_numpy_array(arrays[0], compression="unsupported")
+
+    @drop_datasets
+    def test_array_field_legacy_format(self):
+        dataset = fo.Dataset()
+        sample = fo.Sample(
+            filepath="image.jpg",
+            vector=np.arange(5, dtype=float),
+            array=np.ones((2, 3)),
+        )
+        dataset.add_sample(sample)
+
+        # Simulate documents written by an older version of FiftyOne
+        dataset._sample_collection.update_one(
+            {"_id": sample._id},
+            {
+                "$set": {
+                    "vector": focu.serialize_numpy_array(np.arange(5.0)),
+                    "array": focu.serialize_numpy_array(np.zeros((2, 3))),
+                }
+            },
+        )
+        sample.reload()
+
+        self.assertTrue(np.array_equal(sample.vector, np.arange(5.0)))
+        self.assertTrue(np.array_equal(sample.array, np.zeros((2, 3))))
+
+        sample.array[0, 0] = 1
+        sample.save()
+        sample.reload()
+
+        self.assertEqual(sample.array[0, 0], 1)
+
     def test_sample_no_dataset(self):
         """This test only works if the samples do not have Classification or
         Detection fields because of the autogenerated ObjectIDs.
@@ -153,6 +232,96 @@ class SerializationTests(unittest.TestCase):
 
         self.assertDictEqual(s1.to_dict(), s2.to_dict())
 
+    def test_import_collection_streaming(self):
+        docs = [
+            {"_id": ObjectId(), "filepath": "image%d.jpg" % i, "value": i}
+            for i in range(10)
+        ]
+
+        with etau.TempDir() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "samples.json")
+            foo.export_collection(docs, json_path, key="samples")
+
+            # Use a small chunk size to exercise incremental decoding
+            with patch.object(foo.database, "_JSON_CHUNK_SIZE", 7):
+                _docs, num_docs = foo.import_collection(
+                    json_path, key="samples"
+                )
+
+                self.assertEqual(num_docs, len(docs))
+                self.assertNotIsInstance(_docs, list)
+                self.assertListEqual(list(_docs), docs)
+
+            # Exports that don't declare their number of documents
+            legacy_path = os.path.join(tmp_dir, "legacy.json")
+            etau.write_file(
+                json_util.dumps({"samples": docs}, indent=4), legacy_path
+            )
+
+            _docs, num_docs = foo.import_collection(legacy_path, key="samples")
+
+            self.assertIsNone(num_docs)
+            self.assertListEqual(list(_docs), docs)
+
+            _docs, num_docs = foo.import_collection(legacy_path, key="frames")
+
+            self.assertListEqual(list(_docs), [])
+
+
+class ImageCacheTests(unittest.TestCase):
+    def _test_image_cache(self, tmp_dir, cache_dir=None):
+        image_path = os.path.join(tmp_dir, "image.png")
+        img = np.random.randint(0, 255, size=(8, 6, 3), dtype=np.uint8)
+        etai.write(img, image_path)
+
+        image_cache = fouim.ImageCache(cache_dir=cache_dir)
+
+        img1 = image_cache.read(image_path)
+        self.assertTrue(np.array_equal(img1, etai.read(image_path)))
+        self.assertTrue(img1.flags.writeable)
+        self.assertEqual(len(image_cache), 1)
+
+        with patch.object(etai, "read") as read:
+            img2 = image_cache.read(image_path, copy=False)
+            read.assert_not_called()
+
+        self.assertTrue(np.array_equal(img1, img2))
+        self.assertFalse(img2.flags.writeable)
+
+        # Modified images are decoded again
+        etai.write(img[:4], image_path)
+        os.utime(image_path, ns=(0, 0))
+
+        img3 = image_cache.read(image_path)
+        self.assertEqual(img3.shape, (4, 6, 3))
+
+        image_cache.clear()
+        self.assertEqual(len(image_cache), 0)
+
+    def test_memory_cache(self):
+        with etau.TempDir() as tmp_dir:
+            self._test_image_cache(tmp_dir)
+
+    def test_disk_cache(self):
+        with etau.TempDir() as tmp_dir:
+            cache_dir = os.path.join(tmp_dir, "cache")
+            self._test_image_cache(tmp_dir, cache_dir=cache_dir)
+
+    def test_max_size(self):
+        with etau.TempDir() as tmp_dir:
+            img = np.zeros((10, 10, 3), dtype=np.uint8)
+            image_paths = []
+            for idx in range(3):
+                image_path = os.path.join(tmp_dir, "%d.png" % idx)
+                etai.write(img, image_path)
+                image_paths.append(image_path)
+
+            image_cache = fouim.ImageCache(max_size=2 * img.nbytes)
+            for image_path in image_paths:
+                image_cache.read(image_path)
+
+            self.assertEqual(len(image_cache), 2)
+
 
 class MediaTypeTests(unittest.TestCase):
     @drop_datasets
@@ -264,6 +433,181 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(config.id, orig_config.id)
 
 
+class LazyImportTests(unittest.TestCase):
+    def test_lazy_import(self):
+        code = "\n".join(
+            [
+                "import sys",
+                "import fiftyone as fo",
+                "import fiftyone.core.odm.database as food",
+                "assert food._client is None",
+                "assert 'fiftyone.core.plots' not in sys.modules",
+                "assert 'fiftyone.core.session' not in sys.modules",
+                "assert 'fiftyone.utils.eval.detection' not in sys.modules",
+                "assert 'launch_app' in dir(fo)",
+                "import fiftyone.core.plots as fop",
+                "assert fo.Plot is fop.Plot",
+                "fo.list_datasets()",
+                "assert food._client is not None",
+            ]
+        )
+
+        subprocess.check_call([sys.executable, "-c", code])
+
+        with self.assertRaises(AttributeError):
+            fo.this_attribute_does_not_exist
+
+
+class IoUTests(unittest.TestCase):
+    def _make_dataset(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image1.jpg",
+                    gt=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4]
+                            ),
+                            fo.Detection(
+                                label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4]
+                            ),
+                            fo.Detection(
+                                label="dog",
+                                bounding_box=[0.15, 0.1, 0.4, 0.4],
+                            ),
+                            fo.Detection(
+                                label="cat", bounding_box=[0.6, 0.6, 0.2, 0.2]
+                            ),
+                        ]
+                    ),
+                    pred=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat", bounding_box=[0.1, 0.1, 0.3, 0.4]
+                            ),
+                            fo.Detection(
+                                label="dog", bounding_box=[0.6, 0.6, 0.2, 0.1]
+                            ),
+                        ]
+                    ),
+                ),
+                fo.Sample(
+                    filepath="image2.jpg",
+                    gt=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat", bounding_box=[0.5, 0.5, 0.1, 0.1]
+                            ),
+                        ]
+                    ),
+                    pred=fo.Detections(),
+                ),
+                fo.Sample(filepath="image3.jpg"),
+            ]
+        )
+
+        return dataset
+
+    def test_compute_ious(self):
+        dets = self._make_dataset().first().gt.detections
+        ious = foui.compute_ious(dets, dets)
+
+        self.assertEqual(ious.shape, (4, 4))
+        self.assertTrue(np.allclose(ious, ious.T))
+        self.assertTrue(np.allclose(np.diag(ious), 1))
+        self.assertAlmostEqual(ious[0, 1], 1)
+        self.assertAlmostEqual(ious[0, 2], 0.35 * 0.4 / (0.45 * 0.4))
+        self.assertEqual(ious[0, 3], 0)
+
+        ious = foui.compute_ious(dets, dets, classwise=True)
+        self.assertEqual(ious[0, 2], 0)
+
+        iscrowd = lambda l: l.label == "dog"
+        ious = foui.compute_ious(dets[:2], dets[2:], iscrowd=iscrowd)
+        self.assertAlmostEqual(ious[0, 0], 0.35 * 0.4 / (0.4 * 0.4))
+
+    @drop_datasets
+    def test_find_duplicates(self):
+        dataset = self._make_dataset()
+
+        # A callable `iscrowd` uses the per-sample implementation
+        for method in ("simple", "greedy"):
+            for classwise in (False, True):
+                dup_ids = foui.find_duplicates(
+                    dataset,
+                    "gt",
+                    iou_thresh=0.5,
+                    method=method,
+                    classwise=classwise,
+                )
+                expected = foui.find_duplicates(
+                    dataset,
+                    "gt",
+                    iou_thresh=0.5,
+                    method=method,
+                    classwise=classwise,
+                    iscrowd=lambda l: False,
+                )
+                self.assertListEqual(list(dup_ids), list(expected))
+
+        gt_ids = dataset.values("gt.detections.id")[0]
+        dup_ids = foui.find_duplicates(dataset, "gt", iou_thresh=0.5)
+        self.assertListEqual(list(dup_ids), gt_ids[1:3])
+
+        dup_ids = foui.find_duplicates(
+            dataset, "gt", iou_thresh=0.5, classwise=True
+        )
+        self.assertListEqual(list(dup_ids), gt_ids[1:2])
+
+    @drop_datasets
+    def test_compute_max_ious(self):
+        dataset = self._make_dataset()
+
+        foui.compute_max_ious(
+            dataset, "gt", other_field="pred", iou_attr="iou", id_attr="iou_id"
+        )
+        foui.compute_max_ious(
+            dataset,
+            "gt",
+            other_field="pred",
+            iou_attr="iou2",
+            id_attr="iou_id2",
+            iscrowd=lambda l: False,
+        )
+
+        self.assertListEqual(
+            dataset.values("gt.detections.iou"),
+            dataset.values("gt.detections.iou2"),
+        )
+        self.assertListEqual(
+            dataset.values("gt.detections.iou_id"),
+            dataset.values("gt.detections.iou_id2"),
+        )
+        self.assertListEqual(
+            dataset.values("pred.detections.iou"),
+            dataset.values("pred.detections.iou2"),
+        )
+        self.assertListEqual(
+            dataset.values("pred.detections.iou_id"),
+            dataset.values("pred.detections.iou_id2"),
+        )
+
+        foui.compute_max_ious(dataset, "gt", classwise=True)
+
+        gt_ids = dataset.values("gt.detections.id")[0]
+        max_ious = dataset.values("gt.detections.max_iou")
+        self.assertAlmostEqual(max_ious[0][0], 1)
+        self.assertEqual(max_ious[0][2], 0)
+        self.assertIsNone(max_ious[1][0])
+
+        foui.compute_max_ious(dataset, "gt", id_attr="max_iou_id")
+        max_iou_ids = dataset.values("gt.detections.max_iou_id")
+        self.assertEqual(max_iou_ids[0][0], gt_ids[1])
+        self.assertEqual(max_iou_ids[0][1], gt_ids[0])
+
+
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
     unittest.main(verbosity=2)
@@ -6,13 +6,16 @@ FiftyOne video-related unit tests.
 |
 """
 from datetime import date, datetime
+import time
 
 from bson import ObjectId
 import numpy as np
 import unittest
+from unittest.mock import patch
 
 import fiftyone as fo
 from fiftyone import ViewField as F
+import fiftyone.core.video as fovi
 
 from decorators import drop_datasets
 
@@ -650,6 +653,43 @@ class VideoTests(unittest.TestCase):
         self.assertNotEqual(sample3.id, sample_id)
         self.assertNotEqual(frame3.id, frame_id)
 
+    @drop_datasets
+    def test_add_video_samples_batch(self):
+        samples = []
+        for i in range(10):
+            sample = fo.Sample(filepath="video%d.mp4" % i)
+            for fn in range(1, i + 2):
+                sample.frames[fn] = fo.Frame(index=i, frame_index=fn)
+
+            samples.append(sample)
+
+        dataset = fo.Dataset()
+        dataset.add_samples(samples)
+
+        self.assertEqual(dataset.count("frames"), 55)
+
+        for i, sample in enumerate(samples):
+            self.assertEqual(len(sample.frames), i + 1)
+            for fn, frame in sample.frames.items():
+                self.assertIsNotNone(frame.id)
+                self.assertTrue(frame.in_dataset)
+                self.assertEqual(frame.sample_id, sample.id)
+
+            sample.frames[1]["foo"] = "bar"
+            sample.save()
+
+        self.assertEqual(dataset.count_values("frames.foo")["bar"], 10)
+        self.assertEqual(
+            len(set(dataset.values("frames.id", unwind=True))), 55
+        )
+
+        sample = dataset.last()
+        self.assertListEqual(list(sample.frames.keys()), list(range(1, 11)))
+        self.assertListEqual(
+            [f["frame_index"] for f in sample.frames.values()],
+            list(range(1, 11)),
+        )
+
     @drop_datasets
     def test_save_frame_view(self):
         dataset = fo.Dataset()
@@ -2032,6 +2072,120 @@ class VideoTests(unittest.TestCase):
 
         self.assertEqual(len(frames), 2)
 
+    @drop_datasets
+    def test_to_frames_resume(self):
+        dataset = fo.Dataset()
+
+        samples = []
+        for i in range(1, 4):
+            sample = fo.Sample(
+                filepath="video%d.mp4" % i,
+                metadata=fo.VideoMetadata(total_frame_count=2),
+            )
+            sample.frames[1] = fo.Frame(hello="world")
+            samples.append(sample)
+
+        dataset.add_samples(samples)
+
+        commit_frames = fovi._commit_frames
+        partial_names = []
+
+        def interrupted_commit_frames(*args, **kwargs):
+            partial_names.append(args[6].name)
+            if len(partial_names) > 1:
+                raise RuntimeError("Interrupted")
+
+            commit_frames(*args, **kwargs)
+
+        with patch.object(fovi, "_FRAMES_BATCH_SIZE", 2):
+            with patch.object(
+                fovi, "_commit_frames", side_effect=interrupted_commit_frames
+            ):
+                with self.assertRaises(RuntimeError):
+                    dataset.to_frames(sample_frames="dynamic")
+
+            # The partial dataset is kept, with the first video committed
+            partial = fo.load_dataset(partial_names[0])
+            self.assertTrue(partial.persistent)
+            self.assertEqual(
+                partial.info[fovi._CHECKPOINT_KEY]["last_id"],
+                str(min(dataset.values("_id"))),
+            )
+
+            with patch.object(
+                fovi, "_commit_frames", wraps=commit_frames
+            ) as resumed_commit_frames:
+                frames = dataset.to_frames(sample_frames="dynamic")
+
+        # The partial dataset was reused, and only the remaining two videos
+        # were committed, plus the final (empty) commit
+        self.assertEqual(frames._dataset.name, partial_names[0])
+        self.assertEqual(resumed_commit_frames.call_count, 3)
+        self.assertFalse(frames._dataset.persistent)
+
+        self.assertEqual(len(frames), 6)
+        self.assertListEqual(frames.values("frame_number"), [1, 2, 1, 2, 1, 2])
+        self.assertEqual(frames.count("hello"), 3)
+        self.assertNotIn(fovi._CHECKPOINT_KEY, frames._dataset.info)
+
+    @drop_datasets
+    def test_to_frames_checkpoint_owner(self):
+        dataset = fo.Dataset()
+
+        samples = []
+        for i in range(1, 3):
+            sample = fo.Sample(
+                filepath="video%d.mp4" % i,
+                metadata=fo.VideoMetadata(total_frame_count=2),
+            )
+            samples.append(sample)
+
+        dataset.add_samples(samples)
+
+        commit_frames = fovi._commit_frames
+        partial_names = []
+
+        def interrupted_commit_frames(*args, **kwargs):
+            partial_names.append(args[6].name)
+            if len(partial_names) > 1:
+                raise RuntimeError("Interrupted")
+
+            commit_frames(*args, **kwargs)
+
+        with patch.object(fovi, "_FRAMES_BATCH_SIZE", 2):
+            with patch.object(
+                fovi, "_commit_frames", side_effect=interrupted_commit_frames
+            ):
+                with self.assertRaises(RuntimeError):
+                    dataset.to_frames(sample_frames="dynamic")
+
+        # Simulate a generation that is still running on another machine
+        partial = fo.load_dataset(partial_names[0])
+        owner = {
+            "hostname": "another-machine",
+            "pid": 1,
+            "token": "another-token",
+            "heartbeat": time.time(),
+        }
+        partial.info[fovi._CHECKPOINT_KEY]["owner"] = owner
+        partial.save()
+
+        frames = dataset.to_frames(sample_frames="dynamic")
+
+        self.assertNotEqual(frames._dataset.name, partial.name)
+        self.assertEqual(len(frames), 4)
+
+        # Once its lease expires, the partial dataset is resumed
+        owner["heartbeat"] -= fovi._CHECKPOINT_LEASE_TIMEOUT + 1
+        partial.info[fovi._CHECKPOINT_KEY]["owner"] = owner
+        partial.save()
+
+        frames = dataset.to_frames(sample_frames="dynamic")
+
+        self.assertEqual(frames._dataset.name, partial.name)
+        self.assertEqual(len(frames), 4)
+        self.assertNotIn(fovi._CHECKPOINT_KEY, frames._dataset.info)
+
     @drop_datasets
     def test_to_frames_filepaths(self):
         sample = fo.Sample(filepath="video.mp4")
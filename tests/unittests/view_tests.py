@@ -2435,6 +2435,63 @@ class ViewStageTests(unittest.TestCase):
         result = list(self.dataset.take(1))
         self.assertIs(len(result), 1)
 
+    def test_take_fast(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.png" % i) for i in range(20)]
+        )
+
+        view = dataset.take(5, seed=51, fast=True)
+
+        self.assertIn("_rand", dataset.list_indexes())
+        self.assertEqual(len(view), 5)
+        self.assertEqual(len(set(view.values("id"))), 5)
+
+        # Seeded takes are reproducible
+        view2 = dataset.take(5, seed=51, fast=True)
+        self.assertListEqual(view.values("id"), view2.values("id"))
+
+        # Wraps around the end of the random order
+        view = dataset.take(100, seed=51, fast=True)
+        self.assertEqual(len(view), 20)
+        self.assertEqual(len(set(view.values("id"))), 20)
+
+        # Respects previous stages
+        view = dataset.limit(10).take(8, fast=True)
+        self.assertEqual(len(view), 8)
+        self.assertTrue(
+            set(view.values("id")).issubset(dataset.limit(10).values("id"))
+        )
+
+    @drop_datasets
+    def test_take_fast_patches(self):
+        dataset = fo.Dataset()
+        dataset.add_sample(
+            fo.Sample(
+                filepath="image.png",
+                ground_truth=fo.Detections(
+                    detections=[
+                        fo.Detection(label=str(i), bounding_box=[0, 0, 1, 1])
+                        for i in range(50)
+                    ]
+                ),
+            )
+        )
+
+        patches = dataset.to_patches("ground_truth")
+
+        view = patches.take(5, seed=51, fast=True)
+        self.assertEqual(len(view), 5)
+        self.assertEqual(len(set(view.values("id"))), 5)
+
+        # Patches have `_rand` values in [0, 1), so different seeds must
+        # select different patches
+        selected = set()
+        for seed in range(10):
+            selected.update(patches.take(5, seed=seed, fast=True).values("id"))
+
+        self.assertGreater(len(selected), 5)
+
     def test_uuids(self):
         stage = fosg.Take(1)
         stage_dict = stage._serialize()